@@ -0,0 +1,81 @@
+"""Cross validation without refit on long series.
+
+Without refit the models are trained on the first window and applied
+to the following ones. `forward` filters the whole training data of
+every window, so the cost grows with the square of the number of
+windows. The ETS, CES, Theta and ARIMA models now keep their states
+from one window to the next and only filter the new observations.
+
+Both strategies run on the same fitted models:
+
+* `refilter`: `forward` on the training data of every window, which
+  is what cross validation did before.
+* `incremental`: the states are passed from one window to the next.
+"""
+import argparse
+from time import perf_counter
+
+import numpy as np
+import pandas as pd
+from statsforecast.models import ARIMA, AutoCES, AutoETS, AutoTheta
+from statsforecast.utils import generate_series
+
+
+def windows(y, h, n_windows):
+    for i_window in range(n_windows):
+        yield y[: y.size - h - (n_windows - 1 - i_window)]
+
+
+def refilter(model, y, h, n_windows):
+    for y_train in windows(y, h, n_windows):
+        model.forward(y=y_train, h=h)
+
+
+def incremental(model, y, h, n_windows):
+    mod = None
+    for y_train in windows(y, h, n_windows):
+        _, mod = model._forward_update(mod, y=y_train, h=h)
+
+
+def main(n_series, length, h, n_windows):
+    series = generate_series(
+        n_series, freq='D', min_length=length, max_length=length, seed=0
+    )
+    models = [
+        AutoETS(season_length=7, model='AAA'),
+        AutoCES(season_length=7),
+        AutoTheta(season_length=7),
+        ARIMA(order=(2, 1, 1), season_length=7, seasonal_order=(1, 0, 0)),
+    ]
+    rows = []
+    for model in models:
+        times = {'refilter': 0.0, 'incremental': 0.0}
+        for _, grp in series.groupby(level='unique_id', observed=True):
+            y = grp['y'].to_numpy(np.float64)
+            model.fit(y[: y.size - h - n_windows + 1])
+            # compile
+            refilter(model, y, h, 1)
+            incremental(model, y, h, 2)
+            for name, fn in [('refilter', refilter), ('incremental', incremental)]:
+                start = perf_counter()
+                fn(model, y, h, n_windows)
+                times[name] += perf_counter() - start
+        rows.append(
+            {
+                'model': repr(model),
+                'refilter (s)': times['refilter'],
+                'incremental (s)': times['incremental'],
+                'speedup': times['refilter'] / times['incremental'],
+            }
+        )
+    print(pd.DataFrame(rows).round(2).to_string(index=False))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--n_series', type=int, default=20)
+    parser.add_argument('--length', type=int, default=520)
+    parser.add_argument('--h', type=int, default=4)
+    parser.add_argument('--n_windows', type=int, default=52)
+    args = parser.parse_args()
+    main(args.n_series, args.length, args.h, args.n_windows)
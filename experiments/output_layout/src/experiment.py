@@ -0,0 +1,102 @@
+"""Overhead of `GroupedArray` on short series.
+
+Times `GroupedArray.forecast`, `GroupedArray.predict` and
+`GroupedArray.cross_validation` on a panel of short series with cheap
+models, and compares them with calling the models directly on every
+serie. The difference is the time spent by `GroupedArray` arranging
+the outputs of the models.
+"""
+import argparse
+from time import perf_counter
+
+import numpy as np
+from statsforecast.core import GroupedArray
+from statsforecast.models import (
+    ADIDA,
+    Naive,
+    SeasonalExponentialSmoothing,
+    SimpleExponentialSmoothing,
+)
+from statsforecast.utils import generate_series
+
+
+def best_of(fn, repeats):
+    times = []
+    for _ in range(repeats):
+        start = perf_counter()
+        fn()
+        times.append(perf_counter() - start)
+    return min(times)
+
+
+def models_forecast(ga, models, h):
+    for grp in ga:
+        for model in models:
+            model.forecast(y=grp[:, 0], h=h)
+
+
+def models_predict(ga, fm, h, level):
+    for i in range(len(ga)):
+        for model in fm[i]:
+            model.predict(h=h, level=level)
+
+
+def models_cross_validation(ga, models, h, test_size, level):
+    steps = range(-test_size, -h + 1)
+    for grp in ga:
+        for cutoff in steps:
+            y = grp[:cutoff, 0]
+            for model in models:
+                model.forecast(y=y, h=h, level=level)
+
+
+def main(n_series, h, repeats):
+    series = generate_series(n_series, min_length=20, max_length=40, seed=0)
+    ga = GroupedArray(
+        series[['y']].values.astype(np.float32),
+        np.append(0, series.groupby('unique_id', observed=True).size().cumsum()),
+    )
+    fcst_models = [
+        SimpleExponentialSmoothing(alpha=0.1),
+        SeasonalExponentialSmoothing(season_length=7, alpha=0.1),
+        ADIDA(),
+    ]
+    level_models = [Naive()]
+    fm = ga.fit(models=level_models)
+    level = (80, 95)
+    test_size = h + 2
+    cases = {
+        'forecast': (
+            lambda: ga.forecast(models=fcst_models, h=h),
+            lambda: models_forecast(ga, fcst_models, h),
+        ),
+        'predict': (
+            lambda: ga.predict(fm=fm, h=h, level=level),
+            lambda: models_predict(ga, fm, h, level),
+        ),
+        'cross_validation': (
+            lambda: ga.cross_validation(
+                models=level_models, h=h, test_size=test_size, level=level
+            ),
+            lambda: models_cross_validation(ga, level_models, h, test_size, level),
+        ),
+    }
+    print('| method | GroupedArray (s) | models only (s) | overhead |')
+    print('|:-------|-----------------:|----------------:|---------:|')
+    for name, (grouped, direct) in cases.items():
+        # compile the numba functions
+        grouped()
+        direct()
+        grouped_time = best_of(grouped, repeats)
+        direct_time = best_of(direct, repeats)
+        overhead = 1 - direct_time / grouped_time
+        print(f'| {name} | {grouped_time:.3f} | {direct_time:.3f} | {overhead:.0%} |')
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--n_series', type=int, default=2_000)
+    parser.add_argument('--h', type=int, default=7)
+    parser.add_argument('--repeats', type=int, default=3)
+    args = parser.parse_args()
+    main(args.n_series, args.h, args.repeats)
@@ -0,0 +1,90 @@
+"""Tail latency of the parallel scheduling on skewed panels.
+
+Times every serie once with a single process and then replays the
+schedules that `StatsForecast` would run with `n_jobs` workers:
+
+* `array_split`: the previous strategy, each worker gets the same
+  number of contiguous series.
+* `cost_aware`: contiguous chunks of similar number of samples sorted
+  from the most to the least expensive, pulled by the workers as they
+  become free.
+
+The makespan is the time at which the last worker finishes.
+"""
+import argparse
+import heapq
+from time import perf_counter
+
+import numpy as np
+import pandas as pd
+from statsforecast.core import GroupedArray, _chunk_bounds
+from statsforecast.models import AutoARIMA
+from statsforecast.utils import generate_series
+
+
+def skewed_panel(n_series, long_frac, seed):
+    n_long = max(int(n_series * long_frac), 1)
+    short = generate_series(
+        n_series - n_long, freq='D', min_length=30, max_length=60, seed=seed
+    )
+    long = generate_series(
+        n_long, freq='D', min_length=600, max_length=1_000, seed=seed
+    )
+    long.index = long.index.astype(int) + n_series - n_long
+    long.index.name = 'unique_id'
+    # long series share a prefix, so they end up next to each other
+    return pd.concat([long, short])
+
+
+def time_series(ga, model, h):
+    times = np.empty(len(ga))
+    for i, grp in enumerate(ga):
+        start = perf_counter()
+        model.forecast(y=grp[:, 0], h=h)
+        times[i] = perf_counter() - start
+    return times
+
+
+def array_split_makespan(times, n_jobs):
+    return max(chunk.sum() for chunk in np.array_split(times, n_jobs))
+
+
+def cost_aware_makespan(times, indptr, n_jobs):
+    workers = [0.0] * n_jobs
+    for start, end in _chunk_bounds(indptr, n_jobs):
+        free_at = heapq.heappop(workers)
+        heapq.heappush(workers, free_at + times[start:end].sum())
+    return max(workers)
+
+
+def main(n_series, long_frac, h, seed):
+    df = skewed_panel(n_series, long_frac, seed)
+    ga = GroupedArray(
+        df['y'].values.astype(np.float32)[:, None],
+        np.append(0, df.groupby('unique_id', sort=False).size().cumsum()),
+    )
+    times = time_series(ga, AutoARIMA(season_length=7), h)
+    rows = []
+    for n_jobs in [2, 4, 8, 16, 32]:
+        ideal = max(times.sum() / n_jobs, times.max())
+        static = array_split_makespan(times, n_jobs)
+        dynamic = cost_aware_makespan(times, ga.indptr, n_jobs)
+        rows.append({
+            'n_jobs': n_jobs,
+            'lower bound (s)': ideal,
+            'array_split (s)': static,
+            'cost_aware (s)': dynamic,
+            'speedup': static / dynamic,
+        })
+    print(f'{n_series:,} series, {long_frac:.0%} long, serial time: {times.sum():.1f}s')
+    print(pd.DataFrame(rows).round(2).to_string(index=False))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--n_series', type=int, default=1_000)
+    parser.add_argument('--long_frac', type=float, default=0.05)
+    parser.add_argument('--h', type=int, default=7)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+    main(args.n_series, args.long_frac, args.h, args.seed)
@@ -0,0 +1,183 @@
+"""Which models release the GIL.
+
+Threads only run in parallel while they're inside numba functions
+compiled with `nogil=True`, the rest of the time they take turns
+holding the GIL. This script forecasts a serie with every model and
+measures the share of the time spent inside the numba functions
+called from python, split by whether they release the GIL or not.
+
+The numba functions are replaced by timed wrappers after a first run
+has compiled them, the compiled functions that call each other keep
+calling the original ones so only the calls from python are timed.
+
+The share of the time that releases the GIL (`p`) bounds the speedup
+of `n` threads to `1 / ((1 - p) + p / n)`.
+"""
+import os
+
+# must be set before importing statsforecast
+os.environ["NUMBA_RELEASE_GIL"] = "true"
+
+import argparse
+import importlib
+from collections import defaultdict
+from contextlib import contextmanager
+from time import perf_counter
+
+import numpy as np
+import pandas as pd
+from numba.core.registry import CPUDispatcher
+from statsforecast.models import (
+    ADIDA,
+    ARCH,
+    ARIMA,
+    GARCH,
+    IMAPA,
+    MSTL,
+    TSB,
+    AutoARIMA,
+    AutoCES,
+    AutoETS,
+    AutoTheta,
+    CrostonClassic,
+    CrostonOptimized,
+    CrostonSBA,
+    HistoricAverage,
+    Holt,
+    HoltWinters,
+    Naive,
+    OptimizedTheta,
+    RandomWalkWithDrift,
+    SeasonalExponentialSmoothing,
+    SeasonalExponentialSmoothingOptimized,
+    SeasonalNaive,
+    SeasonalWindowAverage,
+    SimpleExponentialSmoothing,
+    SimpleExponentialSmoothingOptimized,
+    Theta,
+    WindowAverage,
+)
+from statsforecast.utils import AirPassengers
+
+MODULES = [
+    "statsforecast.arima",
+    "statsforecast.ces",
+    "statsforecast.ets",
+    "statsforecast.garch",
+    "statsforecast.models",
+    "statsforecast.mstl",
+    "statsforecast.theta",
+    "statsforecast.utils",
+]
+
+MODELS = [
+    AutoARIMA(season_length=12),
+    ARIMA(order=(1, 1, 1), season_length=12, seasonal_order=(0, 1, 1)),
+    AutoETS(season_length=12),
+    Holt(),
+    HoltWinters(season_length=12),
+    AutoCES(season_length=12),
+    AutoTheta(season_length=12),
+    Theta(season_length=12),
+    OptimizedTheta(season_length=12),
+    MSTL(season_length=12),
+    GARCH(),
+    ARCH(),
+    SimpleExponentialSmoothing(alpha=0.1),
+    SimpleExponentialSmoothingOptimized(),
+    SeasonalExponentialSmoothing(season_length=12, alpha=0.1),
+    SeasonalExponentialSmoothingOptimized(season_length=12),
+    HistoricAverage(),
+    Naive(),
+    RandomWalkWithDrift(),
+    SeasonalNaive(season_length=12),
+    WindowAverage(window_size=12),
+    SeasonalWindowAverage(season_length=12, window_size=2),
+    ADIDA(),
+    CrostonClassic(),
+    CrostonOptimized(),
+    CrostonSBA(),
+    IMAPA(),
+    TSB(alpha_d=0.2, alpha_p=0.2),
+]
+
+
+class Timer:
+    def __init__(self):
+        self.times = defaultdict(float)
+
+    def wrap(self, dispatcher):
+        nogil = dispatcher.targetoptions.get("nogil", False)
+        times = self.times
+
+        def timed(*args, **kwargs):
+            # some kernels receive others as arguments
+            args = [getattr(arg, "__wrapped__", arg) for arg in args]
+            kwargs = {k: getattr(v, "__wrapped__", v) for k, v in kwargs.items()}
+            start = perf_counter()
+            try:
+                return dispatcher(*args, **kwargs)
+            finally:
+                times[nogil] += perf_counter() - start
+
+        timed.__wrapped__ = dispatcher
+        return timed
+
+
+@contextmanager
+def timed_dispatchers(timer):
+    originals = []
+    for name in MODULES:
+        module = importlib.import_module(name)
+        for attr, value in list(vars(module).items()):
+            if isinstance(value, CPUDispatcher):
+                originals.append((module, attr, value))
+                setattr(module, attr, timer.wrap(value))
+    try:
+        yield
+    finally:
+        for module, attr, value in originals:
+            setattr(module, attr, value)
+
+
+def main(repeats):
+    y = AirPassengers.astype(np.float64)
+    h = 12
+    timer = Timer()
+    rows = []
+    for model in MODELS:
+        # compile all the numba functions before replacing them, the
+        # compiled functions resolve the globals when they're compiled
+        model.forecast(y=y, h=h)
+        timer.times.clear()
+        with timed_dispatchers(timer):
+            start = perf_counter()
+            for _ in range(repeats):
+                model.forecast(y=y, h=h)
+            total = perf_counter() - start
+        nogil = timer.times[True] / total
+        gil = timer.times[False] / total
+        rows.append(
+            {
+                "model": repr(model),
+                "time (ms)": 1_000 * total / repeats,
+                "numba nogil": nogil,
+                "numba with GIL": gil,
+                "python": 1 - nogil - gil,
+                "max speedup 8 threads": 1 / ((1 - nogil) + nogil / 8),
+            }
+        )
+    res = pd.DataFrame(rows).sort_values("numba nogil", ascending=False)
+    formatters = {
+        col: "{:.0%}".format for col in ["numba nogil", "numba with GIL", "python"]
+    }
+    formatters["time (ms)"] = "{:.2f}".format
+    formatters["max speedup 8 threads"] = "{:.2f}".format
+    print(res.to_string(index=False, formatters=formatters))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeats", type=int, default=20)
+    args = parser.parse_args()
+    main(args.repeats)
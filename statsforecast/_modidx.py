@@ -32,14 +32,29 @@ d = { 'settings': { 'branch': 'main',
                                                                                           'statsforecast/arima.py'),
                                      'statsforecast.arima.AutoARIMA.summary': ( 'src/arima.html#autoarima.summary',
                                                                                 'statsforecast/arima.py'),
+                                     'statsforecast.arima._arima_tpt': ('src/arima.html#_arima_tpt', 'statsforecast/arima.py'),
+                                     'statsforecast.arima._arima_ttpt': ('src/arima.html#_arima_ttpt', 'statsforecast/arima.py'),
+                                     'statsforecast.arima._getQ0_solve': ('src/arima.html#_getq0_solve', 'statsforecast/arima.py'),
                                      'statsforecast.arima._make_arima': ('src/arima.html#_make_arima', 'statsforecast/arima.py'),
+                                     'statsforecast.arima._search_arima_executor': ( 'src/arima.html#_search_arima_executor',
+                                                                                     'statsforecast/arima.py'),
+                                     'statsforecast.arima._search_arima_fit': ( 'src/arima.html#_search_arima_fit',
+                                                                                'statsforecast/arima.py'),
+                                     'statsforecast.arima._search_arima_orders': ( 'src/arima.html#_search_arima_orders',
+                                                                                   'statsforecast/arima.py'),
+                                     'statsforecast.arima._stepwise_neighbors': ( 'src/arima.html#_stepwise_neighbors',
+                                                                                  'statsforecast/arima.py'),
                                      'statsforecast.arima.arima': ('src/arima.html#arima', 'statsforecast/arima.py'),
                                      'statsforecast.arima.arima2': ('src/arima.html#arima2', 'statsforecast/arima.py'),
                                      'statsforecast.arima.arima_css': ('src/arima.html#arima_css', 'statsforecast/arima.py'),
+                                     'statsforecast.arima.arima_css_grad': ('src/arima.html#arima_css_grad', 'statsforecast/arima.py'),
                                      'statsforecast.arima.arima_gradtrans': ('src/arima.html#arima_gradtrans', 'statsforecast/arima.py'),
                                      'statsforecast.arima.arima_like': ('src/arima.html#arima_like', 'statsforecast/arima.py'),
+                                     'statsforecast.arima.arima_like_grad': ('src/arima.html#arima_like_grad', 'statsforecast/arima.py'),
                                      'statsforecast.arima.arima_string': ('src/arima.html#arima_string', 'statsforecast/arima.py'),
                                      'statsforecast.arima.arima_transpar': ('src/arima.html#arima_transpar', 'statsforecast/arima.py'),
+                                     'statsforecast.arima.arima_transpar_grad': ( 'src/arima.html#arima_transpar_grad',
+                                                                                  'statsforecast/arima.py'),
                                      'statsforecast.arima.arima_undopars': ('src/arima.html#arima_undopars', 'statsforecast/arima.py'),
                                      'statsforecast.arima.auto_arima_f': ('src/arima.html#auto_arima_f', 'statsforecast/arima.py'),
                                      'statsforecast.arima.change_drift_name': ( 'src/arima.html#change_drift_name',
@@ -56,7 +71,7 @@ d = { 'settings': { 'branch': 'main',
                                      'statsforecast.arima.forecast_arima': ('src/arima.html#forecast_arima', 'statsforecast/arima.py'),
                                      'statsforecast.arima.forward_arima': ('src/arima.html#forward_arima', 'statsforecast/arima.py'),
                                      'statsforecast.arima.getQ0': ('src/arima.html#getq0', 'statsforecast/arima.py'),
-                                     'statsforecast.arima.inclu2': ('src/arima.html#inclu2', 'statsforecast/arima.py'),
+                                     'statsforecast.arima.getQ0_grad': ('src/arima.html#getq0_grad', 'statsforecast/arima.py'),
                                      'statsforecast.arima.invpartrans': ('src/arima.html#invpartrans', 'statsforecast/arima.py'),
                                      'statsforecast.arima.is_constant': ('src/arima.html#is_constant', 'statsforecast/arima.py'),
                                      'statsforecast.arima.kalman_forecast': ('src/arima.html#kalman_forecast', 'statsforecast/arima.py'),
@@ -66,18 +81,21 @@ d = { 'settings': { 'branch': 'main',
                                      'statsforecast.arima.newmodel': ('src/arima.html#newmodel', 'statsforecast/arima.py'),
                                      'statsforecast.arima.nsdiffs': ('src/arima.html#nsdiffs', 'statsforecast/arima.py'),
                                      'statsforecast.arima.partrans': ('src/arima.html#partrans', 'statsforecast/arima.py'),
+                                     'statsforecast.arima.partrans_grad': ('src/arima.html#partrans_grad', 'statsforecast/arima.py'),
                                      'statsforecast.arima.predict_arima': ('src/arima.html#predict_arima', 'statsforecast/arima.py'),
                                      'statsforecast.arima.print_statsforecast_ARIMA': ( 'src/arima.html#print_statsforecast_arima',
                                                                                         'statsforecast/arima.py'),
                                      'statsforecast.arima.search_arima': ('src/arima.html#search_arima', 'statsforecast/arima.py'),
                                      'statsforecast.arima.seas_heuristic': ('src/arima.html#seas_heuristic', 'statsforecast/arima.py'),
-                                     'statsforecast.arima.tsconv': ('src/arima.html#tsconv', 'statsforecast/arima.py')},
+                                     'statsforecast.arima.tsconv': ('src/arima.html#tsconv', 'statsforecast/arima.py'),
+                                     'statsforecast.arima.update_arima': ('src/arima.html#update_arima', 'statsforecast/arima.py')},
             'statsforecast.ces': { 'statsforecast.ces._simulate_pred_intervals': ( 'src/ces.html#_simulate_pred_intervals',
                                                                                    'statsforecast/ces.py'),
                                    'statsforecast.ces.auto_ces': ('src/ces.html#auto_ces', 'statsforecast/ces.py'),
                                    'statsforecast.ces.ces_target_fn': ('src/ces.html#ces_target_fn', 'statsforecast/ces.py'),
                                    'statsforecast.ces.cescalc': ('src/ces.html#cescalc', 'statsforecast/ces.py'),
                                    'statsforecast.ces.cesfcst': ('src/ces.html#cesfcst', 'statsforecast/ces.py'),
+                                   'statsforecast.ces.cesfilter': ('src/ces.html#cesfilter', 'statsforecast/ces.py'),
                                    'statsforecast.ces.cesforecast': ('src/ces.html#cesforecast', 'statsforecast/ces.py'),
                                    'statsforecast.ces.cesmodel': ('src/ces.html#cesmodel', 'statsforecast/ces.py'),
                                    'statsforecast.ces.cesupdate': ('src/ces.html#cesupdate', 'statsforecast/ces.py'),
@@ -89,7 +107,8 @@ d = { 'settings': { 'branch': 'main',
                                                                                  'statsforecast/ces.py'),
                                    'statsforecast.ces.pegelsfcast_C': ('src/ces.html#pegelsfcast_c', 'statsforecast/ces.py'),
                                    'statsforecast.ces.pegelsresid_ces': ('src/ces.html#pegelsresid_ces', 'statsforecast/ces.py'),
-                                   'statsforecast.ces.switch_ces': ('src/ces.html#switch_ces', 'statsforecast/ces.py')},
+                                   'statsforecast.ces.switch_ces': ('src/ces.html#switch_ces', 'statsforecast/ces.py'),
+                                   'statsforecast.ces.update_ces': ('src/ces.html#update_ces', 'statsforecast/ces.py')},
             'statsforecast.core': { 'statsforecast.core.DataFrameProcessing': ( 'src/core/core.html#dataframeprocessing',
                                                                                 'statsforecast/core.py'),
                                     'statsforecast.core.DataFrameProcessing.__call__': ( 'src/core/core.html#dataframeprocessing.__call__',
@@ -106,6 +125,8 @@ d = { 'settings': { 'branch': 'main',
                                                                                                     'statsforecast/core.py'),
                                     'statsforecast.core.DataFrameProcessing.grouped_array': ( 'src/core/core.html#dataframeprocessing.grouped_array',
                                                                                               'statsforecast/core.py'),
+                                    'statsforecast.core.DataFrameProcessing.index': ( 'src/core/core.html#dataframeprocessing.index',
+                                                                                      'statsforecast/core.py'),
                                     'statsforecast.core.GroupedArray': ('src/core/core.html#groupedarray', 'statsforecast/core.py'),
                                     'statsforecast.core.GroupedArray.__eq__': ( 'src/core/core.html#groupedarray.__eq__',
                                                                                 'statsforecast/core.py'),
@@ -117,6 +138,8 @@ d = { 'settings': { 'branch': 'main',
                                                                                  'statsforecast/core.py'),
                                     'statsforecast.core.GroupedArray.__repr__': ( 'src/core/core.html#groupedarray.__repr__',
                                                                                   'statsforecast/core.py'),
+                                    'statsforecast.core.GroupedArray._forecast_panel': ( 'src/core/core.html#groupedarray._forecast_panel',
+                                                                                         'statsforecast/core.py'),
                                     'statsforecast.core.GroupedArray._get_cols': ( 'src/core/core.html#groupedarray._get_cols',
                                                                                    'statsforecast/core.py'),
                                     'statsforecast.core.GroupedArray._output_fcst': ( 'src/core/core.html#groupedarray._output_fcst',
@@ -139,6 +162,21 @@ d = { 'settings': { 'branch': 'main',
                                                                                              'statsforecast/core.py'),
                                     'statsforecast.core.ParallelBackend.forecast': ( 'src/core/core.html#parallelbackend.forecast',
                                                                                      'statsforecast/core.py'),
+                                    'statsforecast.core.PreparedPanel': ('src/core/core.html#preparedpanel', 'statsforecast/core.py'),
+                                    'statsforecast.core.PreparedPanel.__getstate__': ( 'src/core/core.html#preparedpanel.__getstate__',
+                                                                                       'statsforecast/core.py'),
+                                    'statsforecast.core.PreparedPanel.__init__': ( 'src/core/core.html#preparedpanel.__init__',
+                                                                                   'statsforecast/core.py'),
+                                    'statsforecast.core.PreparedPanel.__len__': ( 'src/core/core.html#preparedpanel.__len__',
+                                                                                  'statsforecast/core.py'),
+                                    'statsforecast.core.PreparedPanel.__repr__': ( 'src/core/core.html#preparedpanel.__repr__',
+                                                                                   'statsforecast/core.py'),
+                                    'statsforecast.core.PreparedPanel.__setstate__': ( 'src/core/core.html#preparedpanel.__setstate__',
+                                                                                       'statsforecast/core.py'),
+                                    'statsforecast.core.PreparedPanel.index': ( 'src/core/core.html#preparedpanel.index',
+                                                                                'statsforecast/core.py'),
+                                    'statsforecast.core.PreparedPanel.rows': ( 'src/core/core.html#preparedpanel.rows',
+                                                                               'statsforecast/core.py'),
                                     'statsforecast.core.StatsForecast': ('src/core/core.html#statsforecast', 'statsforecast/core.py'),
                                     'statsforecast.core.StatsForecast._is_native': ( 'src/core/core.html#statsforecast._is_native',
                                                                                      'statsforecast/core.py'),
@@ -146,53 +184,184 @@ d = { 'settings': { 'branch': 'main',
                                                                                            'statsforecast/core.py'),
                                     'statsforecast.core.StatsForecast.forecast': ( 'src/core/core.html#statsforecast.forecast',
                                                                                    'statsforecast/core.py'),
+                                    'statsforecast.core._OutputLayout': ('src/core/core.html#_outputlayout', 'statsforecast/core.py'),
+                                    'statsforecast.core._OutputLayout.__init__': ( 'src/core/core.html#_outputlayout.__init__',
+                                                                                   'statsforecast/core.py'),
+                                    'statsforecast.core._OutputLayout.all_cols': ( 'src/core/core.html#_outputlayout.all_cols',
+                                                                                   'statsforecast/core.py'),
+                                    'statsforecast.core._OutputLayout.compile': ( 'src/core/core.html#_outputlayout.compile',
+                                                                                  'statsforecast/core.py'),
+                                    'statsforecast.core._OutputLayout.write': ( 'src/core/core.html#_outputlayout.write',
+                                                                                'statsforecast/core.py'),
+                                    'statsforecast.core._SharedArrays': ('src/core/core.html#_sharedarrays', 'statsforecast/core.py'),
+                                    'statsforecast.core._SharedArrays.__enter__': ( 'src/core/core.html#_sharedarrays.__enter__',
+                                                                                    'statsforecast/core.py'),
+                                    'statsforecast.core._SharedArrays.__exit__': ( 'src/core/core.html#_sharedarrays.__exit__',
+                                                                                   'statsforecast/core.py'),
+                                    'statsforecast.core._SharedArrays.__init__': ( 'src/core/core.html#_sharedarrays.__init__',
+                                                                                   'statsforecast/core.py'),
+                                    'statsforecast.core._SharedArrays._allocate': ( 'src/core/core.html#_sharedarrays._allocate',
+                                                                                    'statsforecast/core.py'),
+                                    'statsforecast.core._SharedArrays.full': ( 'src/core/core.html#_sharedarrays.full',
+                                                                               'statsforecast/core.py'),
+                                    'statsforecast.core._SharedArrays.read': ( 'src/core/core.html#_sharedarrays.read',
+                                                                               'statsforecast/core.py'),
+                                    'statsforecast.core._SharedArrays.share': ( 'src/core/core.html#_sharedarrays.share',
+                                                                                'statsforecast/core.py'),
                                     'statsforecast.core._StatsForecast': ('src/core/core.html#_statsforecast', 'statsforecast/core.py'),
+                                    'statsforecast.core._StatsForecast.__enter__': ( 'src/core/core.html#_statsforecast.__enter__',
+                                                                                     'statsforecast/core.py'),
+                                    'statsforecast.core._StatsForecast.__exit__': ( 'src/core/core.html#_statsforecast.__exit__',
+                                                                                    'statsforecast/core.py'),
+                                    'statsforecast.core._StatsForecast.__getstate__': ( 'src/core/core.html#_statsforecast.__getstate__',
+                                                                                        'statsforecast/core.py'),
                                     'statsforecast.core._StatsForecast.__init__': ( 'src/core/core.html#_statsforecast.__init__',
                                                                                     'statsforecast/core.py'),
                                     'statsforecast.core._StatsForecast.__repr__': ( 'src/core/core.html#_statsforecast.__repr__',
                                                                                     'statsforecast/core.py'),
+                                    'statsforecast.core._StatsForecast._chunks_pool': ( 'src/core/core.html#_statsforecast._chunks_pool',
+                                                                                        'statsforecast/core.py'),
+                                    'statsforecast.core._StatsForecast._chunks_to_df': ( 'src/core/core.html#_statsforecast._chunks_to_df',
+                                                                                         'statsforecast/core.py'),
                                     'statsforecast.core._StatsForecast._cross_validation_parallel': ( 'src/core/core.html#_statsforecast._cross_validation_parallel',
                                                                                                       'statsforecast/core.py'),
+                                    'statsforecast.core._StatsForecast._cross_validation_parallel_shared': ( 'src/core/core.html#_statsforecast._cross_validation_parallel_shared',
+                                                                                                             'statsforecast/core.py'),
+                                    'statsforecast.core._StatsForecast._cross_validation_parallel_windows': ( 'src/core/core.html#_statsforecast._cross_validation_parallel_windows',
+                                                                                                              'statsforecast/core.py'),
+                                    'statsforecast.core._StatsForecast._executor': ( 'src/core/core.html#_statsforecast._executor',
+                                                                                     'statsforecast/core.py'),
                                     'statsforecast.core._StatsForecast._fit_parallel': ( 'src/core/core.html#_statsforecast._fit_parallel',
                                                                                          'statsforecast/core.py'),
+                                    'statsforecast.core._StatsForecast._fit_parallel_shared': ( 'src/core/core.html#_statsforecast._fit_parallel_shared',
+                                                                                                'statsforecast/core.py'),
                                     'statsforecast.core._StatsForecast._fit_predict_parallel': ( 'src/core/core.html#_statsforecast._fit_predict_parallel',
                                                                                                  'statsforecast/core.py'),
+                                    'statsforecast.core._StatsForecast._fitted_index': ( 'src/core/core.html#_statsforecast._fitted_index',
+                                                                                         'statsforecast/core.py'),
+                                    'statsforecast.core._StatsForecast._forecast_chunks': ( 'src/core/core.html#_statsforecast._forecast_chunks',
+                                                                                            'statsforecast/core.py'),
+                                    'statsforecast.core._StatsForecast._forecast_chunks_parallel': ( 'src/core/core.html#_statsforecast._forecast_chunks_parallel',
+                                                                                                     'statsforecast/core.py'),
                                     'statsforecast.core._StatsForecast._forecast_parallel': ( 'src/core/core.html#_statsforecast._forecast_parallel',
                                                                                               'statsforecast/core.py'),
+                                    'statsforecast.core._StatsForecast._forecast_parallel_shared': ( 'src/core/core.html#_statsforecast._forecast_parallel_shared',
+                                                                                                     'statsforecast/core.py'),
+                                    'statsforecast.core._StatsForecast._get_chunk': ( 'src/core/core.html#_statsforecast._get_chunk',
+                                                                                      'statsforecast/core.py'),
                                     'statsforecast.core._StatsForecast._get_gas_Xs': ( 'src/core/core.html#_statsforecast._get_gas_xs',
                                                                                        'statsforecast/core.py'),
                                     'statsforecast.core._StatsForecast._get_pool': ( 'src/core/core.html#_statsforecast._get_pool',
                                                                                      'statsforecast/core.py'),
+                                    'statsforecast.core._StatsForecast._input_uids': ( 'src/core/core.html#_statsforecast._input_uids',
+                                                                                       'statsforecast/core.py'),
                                     'statsforecast.core._StatsForecast._make_future_df': ( 'src/core/core.html#_statsforecast._make_future_df',
                                                                                            'statsforecast/core.py'),
                                     'statsforecast.core._StatsForecast._parse_X_level': ( 'src/core/core.html#_statsforecast._parse_x_level',
                                                                                           'statsforecast/core.py'),
+                                    'statsforecast.core._StatsForecast._pl_unique_id': ( 'src/core/core.html#_statsforecast._pl_unique_id',
+                                                                                         'statsforecast/core.py'),
                                     'statsforecast.core._StatsForecast._predict_parallel': ( 'src/core/core.html#_statsforecast._predict_parallel',
                                                                                              'statsforecast/core.py'),
                                     'statsforecast.core._StatsForecast._prepare_fit': ( 'src/core/core.html#_statsforecast._prepare_fit',
                                                                                         'statsforecast/core.py'),
+                                    'statsforecast.core._StatsForecast._rows_codes': ( 'src/core/core.html#_statsforecast._rows_codes',
+                                                                                       'statsforecast/core.py'),
+                                    'statsforecast.core._StatsForecast._run_cross_validation': ( 'src/core/core.html#_statsforecast._run_cross_validation',
+                                                                                                 'statsforecast/core.py'),
+                                    'statsforecast.core._StatsForecast._run_forecast': ( 'src/core/core.html#_statsforecast._run_forecast',
+                                                                                         'statsforecast/core.py'),
+                                    'statsforecast.core._StatsForecast._run_lazy': ( 'src/core/core.html#_statsforecast._run_lazy',
+                                                                                     'statsforecast/core.py'),
+                                    'statsforecast.core._StatsForecast._run_parquet': ( 'src/core/core.html#_statsforecast._run_parquet',
+                                                                                        'statsforecast/core.py'),
+                                    'statsforecast.core._StatsForecast._set_executor': ( 'src/core/core.html#_statsforecast._set_executor',
+                                                                                         'statsforecast/core.py'),
                                     'statsforecast.core._StatsForecast._set_prediction_intervals': ( 'src/core/core.html#_statsforecast._set_prediction_intervals',
                                                                                                      'statsforecast/core.py'),
+                                    'statsforecast.core._StatsForecast._use_shared': ( 'src/core/core.html#_statsforecast._use_shared',
+                                                                                       'statsforecast/core.py'),
+                                    'statsforecast.core._StatsForecast.close_pool': ( 'src/core/core.html#_statsforecast.close_pool',
+                                                                                      'statsforecast/core.py'),
                                     'statsforecast.core._StatsForecast.cross_validation': ( 'src/core/core.html#_statsforecast.cross_validation',
                                                                                             'statsforecast/core.py'),
+                                    'statsforecast.core._StatsForecast.cross_validation_arrays': ( 'src/core/core.html#_statsforecast.cross_validation_arrays',
+                                                                                                   'statsforecast/core.py'),
                                     'statsforecast.core._StatsForecast.cross_validation_fitted_values': ( 'src/core/core.html#_statsforecast.cross_validation_fitted_values',
                                                                                                           'statsforecast/core.py'),
+                                    'statsforecast.core._StatsForecast.cross_validation_parquet': ( 'src/core/core.html#_statsforecast.cross_validation_parquet',
+                                                                                                    'statsforecast/core.py'),
                                     'statsforecast.core._StatsForecast.fit': ( 'src/core/core.html#_statsforecast.fit',
                                                                                'statsforecast/core.py'),
                                     'statsforecast.core._StatsForecast.fit_predict': ( 'src/core/core.html#_statsforecast.fit_predict',
                                                                                        'statsforecast/core.py'),
                                     'statsforecast.core._StatsForecast.forecast': ( 'src/core/core.html#_statsforecast.forecast',
                                                                                     'statsforecast/core.py'),
+                                    'statsforecast.core._StatsForecast.forecast_arrays': ( 'src/core/core.html#_statsforecast.forecast_arrays',
+                                                                                           'statsforecast/core.py'),
                                     'statsforecast.core._StatsForecast.forecast_fitted_values': ( 'src/core/core.html#_statsforecast.forecast_fitted_values',
                                                                                                   'statsforecast/core.py'),
+                                    'statsforecast.core._StatsForecast.forecast_iter': ( 'src/core/core.html#_statsforecast.forecast_iter',
+                                                                                         'statsforecast/core.py'),
+                                    'statsforecast.core._StatsForecast.forecast_parquet': ( 'src/core/core.html#_statsforecast.forecast_parquet',
+                                                                                            'statsforecast/core.py'),
                                     'statsforecast.core._StatsForecast.plot': ( 'src/core/core.html#_statsforecast.plot',
                                                                                 'statsforecast/core.py'),
                                     'statsforecast.core._StatsForecast.predict': ( 'src/core/core.html#_statsforecast.predict',
                                                                                    'statsforecast/core.py'),
+                                    'statsforecast.core._StatsForecast.prepare': ( 'src/core/core.html#_statsforecast.prepare',
+                                                                                   'statsforecast/core.py'),
+                                    'statsforecast.core._StatsForecast.start_pool': ( 'src/core/core.html#_statsforecast.start_pool',
+                                                                                      'statsforecast/core.py'),
+                                    'statsforecast.core._attach': ('src/core/core.html#_attach', 'statsforecast/core.py'),
+                                    'statsforecast.core._chunk_bounds': ('src/core/core.html#_chunk_bounds', 'statsforecast/core.py'),
+                                    'statsforecast.core._columns_dict': ('src/core/core.html#_columns_dict', 'statsforecast/core.py'),
+                                    'statsforecast.core._cross_validation_shared_chunk': ( 'src/core/core.html#_cross_validation_shared_chunk',
+                                                                                           'statsforecast/core.py'),
+                                    'statsforecast.core._cross_validation_shared_windows': ( 'src/core/core.html#_cross_validation_shared_windows',
+                                                                                             'statsforecast/core.py'),
                                     'statsforecast.core._cv_dates': ('src/core/core.html#_cv_dates', 'statsforecast/core.py'),
+                                    'statsforecast.core._cv_fitted_offsets': ( 'src/core/core.html#_cv_fitted_offsets',
+                                                                               'statsforecast/core.py'),
+                                    'statsforecast.core._cv_fitted_spans': ('src/core/core.html#_cv_fitted_spans', 'statsforecast/core.py'),
+                                    'statsforecast.core._cv_fitted_windows': ( 'src/core/core.html#_cv_fitted_windows',
+                                                                               'statsforecast/core.py'),
+                                    'statsforecast.core._cv_grid': ('src/core/core.html#_cv_grid', 'statsforecast/core.py'),
+                                    'statsforecast.core._cv_n_windows': ('src/core/core.html#_cv_n_windows', 'statsforecast/core.py'),
+                                    'statsforecast.core._cv_window_bounds': ( 'src/core/core.html#_cv_window_bounds',
+                                                                              'statsforecast/core.py'),
+                                    'statsforecast.core._cv_windows_serie': ( 'src/core/core.html#_cv_windows_serie',
+                                                                              'statsforecast/core.py'),
+                                    'statsforecast.core._fit_shared_chunk': ( 'src/core/core.html#_fit_shared_chunk',
+                                                                              'statsforecast/core.py'),
+                                    'statsforecast.core._forecast_shared_chunk': ( 'src/core/core.html#_forecast_shared_chunk',
+                                                                                   'statsforecast/core.py'),
                                     'statsforecast.core._get_n_jobs': ('src/core/core.html#_get_n_jobs', 'statsforecast/core.py'),
+                                    'statsforecast.core._group_starts': ('src/core/core.html#_group_starts', 'statsforecast/core.py'),
+                                    'statsforecast.core._grouped_array_view': ( 'src/core/core.html#_grouped_array_view',
+                                                                                'statsforecast/core.py'),
+                                    'statsforecast.core._has_level': ('src/core/core.html#_has_level', 'statsforecast/core.py'),
+                                    'statsforecast.core._is_sorted': ('src/core/core.html#_is_sorted', 'statsforecast/core.py'),
+                                    'statsforecast.core._lazy_chunks': ('src/core/core.html#_lazy_chunks', 'statsforecast/core.py'),
+                                    'statsforecast.core._panel_from_arrays': ( 'src/core/core.html#_panel_from_arrays',
+                                                                               'statsforecast/core.py'),
                                     'statsforecast.core._parse_ds_type': ('src/core/core.html#_parse_ds_type', 'statsforecast/core.py'),
-                                    'statsforecast.core.make_backend': ('src/core/core.html#make_backend', 'statsforecast/core.py')},
+                                    'statsforecast.core._pl_to_numpy': ('src/core/core.html#_pl_to_numpy', 'statsforecast/core.py'),
+                                    'statsforecast.core._prepare_panel': ('src/core/core.html#_prepare_panel', 'statsforecast/core.py'),
+                                    'statsforecast.core._read_panel': ('src/core/core.html#_read_panel', 'statsforecast/core.py'),
+                                    'statsforecast.core._read_panel_index': ( 'src/core/core.html#_read_panel_index',
+                                                                              'statsforecast/core.py'),
+                                    'statsforecast.core._read_panel_rows': ('src/core/core.html#_read_panel_rows', 'statsforecast/core.py'),
+                                    'statsforecast.core._read_parquet_chunks': ( 'src/core/core.html#_read_parquet_chunks',
+                                                                                 'statsforecast/core.py'),
+                                    'statsforecast.core._run_on_shared': ('src/core/core.html#_run_on_shared', 'statsforecast/core.py'),
+                                    'statsforecast.core._shift_dates': ('src/core/core.html#_shift_dates', 'statsforecast/core.py'),
+                                    'statsforecast.core._sort_chunks': ('src/core/core.html#_sort_chunks', 'statsforecast/core.py'),
+                                    'statsforecast.core._sort_order': ('src/core/core.html#_sort_order', 'statsforecast/core.py'),
+                                    'statsforecast.core._tail_start': ('src/core/core.html#_tail_start', 'statsforecast/core.py'),
+                                    'statsforecast.core._warm_worker': ('src/core/core.html#_warm_worker', 'statsforecast/core.py'),
+                                    'statsforecast.core.make_backend': ('src/core/core.html#make_backend', 'statsforecast/core.py'),
+                                    'statsforecast.core.write_panel': ('src/core/core.html#write_panel', 'statsforecast/core.py')},
             'statsforecast.distributed.fugue': { 'statsforecast.distributed.fugue.FugueBackend': ( 'src/core/distributed.fugue.html#fuguebackend',
                                                                                                    'statsforecast/distributed/fugue.py'),
                                                  'statsforecast.distributed.fugue.FugueBackend.__getstate__': ( 'src/core/distributed.fugue.html#fuguebackend.__getstate__',
@@ -255,7 +424,8 @@ d = { 'settings': { 'branch': 'main',
                                    'statsforecast.ets.restrict_to_bounds': ('src/ets.html#restrict_to_bounds', 'statsforecast/ets.py'),
                                    'statsforecast.ets.sinpi': ('src/ets.html#sinpi', 'statsforecast/ets.py'),
                                    'statsforecast.ets.switch': ('src/ets.html#switch', 'statsforecast/ets.py'),
-                                   'statsforecast.ets.update': ('src/ets.html#update', 'statsforecast/ets.py')},
+                                   'statsforecast.ets.update': ('src/ets.html#update', 'statsforecast/ets.py'),
+                                   'statsforecast.ets.update_ets': ('src/ets.html#update_ets', 'statsforecast/ets.py')},
             'statsforecast.garch': { 'statsforecast.garch.garch_cons': ('src/garch.html#garch_cons', 'statsforecast/garch.py'),
                                      'statsforecast.garch.garch_forecast': ('src/garch.html#garch_forecast', 'statsforecast/garch.py'),
                                      'statsforecast.garch.garch_loglik': ('src/garch.html#garch_loglik', 'statsforecast/garch.py'),
@@ -285,6 +455,8 @@ d = { 'settings': { 'branch': 'main',
                                                                                'statsforecast/models.py'),
                                       'statsforecast.models.ARIMA.__repr__': ( 'src/core/models.html#arima.__repr__',
                                                                                'statsforecast/models.py'),
+                                      'statsforecast.models.ARIMA._forward_update': ( 'src/core/models.html#arima._forward_update',
+                                                                                      'statsforecast/models.py'),
                                       'statsforecast.models.ARIMA.fit': ('src/core/models.html#arima.fit', 'statsforecast/models.py'),
                                       'statsforecast.models.ARIMA.forecast': ( 'src/core/models.html#arima.forecast',
                                                                                'statsforecast/models.py'),
@@ -299,6 +471,8 @@ d = { 'settings': { 'branch': 'main',
                                                                                    'statsforecast/models.py'),
                                       'statsforecast.models.AutoARIMA.__repr__': ( 'src/core/models.html#autoarima.__repr__',
                                                                                    'statsforecast/models.py'),
+                                      'statsforecast.models.AutoARIMA._forward_update': ( 'src/core/models.html#autoarima._forward_update',
+                                                                                          'statsforecast/models.py'),
                                       'statsforecast.models.AutoARIMA.fit': ( 'src/core/models.html#autoarima.fit',
                                                                               'statsforecast/models.py'),
                                       'statsforecast.models.AutoARIMA.forecast': ( 'src/core/models.html#autoarima.forecast',
@@ -314,6 +488,8 @@ d = { 'settings': { 'branch': 'main',
                                                                                  'statsforecast/models.py'),
                                       'statsforecast.models.AutoCES.__repr__': ( 'src/core/models.html#autoces.__repr__',
                                                                                  'statsforecast/models.py'),
+                                      'statsforecast.models.AutoCES._forward_update': ( 'src/core/models.html#autoces._forward_update',
+                                                                                        'statsforecast/models.py'),
                                       'statsforecast.models.AutoCES.fit': ('src/core/models.html#autoces.fit', 'statsforecast/models.py'),
                                       'statsforecast.models.AutoCES.forecast': ( 'src/core/models.html#autoces.forecast',
                                                                                  'statsforecast/models.py'),
@@ -328,6 +504,8 @@ d = { 'settings': { 'branch': 'main',
                                                                                  'statsforecast/models.py'),
                                       'statsforecast.models.AutoETS.__repr__': ( 'src/core/models.html#autoets.__repr__',
                                                                                  'statsforecast/models.py'),
+                                      'statsforecast.models.AutoETS._forward_update': ( 'src/core/models.html#autoets._forward_update',
+                                                                                        'statsforecast/models.py'),
                                       'statsforecast.models.AutoETS.fit': ('src/core/models.html#autoets.fit', 'statsforecast/models.py'),
                                       'statsforecast.models.AutoETS.forecast': ( 'src/core/models.html#autoets.forecast',
                                                                                  'statsforecast/models.py'),
@@ -348,6 +526,8 @@ d = { 'settings': { 'branch': 'main',
                                                                                    'statsforecast/models.py'),
                                       'statsforecast.models.AutoTheta.__repr__': ( 'src/core/models.html#autotheta.__repr__',
                                                                                    'statsforecast/models.py'),
+                                      'statsforecast.models.AutoTheta._forward_update': ( 'src/core/models.html#autotheta._forward_update',
+                                                                                          'statsforecast/models.py'),
                                       'statsforecast.models.AutoTheta.fit': ( 'src/core/models.html#autotheta.fit',
                                                                               'statsforecast/models.py'),
                                       'statsforecast.models.AutoTheta.forecast': ( 'src/core/models.html#autotheta.forecast',
@@ -364,6 +544,8 @@ d = { 'settings': { 'branch': 'main',
                                                                                        'statsforecast/models.py'),
                                       'statsforecast.models.ConstantModel.__repr__': ( 'src/core/models.html#constantmodel.__repr__',
                                                                                        'statsforecast/models.py'),
+                                      'statsforecast.models.ConstantModel._forecast_panel': ( 'src/core/models.html#constantmodel._forecast_panel',
+                                                                                              'statsforecast/models.py'),
                                       'statsforecast.models.ConstantModel.fit': ( 'src/core/models.html#constantmodel.fit',
                                                                                   'statsforecast/models.py'),
                                       'statsforecast.models.ConstantModel.forecast': ( 'src/core/models.html#constantmodel.forecast',
@@ -442,6 +624,8 @@ d = { 'settings': { 'branch': 'main',
                                                                                          'statsforecast/models.py'),
                                       'statsforecast.models.HistoricAverage.__repr__': ( 'src/core/models.html#historicaverage.__repr__',
                                                                                          'statsforecast/models.py'),
+                                      'statsforecast.models.HistoricAverage._forecast_panel': ( 'src/core/models.html#historicaverage._forecast_panel',
+                                                                                                'statsforecast/models.py'),
                                       'statsforecast.models.HistoricAverage.fit': ( 'src/core/models.html#historicaverage.fit',
                                                                                     'statsforecast/models.py'),
                                       'statsforecast.models.HistoricAverage.forecast': ( 'src/core/models.html#historicaverage.forecast',
@@ -492,6 +676,8 @@ d = { 'settings': { 'branch': 'main',
                                                                                'statsforecast/models.py'),
                                       'statsforecast.models.Naive.__repr__': ( 'src/core/models.html#naive.__repr__',
                                                                                'statsforecast/models.py'),
+                                      'statsforecast.models.Naive._forecast_panel': ( 'src/core/models.html#naive._forecast_panel',
+                                                                                      'statsforecast/models.py'),
                                       'statsforecast.models.Naive.fit': ('src/core/models.html#naive.fit', 'statsforecast/models.py'),
                                       'statsforecast.models.Naive.forecast': ( 'src/core/models.html#naive.forecast',
                                                                                'statsforecast/models.py'),
@@ -509,6 +695,8 @@ d = { 'settings': { 'branch': 'main',
                                                                                              'statsforecast/models.py'),
                                       'statsforecast.models.RandomWalkWithDrift.__repr__': ( 'src/core/models.html#randomwalkwithdrift.__repr__',
                                                                                              'statsforecast/models.py'),
+                                      'statsforecast.models.RandomWalkWithDrift._forecast_panel': ( 'src/core/models.html#randomwalkwithdrift._forecast_panel',
+                                                                                                    'statsforecast/models.py'),
                                       'statsforecast.models.RandomWalkWithDrift.fit': ( 'src/core/models.html#randomwalkwithdrift.fit',
                                                                                         'statsforecast/models.py'),
                                       'statsforecast.models.RandomWalkWithDrift.forecast': ( 'src/core/models.html#randomwalkwithdrift.forecast',
@@ -551,6 +739,8 @@ d = { 'settings': { 'branch': 'main',
                                                                                        'statsforecast/models.py'),
                                       'statsforecast.models.SeasonalNaive.__repr__': ( 'src/core/models.html#seasonalnaive.__repr__',
                                                                                        'statsforecast/models.py'),
+                                      'statsforecast.models.SeasonalNaive._forecast_panel': ( 'src/core/models.html#seasonalnaive._forecast_panel',
+                                                                                              'statsforecast/models.py'),
                                       'statsforecast.models.SeasonalNaive.fit': ( 'src/core/models.html#seasonalnaive.fit',
                                                                                   'statsforecast/models.py'),
                                       'statsforecast.models.SeasonalNaive.forecast': ( 'src/core/models.html#seasonalnaive.forecast',
@@ -565,6 +755,8 @@ d = { 'settings': { 'branch': 'main',
                                                                                                'statsforecast/models.py'),
                                       'statsforecast.models.SeasonalWindowAverage.__repr__': ( 'src/core/models.html#seasonalwindowaverage.__repr__',
                                                                                                'statsforecast/models.py'),
+                                      'statsforecast.models.SeasonalWindowAverage._forecast_panel': ( 'src/core/models.html#seasonalwindowaverage._forecast_panel',
+                                                                                                      'statsforecast/models.py'),
                                       'statsforecast.models.SeasonalWindowAverage.fit': ( 'src/core/models.html#seasonalwindowaverage.fit',
                                                                                           'statsforecast/models.py'),
                                       'statsforecast.models.SeasonalWindowAverage.forecast': ( 'src/core/models.html#seasonalwindowaverage.forecast',
@@ -618,6 +810,8 @@ d = { 'settings': { 'branch': 'main',
                                                                                        'statsforecast/models.py'),
                                       'statsforecast.models.WindowAverage.__repr__': ( 'src/core/models.html#windowaverage.__repr__',
                                                                                        'statsforecast/models.py'),
+                                      'statsforecast.models.WindowAverage._forecast_panel': ( 'src/core/models.html#windowaverage._forecast_panel',
+                                                                                              'statsforecast/models.py'),
                                       'statsforecast.models.WindowAverage.fit': ( 'src/core/models.html#windowaverage.fit',
                                                                                   'statsforecast/models.py'),
                                       'statsforecast.models.WindowAverage.forecast': ( 'src/core/models.html#windowaverage.forecast',
@@ -647,25 +841,38 @@ d = { 'settings': { 'branch': 'main',
                                                                                    'statsforecast/models.py'),
                                       'statsforecast.models._croston_sba': ('src/core/models.html#_croston_sba', 'statsforecast/models.py'),
                                       'statsforecast.models._demand': ('src/core/models.html#_demand', 'statsforecast/models.py'),
+                                      'statsforecast.models._fill_levels': ('src/core/models.html#_fill_levels', 'statsforecast/models.py'),
                                       'statsforecast.models._get_conformal_method': ( 'src/core/models.html#_get_conformal_method',
                                                                                       'statsforecast/models.py'),
                                       'statsforecast.models._historic_average': ( 'src/core/models.html#_historic_average',
                                                                                   'statsforecast/models.py'),
+                                      'statsforecast.models._historic_average_panel': ( 'src/core/models.html#_historic_average_panel',
+                                                                                        'statsforecast/models.py'),
                                       'statsforecast.models._imapa': ('src/core/models.html#_imapa', 'statsforecast/models.py'),
                                       'statsforecast.models._intervals': ('src/core/models.html#_intervals', 'statsforecast/models.py'),
+                                      'statsforecast.models._naive_panel': ('src/core/models.html#_naive_panel', 'statsforecast/models.py'),
                                       'statsforecast.models._optimized_ses_forecast': ( 'src/core/models.html#_optimized_ses_forecast',
                                                                                         'statsforecast/models.py'),
+                                      'statsforecast.models._panel_levels': ( 'src/core/models.html#_panel_levels',
+                                                                              'statsforecast/models.py'),
+                                      'statsforecast.models._panel_sigma': ('src/core/models.html#_panel_sigma', 'statsforecast/models.py'),
                                       'statsforecast.models._predict_mstl_seas': ( 'src/core/models.html#_predict_mstl_seas',
                                                                                    'statsforecast/models.py'),
                                       'statsforecast.models._probability': ('src/core/models.html#_probability', 'statsforecast/models.py'),
                                       'statsforecast.models._random_walk_with_drift': ( 'src/core/models.html#_random_walk_with_drift',
                                                                                         'statsforecast/models.py'),
+                                      'statsforecast.models._random_walk_with_drift_panel': ( 'src/core/models.html#_random_walk_with_drift_panel',
+                                                                                              'statsforecast/models.py'),
                                       'statsforecast.models._seasonal_exponential_smoothing': ( 'src/core/models.html#_seasonal_exponential_smoothing',
                                                                                                 'statsforecast/models.py'),
+                                      'statsforecast.models._seasonal_naive_panel': ( 'src/core/models.html#_seasonal_naive_panel',
+                                                                                      'statsforecast/models.py'),
                                       'statsforecast.models._seasonal_ses_optimized': ( 'src/core/models.html#_seasonal_ses_optimized',
                                                                                         'statsforecast/models.py'),
                                       'statsforecast.models._seasonal_window_average': ( 'src/core/models.html#_seasonal_window_average',
                                                                                          'statsforecast/models.py'),
+                                      'statsforecast.models._seasonal_window_average_panel': ( 'src/core/models.html#_seasonal_window_average_panel',
+                                                                                               'statsforecast/models.py'),
                                       'statsforecast.models._ses': ('src/core/models.html#_ses', 'statsforecast/models.py'),
                                       'statsforecast.models._ses_fcst_mse': ( 'src/core/models.html#_ses_fcst_mse',
                                                                               'statsforecast/models.py'),
@@ -676,7 +883,9 @@ d = { 'settings': { 'branch': 'main',
                                                                                'statsforecast/models.py'),
                                       'statsforecast.models._tsb': ('src/core/models.html#_tsb', 'statsforecast/models.py'),
                                       'statsforecast.models._window_average': ( 'src/core/models.html#_window_average',
-                                                                                'statsforecast/models.py')},
+                                                                                'statsforecast/models.py'),
+                                      'statsforecast.models._window_average_panel': ( 'src/core/models.html#_window_average_panel',
+                                                                                      'statsforecast/models.py')},
             'statsforecast.mstl': {'statsforecast.mstl.mstl': ('src/mstl.html#mstl', 'statsforecast/mstl.py')},
             'statsforecast.theta': { 'statsforecast.theta.auto_theta': ('src/theta.html#auto_theta', 'statsforecast/theta.py'),
                                      'statsforecast.theta.compute_pi_samples': ( 'src/theta.html#compute_pi_samples',
@@ -694,9 +903,11 @@ d = { 'settings': { 'branch': 'main',
                                      'statsforecast.theta.theta_target_fn': ('src/theta.html#theta_target_fn', 'statsforecast/theta.py'),
                                      'statsforecast.theta.thetacalc': ('src/theta.html#thetacalc', 'statsforecast/theta.py'),
                                      'statsforecast.theta.thetafcst': ('src/theta.html#thetafcst', 'statsforecast/theta.py'),
+                                     'statsforecast.theta.thetafilter': ('src/theta.html#thetafilter', 'statsforecast/theta.py'),
                                      'statsforecast.theta.thetaforecast': ('src/theta.html#thetaforecast', 'statsforecast/theta.py'),
                                      'statsforecast.theta.thetamodel': ('src/theta.html#thetamodel', 'statsforecast/theta.py'),
-                                     'statsforecast.theta.thetaupdate': ('src/theta.html#thetaupdate', 'statsforecast/theta.py')},
+                                     'statsforecast.theta.thetaupdate': ('src/theta.html#thetaupdate', 'statsforecast/theta.py'),
+                                     'statsforecast.theta.update_theta': ('src/theta.html#update_theta', 'statsforecast/theta.py')},
             'statsforecast.utils': { 'statsforecast.utils.ConformalIntervals': ( 'src/utils.html#conformalintervals',
                                                                                  'statsforecast/utils.py'),
                                      'statsforecast.utils.ConformalIntervals.__init__': ( 'src/utils.html#conformalintervals.__init__',
@@ -8,7 +8,6 @@ index = {"AutoARIMAProphet": "adapters.prophet.ipynb",
          "arima_gradtrans": "arima.ipynb",
          "arima_undopars": "arima.ipynb",
          "tsconv": "arima.ipynb",
-         "inclu2": "arima.ipynb",
          "invpartrans": "arima.ipynb",
          "ARIMA_invtrans": "arima.ipynb",
          "getQ0": "arima.ipynb",
@@ -8,7 +8,9 @@ __all__ = ['predict_arima', 'arima_string', 'forecast_arima', 'fitted_arima', 'a
 import math
 import warnings
 from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from functools import partial
+from multiprocessing import current_process
 from typing import Optional, Dict, Union, Tuple
 
 import numpy as np
@@ -99,35 +101,6 @@ def tsconv(a, b):
 
 # %% ../nbs/src/arima.ipynb 13
 @njit
-def inclu2(np_, xnext, xrow, ynext, d, rbar, thetab):
-    for i in range(np_):
-        xrow[i] = xnext[i]
-
-    ithisr = 0
-    for i in range(np_):
-        if xrow[i] != 0.0:
-            xi = xrow[i]
-            di = d[i]
-            dpi = di + xi * xi
-            d[i] = dpi
-            cbar = di / dpi if dpi != 0.0 else math.inf
-            sbar = xi / dpi if dpi != 0.0 else math.inf
-            for k in range(i + 1, np_):
-                xk = xrow[k]
-                rbthis = rbar[ithisr]
-                xrow[k] = xk - xi * rbthis
-                rbar[ithisr] = cbar * rbthis + sbar * xk
-                ithisr += 1
-            xk = ynext
-            ynext = xk - xi * thetab[i]
-            thetab[i] = cbar * thetab[i] + sbar * xk
-            if di == 0.0:
-                return
-        else:
-            ithisr = ithisr + np_ - i - 1
-
-# %% ../nbs/src/arima.ipynb 14
-@njit
 def invpartrans(p, phi, new):
     if p > 100:
         raise ValueError("can only transform 100 pars in arima0")
@@ -144,7 +117,7 @@ def invpartrans(p, phi, new):
     for j in range(p):
         new[j] = math.atanh(new[j])
 
-# %% ../nbs/src/arima.ipynb 15
+# %% ../nbs/src/arima.ipynb 14
 @njit
 def ARIMA_invtrans(x, arma):
     mp, mq, msp = arma[:3]
@@ -156,6 +129,51 @@ def ARIMA_invtrans(x, arma):
         invpartrans(msp, x[v:], y[v:])
     return y
 
+# %% ../nbs/src/arima.ipynb 16
+@njit
+def _getQ0_solve(phi, W):
+    # solves Q0 = T Q0 T' + W for each of the symmetric matrices in W, where
+    # T is the companion matrix with phi in its first column. Then
+    # Q0[i, j] = E[i, j] + Q0[i + 1, j + 1] with
+    # E[i, j] = W[i, j] + phi[i] phi[j] c[0] + phi[i] c[j + 1] + phi[j] c[i + 1],
+    # where c is the first row of Q0, so c solves a linear system of size r
+    # and the other rows are sums along the diagonals
+    nrhs, r, _ = W.shape
+    phir = np.zeros(r)
+    phir[: len(phi)] = phi
+
+    A = np.identity(r)
+    b = np.zeros((r, nrhs))
+    for j in range(r):
+        for s in range(r - j):
+            A[j, 0] -= phir[s] * phir[j + s]
+            if j + s + 1 < r:
+                A[j, j + s + 1] -= phir[s]
+            if s + 1 < r:
+                A[j, s + 1] -= phir[j + s]
+            for k in range(nrhs):
+                b[j, k] += W[k, s, j + s]
+    try:
+        c = np.linalg.solve(A, b)
+    except Exception:
+        # phi has a unit root, so there's no stationary covariance
+        c = np.linalg.lstsq(A, b)[0]
+
+    res = np.zeros((nrhs, r, r))
+    for k in range(nrhs):
+        for i in range(r - 1, -1, -1):
+            for j in range(r - 1, i - 1, -1):
+                tmp = W[k, i, j] + phir[i] * phir[j] * c[0, k]
+                if j < r - 1:
+                    tmp += phir[i] * c[j + 1, k]
+                    if i < r - 1:
+                        tmp += res[k, i + 1, j + 1]
+                if i < r - 1:
+                    tmp += phir[j] * c[i + 1, k]
+                res[k, i, j] = tmp
+                res[k, j, i] = tmp
+    return res
+
 # %% ../nbs/src/arima.ipynb 17
 @njit
 def getQ0(phi, theta):
@@ -163,130 +181,47 @@ def getQ0(phi, theta):
     q = len(theta)
     r = max(p, q + 1)
 
-    np_ = r * (r + 1) // 2
-    nrbar = np_ * (np_ - 1) // 2
-
-    V = np.zeros(np_)
-    ind = 0
-    for j in range(r):
-        vj = 0.0
-        if j == 0:
-            vj = 1.0
-        elif j - 1 < q:
-            vj = theta[j - 1]
-
-        for i in range(j, r):
-            vi = 0.0
-            if i == 0:
-                vi = 1.0
-            elif i - 1 < q:
-                vi = theta[i - 1]
-            V[ind] = vi * vj
-            ind += 1
-
-    res = np.zeros((r, r))
-    res = res.flatten()
-
-    if r == 1:
-        if p == 0:
-            res[0] = 1.0
-        else:
-            res[0] = 1.0 / (1.0 - phi[0] * phi[0])
-
-        res = res.reshape((r, r))
-        return res
-
-    if p > 0:
-        rbar = np.zeros(nrbar)
-        thetab = np.zeros(np_)
-        xnext = np.zeros(np_)
-        xrow = np.zeros(np_)
-
-        ind = 0
-        ind1 = -1
-        npr = np_ - r
-        npr1 = npr + 1
-        indj = npr
-        ind2 = npr - 1
-
+    R = np.zeros(r)
+    R[0] = 1.0
+    R[1 : q + 1] = theta
+    W = np.empty((1, r, r))
+    for i in range(r):
         for j in range(r):
-            phij = phi[j] if j < p else 0.0
-            xnext[indj] = 0.0
-            indj += 1
-            indi = npr1 + j
-            for i in range(j, r):
-                ynext = V[ind]
-                ind += 1
-                phii = phi[i] if i < p else 0.0
-                if j != r - 1:
-                    xnext[indj] = -phii
-                    if i != r - 1:
-                        xnext[indi] -= phij
-                        ind1 += 1
-                        xnext[ind1] = -1.0
-                xnext[npr] = -phii * phij
-                ind2 += 1
-                if ind2 >= np_:
-                    ind2 = 0
-                xnext[ind2] += 1.0
-                inclu2(np_, xnext, xrow, ynext, res, rbar, thetab)
-                xnext[ind2] = 0.0
-                if i != r - 1:
-                    xnext[indi] = 0.0
-                    indi += 1
-                    xnext[ind1] = 0.0
-
-        ithisr = nrbar - 1
-        im = np_ - 1
-        for i in range(np_):
-            bi = thetab[im]
-            jm = np_ - 1
-            for j in range(i):
-                bi -= rbar[ithisr] * res[jm]
-                ithisr -= 1
-                jm -= 1
-            res[im] = bi
-            im -= 1
-
-        # Now reorder p
-        ind = npr
-        for i in range(r):
-            xnext[i] = res[ind]
-            ind += 1
-        ind = np_ - 1
-        ind1 = npr - 1
-        for i in range(npr):
-            res[ind] = res[ind1]
-            ind -= 1
-            ind1 -= 1
-        for i in range(r):
-            res[i] = xnext[i]
-    else:
-        indn = np_
-        ind = np_
+            W[0, i, j] = R[i] * R[j]
+    return _getQ0_solve(phi, W)[0]
+
+# %% ../nbs/src/arima.ipynb 21
+@njit
+def getQ0_grad(phi, theta, Q0, dphi, dtheta):
+    p = len(phi)
+    q = len(theta)
+    r = max(p, q + 1)
+    npar = dphi.shape[0]
+
+    # Q0 = T Q0 T' + R R', so each derivative solves the same system
+    # with the derivatives of T and R moved to the right hand side
+    R = np.zeros(r)
+    R[0] = 1.0
+    R[1 : q + 1] = theta
+    TQ = np.zeros(r)
+    for i in range(r):
+        TQ[i] = phi[i] * Q0[0, 0] if i < p else 0.0
+        if i < r - 1:
+            TQ[i] += Q0[i + 1, 0]
+    W = np.zeros((npar, r, r))
+    for k in range(npar):
+        dphik = np.zeros(r)
+        dphik[:p] = dphi[k]
+        dR = np.zeros(r)
+        dR[1 : q + 1] = dtheta[k]
         for i in range(r):
-            for j in range(i + 1):
-                ind -= 1
-                res[ind] = V[ind]
-                if j != 0:
-                    indn -= 1
-                    res[ind] += res[ind]
-
-    # Unpack to a full matrix
-    ind = np_
-    for i in range(r - 1, 0, -1):
-        for j in range(r - 1, i - 1, -1):
-            ind -= 1
-            res[r * i + j] = res[ind]
-
-    for i in range(r - 1):
-        for j in range(i + 1, r):
-            res[i + r * j] = res[j + r * i]
-
-    res = res.reshape((r, r))
-    return res
+            for j in range(r):
+                W[k, i, j] = (
+                    dR[i] * R[j] + R[i] * dR[j] + dphik[i] * TQ[j] + TQ[i] * dphik[j]
+                )
+    return _getQ0_solve(phi, W)
 
-# %% ../nbs/src/arima.ipynb 19
+# %% ../nbs/src/arima.ipynb 23
 @njit
 def arima_transpar(params_in, arma, trans):
     # TODO check trans=True results
@@ -325,7 +260,71 @@ def arima_transpar(params_in, arma, trans):
 
     return phi, theta
 
-# %% ../nbs/src/arima.ipynb 22
+# %% ../nbs/src/arima.ipynb 26
+@njit
+def partrans_grad(p, raw):
+    new = np.tanh(raw[:p])
+    # jac[i, j] is the derivative of new[j] with respect to raw[i]
+    jac = np.diag(1.0 - new * new)
+    work = new.copy()
+    dwork = jac.copy()
+    for j in range(1, p):
+        a = new[j]
+        for k in range(j):
+            work[k] -= a * new[j - k - 1]
+            dwork[:, k] -= jac[:, j] * new[j - k - 1] + a * jac[:, j - k - 1]
+        new[:j] = work[:j]
+        jac[:, :j] = dwork[:, :j]
+    return new, jac
+
+# %% ../nbs/src/arima.ipynb 27
+@njit
+def arima_transpar_grad(params_in, arma, trans):
+    mp, mq, msp, msq, ns = arma[:5]
+    p = mp + ns * msp
+    q = mq + ns * msq
+    narma = mp + mq + msp + msq
+    v = mp + mq
+
+    params = params_in.copy()
+    # jac[i, j] is the derivative of params[j] with respect to params_in[i]
+    jac = np.identity(narma)
+    if trans:
+        if mp > 0:
+            params[:mp], jac[:mp, :mp] = partrans_grad(mp, params_in)
+        if msp > 0:
+            params[v : v + msp], jac[v : v + msp, v : v + msp] = partrans_grad(
+                msp, params_in[v:]
+            )
+
+    phi = np.zeros(p)
+    theta = np.zeros(q)
+    dphi = np.zeros((narma, p))
+    dtheta = np.zeros((narma, q))
+    phi[:mp] = params[:mp]
+    theta[:mq] = params[mp:v]
+    for i in range(mp):
+        dphi[i, i] = 1.0
+    for i in range(mq):
+        dtheta[mp + i, i] = 1.0
+    for j in range(msp):
+        phi[(j + 1) * ns - 1] += params[j + v]
+        dphi[j + v, (j + 1) * ns - 1] += 1.0
+        for i in range(mp):
+            phi[(j + 1) * ns + i] -= params[i] * params[j + v]
+            dphi[i, (j + 1) * ns + i] -= params[j + v]
+            dphi[j + v, (j + 1) * ns + i] -= params[i]
+    for j in range(msq):
+        theta[(j + 1) * ns - 1] += params[j + v + msp]
+        dtheta[j + v + msp, (j + 1) * ns - 1] += 1.0
+        for i in range(mq):
+            theta[(j + 1) * ns + i] += params[i + mp] * params[j + v + msp]
+            dtheta[i + mp, (j + 1) * ns + i] += params[j + v + msp]
+            dtheta[j + v + msp, (j + 1) * ns + i] += params[i + mp]
+
+    return phi, theta, jac @ dphi, jac @ dtheta
+
+# %% ../nbs/src/arima.ipynb 29
 @njit
 def arima_css(y, arma, phi, theta, ncond):
     n = len(y)
@@ -369,7 +368,63 @@ def arima_css(y, arma, phi, theta, ncond):
 
     return res, resid
 
-# %% ../nbs/src/arima.ipynb 24
+# %% ../nbs/src/arima.ipynb 31
+@njit
+def arima_css_grad(y, arma, phi, theta, ncond, dphi, dtheta, xreg):
+    n = len(y)
+    p = len(phi)
+    q = len(theta)
+    narma = dphi.shape[0]
+    ncxreg = xreg.shape[1]
+    npar = narma + ncxreg
+    nu = 0
+    ssq = 0.0
+    dssq = np.zeros(npar)
+
+    # the regression coefficients enter through y - xreg @ beta
+    w = np.empty((n, 1 + ncxreg))
+    w[:, 0] = y
+    w[:, 1:] = -xreg
+    for i in range(arma[5]):
+        for l in range(n - 1, 0, -1):
+            w[l] -= w[l - 1]
+
+    ns = arma[4]
+    for i in range(arma[6]):
+        for l in range(n - 1, ns - 1, -1):
+            w[l] -= w[l - ns]
+
+    resid = np.zeros(n)
+    dresid = np.zeros((n, npar))
+    for l in range(ncond, n):
+        tmp = w[l, 0]
+        dtmp = np.zeros(npar)
+        dtmp[narma:] = w[l, 1:]
+        for j in range(min(p, l)):
+            tmp -= phi[j] * w[l - j - 1, 0]
+            for k in range(narma):
+                dtmp[k] -= dphi[k, j] * w[l - j - 1, 0]
+            for k in range(ncxreg):
+                dtmp[narma + k] -= phi[j] * w[l - j - 1, 1 + k]
+
+        for j in range(min(l - ncond, q)):
+            tmp -= theta[j] * resid[l - j - 1]
+            for k in range(narma):
+                dtmp[k] -= dtheta[k, j] * resid[l - j - 1]
+            for k in range(npar):
+                dtmp[k] -= theta[j] * dresid[l - j - 1, k]
+
+        resid[l] = tmp
+        dresid[l] = dtmp
+
+        if not np.isnan(tmp):
+            nu += 1
+            ssq += tmp * tmp
+            dssq += 2.0 * tmp * dtmp
+
+    return ssq / nu, dssq / nu
+
+# %% ../nbs/src/arima.ipynb 33
 @njit
 def _make_arima(phi, theta, delta, kappa=1e6, tol=np.finfo(float).eps):
     # check nas phi
@@ -422,9 +477,9 @@ def make_arima(phi, theta, delta, kappa=1e6, tol=np.finfo(np.float64).eps):
     res = _make_arima(phi, theta, delta, kappa, tol)
     return dict(zip(keys, res))
 
-# %% ../nbs/src/arima.ipynb 26
+# %% ../nbs/src/arima.ipynb 35
 @njit
-def arima_like(y, phi, theta, delta, a, P, Pn, up, use_resid):
+def arima_like(y, phi, theta, delta, a, P, Pn, up, use_resid, sstol=1e-12):
     n = len(y)
     rd = len(a)
     p = len(phi)
@@ -446,6 +501,13 @@ def arima_like(y, phi, theta, delta, a, P, Pn, up, use_resid):
     if use_resid:
         rsResid = np.empty(n)
 
+    # once two consecutive predicted covariances differ by less than sstol
+    # the filter has reached its steady state, so the covariances are kept
+    # fixed until the next missing value
+    steady = False
+    converged = False
+    Pold = Pnew.copy()
+
     for l in range(n):
         for i in range(r):
             tmp = a[i + 1] if i < r - 1 else 0.0
@@ -459,7 +521,7 @@ def arima_like(y, phi, theta, delta, a, P, Pn, up, use_resid):
             for i in range(d):
                 tmp += delta[i] * a[r + i]
             anew[r] = tmp
-        if l > up:
+        if l > up and not steady:
             if d == 0:
                 for i in range(r):
                     vi = 0.0
@@ -522,6 +584,11 @@ def arima_like(y, phi, theta, delta, a, P, Pn, up, use_resid):
                     vi = 1.0 if i == 0 else theta[i - 1]
                     for j in range(q + 1):
                         Pnew[i + rd * j] += vi * (1.0 if j == 0 else theta[j - 1])
+            converged = True
+            for i in range(rd * rd):
+                if not abs(Pnew[i] - Pold[i]) <= sstol:
+                    converged = False
+                Pold[i] = Pnew[i]
 
         if not math.isnan(y[l]):
             resid = y[l] - anew[0]
@@ -543,23 +610,291 @@ def arima_like(y, phi, theta, delta, a, P, Pn, up, use_resid):
                 rsResid[l] = resid / math.sqrt(gain) if gain != 0.0 else math.inf
             for i in range(rd):
                 a[i] = anew[i] + M[i] * resid / gain if gain != 0.0 else math.inf
-            for i in range(rd):
-                for j in range(rd):
-                    P[i + j * rd] = (
-                        Pnew[i + j * rd] - M[i] * M[j] / gain
-                        if gain != 0.0
-                        else math.inf
-                    )
+            if not steady:
+                for i in range(rd):
+                    for j in range(rd):
+                        P[i + j * rd] = (
+                            Pnew[i + j * rd] - M[i] * M[j] / gain
+                            if gain != 0.0
+                            else math.inf
+                        )
+                steady = converged
         else:
             a[:] = anew[:]
             P[:] = Pnew[:]
+            steady = False
+            converged = False
             if use_resid:
                 rsResid[l] = np.nan
     if not use_resid:
         rsResid = None
     return ssq, sumlog, nu, rsResid
 
-# %% ../nbs/src/arima.ipynb 28
+# %% ../nbs/src/arima.ipynb 37
+@njit
+def _arima_tpt(P, phi, delta, r, mm, out):
+    # out = T P T' for the transition matrix built by make_arima, mm = T P
+    p = len(phi)
+    d = len(delta)
+    rd = r + d
+    for i in range(r):
+        for j in range(rd):
+            mm[i, j] = P[i + 1, j] if i < r - 1 else 0.0
+        if i < p:
+            for j in range(rd):
+                mm[i, j] += phi[i] * P[0, j]
+    if d > 0:
+        for j in range(rd):
+            tmp = P[0, j]
+            for k in range(d):
+                tmp += delta[k] * P[r + k, j]
+            mm[r, j] = tmp
+        for i in range(1, d):
+            for j in range(rd):
+                mm[r + i, j] = P[r + i - 1, j]
+    for i in range(rd):
+        m0 = mm[i, 0]
+        for j in range(r - 1):
+            out[i, j] = mm[i, j + 1]
+        out[i, r - 1] = 0.0
+        for j in range(p):
+            out[i, j] += phi[j] * m0
+        if d > 0:
+            tmp = m0
+            for k in range(d):
+                tmp += delta[k] * mm[i, r + k]
+            out[i, r] = tmp
+            for j in range(1, d):
+                out[i, r + j] = mm[i, r + j - 1]
+
+# %% ../nbs/src/arima.ipynb 38
+@njit
+def _arima_ttpt(G, phi, delta, r, mm, out):
+    # out = T' G T for the transition matrix built by make_arima, mm = T' G
+    p = len(phi)
+    d = len(delta)
+    rd = r + d
+    for j in range(rd):
+        tmp = G[r, j] if d > 0 else 0.0
+        for i in range(p):
+            tmp += phi[i] * G[i, j]
+        mm[0, j] = tmp
+    for i in range(1, r):
+        for j in range(rd):
+            mm[i, j] = G[i - 1, j]
+    for k in range(d):
+        for j in range(rd):
+            mm[r + k, j] = delta[k] * G[r, j]
+            if k < d - 1:
+                mm[r + k, j] += G[r + k + 1, j]
+    for i in range(rd):
+        tmp = mm[i, r] if d > 0 else 0.0
+        for j in range(p):
+            tmp += mm[i, j] * phi[j]
+        out[i, 0] = tmp
+        for j in range(1, r):
+            out[i, j] = mm[i, j - 1]
+        for k in range(d):
+            out[i, r + k] = delta[k] * mm[i, r]
+            if k < d - 1:
+                out[i, r + k] += mm[i, r + k + 1]
+
+# %% ../nbs/src/arima.ipynb 39
+@njit
+def arima_like_grad(y, phi, theta, delta, Pn, dphi, dtheta, xreg, sstol=1e-12):
+    n = len(y)
+    rd = Pn.shape[0]
+    p = len(phi)
+    q = len(theta)
+    d = len(delta)
+    r = rd - d
+    narma = dphi.shape[0]
+    ncxreg = xreg.shape[1]
+    grad = np.zeros(narma + ncxreg)
+
+    Z = np.zeros(rd)
+    Z[0] = 1.0
+    Z[r:] = delta
+    R = np.zeros(rd)
+    R[0] = 1.0
+    R[1 : q + 1] = theta
+
+    # forward pass, keeping what the backward pass needs
+    sumlog = 0.0
+    ssq = 0.0
+    nu = 0
+    a = np.zeros(rd)
+    anew = np.empty(rd)
+    P = np.zeros((rd, rd))
+    Pnew = Pn.copy()
+    mm = np.empty((rd, rd))
+    a0 = np.zeros(n)
+    TP0 = np.zeros((n, rd))
+    M = np.zeros((n, rd))
+    resid = np.zeros(n)
+    gain = np.zeros(n)
+    # 0 for missing values, 1 for observations and 2 for those in the likelihood
+    obs = np.zeros(n, dtype=np.int8)
+    # the steps in the steady state, which reuse the previous predicted covariance
+    # and keep the previous filtered one, as in arima_like
+    frozen = np.zeros(n, dtype=np.bool_)
+    steady = False
+    converged = False
+    Pold = Pn.copy()
+    for l in range(n):
+        a0[l] = a[0]
+        for i in range(r):
+            tmp = a[i + 1] if i < r - 1 else 0.0
+            if i < p:
+                tmp += phi[i] * a[0]
+            anew[i] = tmp
+        if d > 0:
+            tmp = a[0]
+            for i in range(d):
+                tmp += delta[i] * a[r + i]
+            anew[r] = tmp
+            for i in range(1, d):
+                anew[r + i] = a[r + i - 1]
+        if l > 0 and steady:
+            frozen[l] = True
+        elif l > 0:
+            _arima_tpt(P, phi, delta, r, mm, Pnew)
+            TP0[l] = mm[:, 0]
+            for i in range(q + 1):
+                for j in range(q + 1):
+                    Pnew[i, j] += R[i] * R[j]
+            converged = True
+            for i in range(rd):
+                for j in range(rd):
+                    if not abs(Pnew[i, j] - Pold[i, j]) <= sstol:
+                        converged = False
+                    Pold[i, j] = Pnew[i, j]
+        if math.isnan(y[l]):
+            a[:] = anew
+            P[:] = Pnew
+            steady = False
+            continue
+        v = y[l] - anew[0]
+        for i in range(d):
+            v -= delta[i] * anew[r + i]
+        for i in range(rd):
+            tmp = Pnew[i, 0]
+            for j in range(d):
+                tmp += Pnew[i, r + j] * delta[j]
+            M[l, i] = tmp
+        F = M[l, 0]
+        for j in range(d):
+            F += delta[j] * M[l, r + j]
+        if F == 0.0:
+            return math.inf, sumlog, nu, grad
+        obs[l] = 1
+        if F < 1e4:
+            obs[l] = 2
+            nu += 1
+            ssq += v * v / F
+            sumlog += math.log(F)
+        resid[l] = v
+        gain[l] = F
+        for i in range(rd):
+            a[i] = anew[i] + M[l, i] * v / F
+        if not steady:
+            for i in range(rd):
+                for j in range(rd):
+                    P[i, j] = Pnew[i, j] - M[l, i] * M[l, j] / F
+            steady = converged
+    if nu == 0 or ssq <= 0.0:
+        return ssq, sumlog, nu, grad
+
+    # backward pass for the adjoints of 0.5 * (ssq / ssq0 + sumlog / nu),
+    # kept symmetric like the covariances they belong to
+    c1 = 0.5 / ssq
+    c2 = 0.5 / nu
+    abar = np.zeros(rd)
+    b = np.empty(rd)
+    Pbar = np.zeros((rd, rd))
+    G = np.empty((rd, rd))
+    Mbar = np.empty(rd)
+    # adjoint of the predicted covariance shared by the steps of a steady state
+    Gs = np.zeros((rd, rd))
+    phibar = np.zeros(p)
+    thetabar = np.zeros(q)
+    for l in range(n - 1, -1, -1):
+        G, Pbar = Pbar, G
+        b[:] = abar
+        if obs[l] > 0:
+            F = gain[l]
+            v = resid[l]
+            aM = 0.0
+            MPM = 0.0
+            for i in range(rd):
+                aM += abar[i] * M[l, i]
+                tmp = 0.0
+                if not frozen[l]:
+                    for j in range(rd):
+                        tmp += G[i, j] * M[l, j]
+                Mbar[i] = (abar[i] * v - 2.0 * tmp) / F
+                MPM += M[l, i] * tmp
+            vbar = aM / F
+            Fbar = (MPM - aM * v) / (F * F)
+            if obs[l] == 2:
+                vbar += 2.0 * c1 * v / F
+                Fbar += c2 / F - c1 * v * v / (F * F)
+            for i in range(rd):
+                Mbar[i] += Fbar * Z[i]
+            H = Gs if frozen[l] else G
+            for j in range(rd):
+                if Z[j] != 0.0:
+                    for i in range(rd):
+                        H[i, j] += 0.5 * Mbar[i] * Z[j]
+                        H[j, i] += 0.5 * Z[j] * Mbar[i]
+                    b[j] -= vbar * Z[j]
+            for k in range(ncxreg):
+                grad[narma + k] -= vbar * xreg[l, k]
+        elif frozen[l]:
+            Gs += G
+            G[:] = 0.0
+        if not frozen[l]:
+            G += Gs
+            Gs[:] = 0.0
+        for i in range(p):
+            phibar[i] += b[i] * a0[l]
+        # abar = T' b
+        tmp = b[r] if d > 0 else 0.0
+        for i in range(p):
+            tmp += phi[i] * b[i]
+        abar[0] = tmp
+        for i in range(1, r):
+            abar[i] = b[i - 1]
+        for k in range(d):
+            abar[r + k] = delta[k] * b[r]
+            if k < d - 1:
+                abar[r + k] += b[r + k + 1]
+        if frozen[l]:
+            # the filtered covariance is carried over unchanged
+            G, Pbar = Pbar, G
+        elif l > 0:
+            for i in range(p):
+                for j in range(rd):
+                    phibar[i] += 2.0 * G[i, j] * TP0[l, j]
+            for i in range(1, q + 1):
+                for j in range(q + 1):
+                    thetabar[i - 1] += 2.0 * G[i, j] * R[j]
+            _arima_ttpt(G, phi, delta, r, mm, Pbar)
+
+    dQ0 = getQ0_grad(phi, theta, Pn[:r, :r], dphi, dtheta)
+    for k in range(narma):
+        tmp = 0.0
+        for i in range(p):
+            tmp += dphi[k, i] * phibar[i]
+        for i in range(q):
+            tmp += dtheta[k, i] * thetabar[i]
+        for i in range(r):
+            for j in range(r):
+                tmp += G[i, j] * dQ0[k, i, j]
+        grad[k] = tmp
+    return ssq, sumlog, nu, grad
+
+# %% ../nbs/src/arima.ipynb 41
 @njit
 def diff1d(x, lag, differences):
     y = x.copy()
@@ -591,7 +926,7 @@ def diff(x, lag, differences):
         raise ValueError(x.ndim)
     return y[~nan_mask]
 
-# %% ../nbs/src/arima.ipynb 29
+# %% ../nbs/src/arima.ipynb 42
 def fixed_params_from_dict(
     fixed_dict: dict, order: tuple, seasonal: dict, intercept: bool, n_ex: int
 ):
@@ -615,7 +950,7 @@ def fixed_params_from_dict(
     )  # prevent adding non-existing keys
     return list(full_dict.values())
 
-# %% ../nbs/src/arima.ipynb 31
+# %% ../nbs/src/arima.ipynb 44
 def arima(
     x: np.ndarray,
     order=(0, 0, 0),
@@ -672,30 +1007,35 @@ def arima(
         x = x.copy()
         par = coef.copy()
         par[mask] = p
-        trarma = arima_transpar(par, arma, trans)
-        Z = upARIMA(mod, trarma[0], trarma[1])
-        if Z is None:
-            return np.finfo(np.float64).max
+        phi, theta, dphi, dtheta = arima_transpar_grad(par, arma, trans)
+        Z = upARIMA(mod, phi, theta)
         if ncxreg > 0:
             x -= np.dot(xreg, par[narma + np.arange(ncxreg)])
-        res = arima_like(
+        ssq, sumlog, nu, grad = arima_like_grad(
             x,
             Z["phi"],
             Z["theta"],
             Z["delta"],
-            Z["a"],
-            Z["P"],
             Z["Pn"],
-            0,
-            False,
+            dphi,
+            dtheta,
+            xreg_grad,
         )
-        if res[2] == 0.0:
-            return math.inf
+        if nu == 0:
+            return math.inf, grad[mask]
 
-        s2 = res[0] / res[2]
+        s2 = ssq / nu
         if s2 <= 0:
-            return math.nan
-        return 0.5 * (math.log(s2) + res[1] / res[2])
+            return math.nan, grad[mask]
+        return 0.5 * (math.log(s2) + sumlog / nu), grad[mask]
+
+    def armafn_inv(p, x, trans):
+        # armafn restricted to MA parts accepted by auto_arima
+        par = coef.copy()
+        par[mask] = p
+        if not maCheck(arima_transpar(par, arma, trans)[1]):
+            return math.inf, np.zeros(p.size)
+        return armafn(p, x, trans)
 
     def arCheck(ar):
         p = np.argmax(np.append(1, -ar) != 0)
@@ -705,6 +1045,26 @@ def arima(
         roots = np.polynomial.polynomial.polyroots(coefs)
         return all(np.abs(roots) > 1)
 
+    def maCheck(ma):
+        # same margin as the invertibility check of auto_arima
+        if not np.any(ma):
+            return True
+        roots = np.polynomial.polynomial.polyroots(np.append(1, ma))
+        return all(np.abs(roots) > 1.01)
+
+    def maReflect(ma):
+        # MA part with its roots inside the unit circle reflected outside
+        if not np.any(ma):
+            return ma
+        q0 = np.flatnonzero(ma)[-1] + 1
+        roots = np.polynomial.polynomial.polyroots(np.append(1, ma[:q0]))
+        ind = np.abs(roots) < 1
+        roots[ind] = 1 / roots[ind]
+        x = np.array([1.0 + 0j])
+        for r in roots:
+            x = np.append(x, 0) - np.append(0, x) / r
+        return np.append(x.real[1:], np.zeros(len(ma) - q0))
+
     def maInvert(ma):
         q = len(ma)
         q0 = np.argmax(np.append(1, ma) != 0)
@@ -886,14 +1246,17 @@ def arima(
         x = x.copy()
         par = coef.copy()
         par[mask] = p
-        phi, theta = arima_transpar(par, arma, False)
+        phi, theta, dphi, dtheta = arima_transpar_grad(par, arma, False)
 
         if ncxreg > 0:
             x -= np.dot(xreg, par[narma + np.arange(ncxreg)])
 
-        res, resid = arima_css(x, arma, phi, theta, ncond)
+        res, dres = arima_css_grad(x, arma, phi, theta, ncond, dphi, dtheta, xreg_grad)
+
+        return 0.5 * np.log(res), 0.5 * dres[mask] / res
 
-        return 0.5 * np.log(res)
+    # the objectives also return their gradient with respect to the regression coefficients
+    xreg_grad = xreg if ncxreg > 0 else np.empty((n, 0))
 
     coef = np.array(fixed)
     # parscale definition, think about it, scipy doesn't use it
@@ -905,6 +1268,7 @@ def arima(
                 arma_css_op,
                 init[mask],
                 args=(x,),
+                jac=True,
                 method=optim_method,
                 tol=tol,
                 options=optim_control,
@@ -932,6 +1296,7 @@ def arima(
                     arma_css_op,
                     init[mask],
                     args=(x,),
+                    jac=True,
                     method=optim_method,
                     tol=tol,
                     options=optim_control,
@@ -962,7 +1327,7 @@ def arima(
                 True,
                 0,
                 np.array([]),
-                armafn(np.array([]), x, transform_pars),
+                armafn(np.array([]), x, transform_pars)[0],
                 np.array([]),
             )
         else:
@@ -973,10 +1338,37 @@ def arima(
                     x,
                     transform_pars,
                 ),
+                jac=True,
                 method=optim_method,
                 tol=tol,
                 options=optim_control,
             )
+            coef[mask] = res.x
+            if not maCheck(arima_transpar(coef, arma, transform_pars)[1]):
+                # the exact gradient can take the MA part to the non invertible
+                # boundary, restart from init with its MA part reflected
+                # outside the unit circle, keeping it invertible
+                par = coef.copy()
+                par[mask] = init[mask]
+                for ind in (
+                    arma[0] + np.arange(arma[1]),
+                    np.sum(arma[:3]) + np.arange(arma[3]),
+                ):
+                    if ind.size and mask[ind].all():
+                        par[ind] = maReflect(par[ind])
+                if maCheck(arima_transpar(par, arma, transform_pars)[1]):
+                    res = minimize(
+                        armafn_inv,
+                        par[mask],
+                        args=(
+                            x,
+                            transform_pars,
+                        ),
+                        jac=True,
+                        method=optim_method,
+                        tol=tol,
+                        options=optim_control,
+                    )
         # if not res.success:
         # warnings.warn(res.message)
         coef[mask] = res.x
@@ -995,6 +1387,7 @@ def arima(
                     arma_css_op,
                     coef[mask],
                     args=(x,),
+                    jac=True,
                     method=optim_method,
                     tol=tol,
                     options=optim_control,
@@ -1058,9 +1451,9 @@ def arima(
     }
     return ans
 
-# %% ../nbs/src/arima.ipynb 39
+# %% ../nbs/src/arima.ipynb 53
 @njit
-def kalman_forecast(n, Z, a, P, T, V, h):
+def kalman_forecast(n, Z, a, P, T, V, h, sstol=1e-12):
     p = len(a)
 
     a = a.copy()
@@ -1070,43 +1463,52 @@ def kalman_forecast(n, Z, a, P, T, V, h):
     forecasts = np.empty(n)
     se = np.empty(n)
     P = P.copy()
+    # T is a sparse companion matrix, so only its nonzero entries are visited
+    rows, cols = np.nonzero(T)
 
+    # the variances stop changing once the covariance reaches its steady state
+    steady = False
     for l in range(n):
         anew = T @ a
 
         a[:] = anew[:]
         forecasts[l] = anew @ Z
 
-        for i in range(p):
-            for j in range(p):
-                tmp = 0.0
-                for k in range(p):
-                    tmp += T[i, k] * P[k, j]
-                mm[i, j] = tmp
+        if steady:
+            se[l] = se[l - 1]
+            continue
 
-        for i in range(p):
+        mm[:] = 0.0
+        for k in range(len(rows)):
+            t = T[rows[k], cols[k]]
             for j in range(p):
-                tmp = V[i, j]
-                for k in range(p):
-                    tmp += mm[i, k] * T[j, k]
-                Pnew[i, j] = tmp
+                mm[rows[k], j] += t * P[cols[k], j]
+
+        Pnew[:] = V
+        for k in range(len(rows)):
+            t = T[rows[k], cols[k]]
+            for i in range(p):
+                Pnew[i, rows[k]] += mm[i, cols[k]] * t
 
         tmp = h
+        steady = True
         for i in range(p):
             for j in range(p):
+                if not abs(Pnew[i, j] - P[i, j]) <= sstol:
+                    steady = False
                 P[i, j] = Pnew[i, j]
                 tmp += Z[i] * Z[j] * P[i, j]
         se[l] = tmp
 
     return forecasts, se
 
-# %% ../nbs/src/arima.ipynb 42
+# %% ../nbs/src/arima.ipynb 57
 def checkarima(obj):
     if obj["var_coef"] is None:
         return False
     return any(np.isnan(np.sqrt(np.diag(obj["var_coef"]))))
 
-# %% ../nbs/src/arima.ipynb 43
+# %% ../nbs/src/arima.ipynb 58
 def predict_arima(model, n_ahead, newxreg=None, se_fit=True):
     myNCOL = lambda x: x.shape[1] if x is not None else 0
     # rsd = model['residuals']
@@ -1164,7 +1566,7 @@ def predict_arima(model, n_ahead, newxreg=None, se_fit=True):
 
     return pred
 
-# %% ../nbs/src/arima.ipynb 47
+# %% ../nbs/src/arima.ipynb 62
 def convert_coef_name(name, inverse=False):
     if not inverse:
         if "ex" in name:
@@ -1186,13 +1588,13 @@ def convert_coef_name(name, inverse=False):
         else:
             return name
 
-# %% ../nbs/src/arima.ipynb 48
+# %% ../nbs/src/arima.ipynb 63
 def change_drift_name(model_coef, inverse=False):
     return {
         convert_coef_name(name, inverse): value for name, value in model_coef.items()
     }
 
-# %% ../nbs/src/arima.ipynb 49
+# %% ../nbs/src/arima.ipynb 64
 def myarima(
     x,
     order=(0, 0, 0),
@@ -1288,7 +1690,35 @@ def myarima(
         raise e
         return {"ic": math.inf}
 
-# %% ../nbs/src/arima.ipynb 52
+# %% ../nbs/src/arima.ipynb 67
+def _search_arima_orders(max_p, max_q, max_P, max_Q, max_order, max_K):
+    # (p, q, P, Q, constant) of the models of the exhaustive search, in the order they're compared
+    return [
+        (i, j, I, J, K)
+        for i in range(max_p + 1)
+        for j in range(max_q + 1)
+        for I in range(max_P + 1)
+        for J in range(max_Q + 1)
+        if i + j + I + J <= max_order
+        for K in range(max_K + 1)
+    ]
+
+
+def _search_arima_fit(fit_fn, d, D, m, orders):
+    i, j, I, J, K = orders
+    return fit_fn(
+        order=(i, d, j), seasonal={"order": (I, D, J), "period": m}, constant=K == 1
+    )
+
+
+def _search_arima_executor(num_cores):
+    # the workers of a pool of processes are daemonic and can't start
+    # other processes, the models are fitted by threads inside them
+    if current_process().daemon:
+        return ThreadPoolExecutor(num_cores)
+    return ProcessPoolExecutor(num_cores)
+
+
 def search_arima(
     x,
     d=0,
@@ -1314,29 +1744,74 @@ def search_arima(
     m = period
     allow_drift = allow_drift and (d + D) == 1
     allow_mean = allow_mean and (d + D) == 0
-    # max_K = allow_drift or allow_mean
-
-    if not parallel:
-        best_ic = np.inf
-        for i in range(max_p):
-            for j in range(max_q):
-                for I in range(max_P):
-                    for J in range(max_Q):
-                        if i + j + I + J > max_order:
-                            continue
-                        fit = myarima(
-                            x,
-                            order=(i, d, j),
-                            seasonal={"order": (I, D, J), "period": m},
-                        )
-                        if fit["ic"] < best_ic:
-                            best_ic = fit["ic"]
-                            best_fit = fit
+    max_K = int(allow_drift or allow_mean)
+    p_myarima = partial(
+        myarima,
+        x=x,
+        ic=ic,
+        trace=trace,
+        approximation=approximation,
+        offset=0 if offset is None else offset,
+        xreg=xreg,
+        **kwargs,
+    )
+    candidates = _search_arima_orders(max_p, max_q, max_P, max_Q, max_order, max_K)
+    fit_candidate = partial(_search_arima_fit, p_myarima, d, D, m)
+    if parallel:
+        with _search_arima_executor(num_cores) as executor:
+            fits = list(executor.map(fit_candidate, candidates))
     else:
-        raise NotImplementedError("parallel=True")
+        fits = map(fit_candidate, candidates)
+    # the fits are compared in the order of the search, so that
+    # the first of the best ones is kept however they were computed
+    best_ic = math.inf
+    best_fit = None
+    for orders, fit in zip(candidates, fits):
+        if fit["ic"] < best_ic:
+            best_ic = fit["ic"]
+            best_fit = fit
+            constant = orders[4] == 1
+    if best_fit is None:
+        raise ValueError("No ARIMA model able to be estimated")
+    if approximation:
+        if trace:
+            print("\n\n Now re-fitting the best model(s) without approximations...\n")
+        arma = best_fit["arma"]
+        new_fit = p_myarima(
+            order=(arma[0], arma[5], arma[1]),
+            seasonal={"order": (arma[2], arma[6], arma[3]), "period": m},
+            constant=constant,
+            approximation=False,
+        )
+        if math.isinf(new_fit["ic"]):
+            best_fit = search_arima(
+                x,
+                d,
+                D,
+                max_p,
+                max_q,
+                max_P,
+                max_Q,
+                max_order,
+                stationary,
+                ic,
+                trace,
+                approximation=False,
+                xreg=xreg,
+                offset=offset,
+                allow_drift=allow_drift,
+                allow_mean=allow_mean,
+                parallel=parallel,
+                num_cores=num_cores,
+                period=period,
+                **kwargs,
+            )
+            best_fit["ic"] = math.inf
+        else:
+            best_fit = new_fit
     return best_fit
 
-# %% ../nbs/src/arima.ipynb 54
+# %% ../nbs/src/arima.ipynb 71
 def arima2(x, model, xreg, method):
     m = model["arma"][4]  # 5
     use_drift = "drift" in model["coef"].keys()
@@ -1403,7 +1878,7 @@ def arima2(x, model, xreg, method):
         refit["coef"] = change_drift_name(refit["coef"])
     return refit
 
-# %% ../nbs/src/arima.ipynb 55
+# %% ../nbs/src/arima.ipynb 72
 def Arima(
     x,
     order=(0, 0, 0),
@@ -1497,7 +1972,7 @@ def Arima(
         tmp["sigma2"] = np.nansum(tmp["residuals"] ** 2) / (nstar - npar + 1)
     return tmp
 
-# %% ../nbs/src/arima.ipynb 63
+# %% ../nbs/src/arima.ipynb 80
 def arima_string(model, padding=False):
     order = tuple(model["arma"][i] for i in [0, 5, 1, 2, 6, 3, 4])
     m = order[6]
@@ -1527,11 +2002,11 @@ def arima_string(model, padding=False):
 
     return result
 
-# %% ../nbs/src/arima.ipynb 66
+# %% ../nbs/src/arima.ipynb 83
 def is_constant(x):
     return np.all(x[0] == x)
 
-# %% ../nbs/src/arima.ipynb 67
+# %% ../nbs/src/arima.ipynb 84
 def forecast_arima(
     model,
     h=None,
@@ -1626,7 +2101,7 @@ def forecast_arima(
 
     return ans
 
-# %% ../nbs/src/arima.ipynb 74
+# %% ../nbs/src/arima.ipynb 91
 def fitted_arima(model, h=1):
     """Returns h-step forecasts for the data used in fitting the model."""
     if h == 1:
@@ -1642,7 +2117,7 @@ def fitted_arima(model, h=1):
     else:
         raise NotImplementedError("h > 1")
 
-# %% ../nbs/src/arima.ipynb 79
+# %% ../nbs/src/arima.ipynb 96
 def seas_heuristic(x, period):
     # nperiods = period > 1
     season = math.nan
@@ -1654,7 +2129,7 @@ def seas_heuristic(x, period):
         season = max(0, min(1, 1 - vare / np.var(remainder + seasonal, ddof=1)))
     return season
 
-# %% ../nbs/src/arima.ipynb 81
+# %% ../nbs/src/arima.ipynb 98
 def nsdiffs(x, test="seas", alpha=0.05, period=1, max_D=1, **kwargs):
     D = 0
     if alpha < 0.01:
@@ -1717,7 +2192,7 @@ def nsdiffs(x, test="seas", alpha=0.05, period=1, max_D=1, **kwargs):
             dodiff = False
     return D
 
-# %% ../nbs/src/arima.ipynb 83
+# %% ../nbs/src/arima.ipynb 100
 def ndiffs(x, alpha=0.05, test="kpss", kind="level", max_d=2):
     x = x[~np.isnan(x)]
     d = 0
@@ -1762,13 +2237,48 @@ def ndiffs(x, alpha=0.05, test="kpss", kind="level", max_d=2):
             return d - 1
     return d
 
-# %% ../nbs/src/arima.ipynb 85
+# %% ../nbs/src/arima.ipynb 102
 def newmodel(p, d, q, P, D, Q, constant, results):
     curr = np.array([p, d, q, P, D, Q, constant])
     in_results = (curr == results[:, :7]).all(1).any()
     return not in_results
 
-# %% ../nbs/src/arima.ipynb 87
+
+def _stepwise_neighbors(
+    p, q, P, Q, constant, max_p, max_q, max_P, max_Q, change_constant
+):
+    # (p, q, P, Q, constant) of the models around the current one, in the order the stepwise search tries them
+    moves = [
+        (0, 0, -1, 0),
+        (0, 0, 0, -1),
+        (0, 0, 1, 0),
+        (0, 0, 0, 1),
+        (0, 0, -1, -1),
+        (0, 0, -1, 1),
+        (0, 0, 1, -1),
+        (0, 0, 1, 1),
+        (-1, 0, 0, 0),
+        (0, -1, 0, 0),
+        (1, 0, 0, 0),
+        (0, 1, 0, 0),
+        (-1, -1, 0, 0),
+        (-1, 1, 0, 0),
+        (1, -1, 0, 0),
+        (1, 1, 0, 0),
+    ]
+    neighbors = [
+        (p + dp, q + dq, P + dP, Q + dQ, constant)
+        for dp, dq, dP, dQ in moves
+        if 0 <= p + dp <= max_p
+        and 0 <= q + dq <= max_q
+        and 0 <= P + dP <= max_P
+        and 0 <= Q + dQ <= max_Q
+    ]
+    if change_constant:
+        neighbors.append((p, q, P, Q, not constant))
+    return neighbors
+
+# %% ../nbs/src/arima.ipynb 104
 def auto_arima_f(
     x,
     d=None,
@@ -1808,11 +2318,6 @@ def auto_arima_f(
 ):
     if approximation is None:
         approximation = len(x) > 150 or period > 12
-    if stepwise and parallel:
-        warnings.warn(
-            "Parallel computer is only implemented when stepwise=FALSE, the model will be fit in serial."
-        )
-        parallel = False
     if trace and parallel:
         warnings.warn("Tracing model searching in parallel is not supported.")
         trace = False
@@ -2018,8 +2523,8 @@ def auto_arima_f(
             method=method,
             xreg=xreg,
             offset=offset,
-            allowdrift=allowdrift,
-            allowmean=allowmean,
+            allow_drift=allowdrift,
+            allow_mean=allowmean,
             parallel=parallel,
             num_cores=num_cores,
             period=m,
@@ -2104,6 +2609,42 @@ def auto_arima_f(
             p = q = P = Q = 0
         k += 1
 
+    if parallel:
+        # the untried neighbors of the best model are fitted at once and the search
+        # moves to the best of them, the first one if they're equal as in the serial search
+        fit_candidate = partial(_search_arima_fit, p_myarima, d, D, m)
+        improved = True
+        with _search_arima_executor(num_cores) as executor:
+            while improved and k < nmodels - 1:
+                candidates = [
+                    (p_, q_, P_, Q_, constant_)
+                    for p_, q_, P_, Q_, constant_ in _stepwise_neighbors(
+                        p,
+                        q,
+                        P,
+                        Q,
+                        constant,
+                        max_p,
+                        max_q,
+                        max_P,
+                        max_Q,
+                        allowdrift or allowmean,
+                    )
+                    if newmodel(p_, d, q_, P_, D, Q_, constant_, results[: k + 1])
+                ]
+                n_fits = min(len(candidates), nmodels - 1 - k)
+                fits = executor.map(fit_candidate, candidates[:n_fits])
+                improved = False
+                for (p_, q_, P_, Q_, constant_), fit in zip(candidates, fits):
+                    k += 1
+                    results[k] = (p_, d, q_, P_, D, Q_, constant_, fit["ic"])
+                    if fit["ic"] < bestfit["ic"]:
+                        bestfit = fit
+                        p, q, P, Q, constant = p_, q_, P_, Q_, constant_
+                        improved = True
+                if n_fits < len(candidates):
+                    k = nmodels
+
     def try_params(p, d, q, P, D, Q, constant, k, bestfit):
         k += 1
         improved = False
@@ -2120,7 +2661,7 @@ def auto_arima_f(
         return k, bestfit, improved
 
     startk = 0
-    while startk < k and k < nmodels:
+    while not parallel and startk < k and k < nmodels:
         startk = k
         if P > 0 and newmodel(p, d, q, P - 1, D, Q, constant, results[:k]):
             k, bestfit, improved = try_params(
@@ -2318,11 +2859,57 @@ def auto_arima_f(
 
     return bestfit
 
-# %% ../nbs/src/arima.ipynb 88
+# %% ../nbs/src/arima.ipynb 107
 def forward_arima(fitted_model, y, xreg=None, method="CSS-ML"):
     return Arima(x=y, model=fitted_model, xreg=xreg, method=method)
 
-# %% ../nbs/src/arima.ipynb 97
+# %% ../nbs/src/arima.ipynb 108
+def update_arima(model, y, xreg=None):
+    # filters the new observations `y` starting from the last state of `model`,
+    # which has to come from a maximum likelihood fit. As in `forward_arima`
+    # the variance of the fitted model is kept
+    coefs = np.array(list(model["coef"].values()))
+    narma = sum(model["arma"][:4])
+    n = model["x"].size
+    x = y.astype(np.float64)
+    if "drift" in model["coef"]:
+        drift = np.arange(n + 1, n + y.size + 1, dtype=np.float64).reshape(-1, 1)
+        xreg = drift if xreg is None else np.concatenate([drift, xreg], axis=1)
+    if coefs.size > narma:
+        newxreg = xreg
+        if list(model["coef"].keys())[narma] == "intercept":
+            intercept = np.ones((y.size, 1), dtype=np.float64)
+            newxreg = (
+                intercept if xreg is None else np.concatenate([intercept, xreg], axis=1)
+            )
+        x -= np.matmul(newxreg, coefs[narma:])
+    mod = {
+        **model["model"],
+        **{var: model["model"][var].copy() for var in ["a", "P", "Pn"]},
+    }
+    # up=-1 to keep predicting the covariance from the last state
+    _, _, _, resid = arima_like(
+        x,
+        mod["phi"],
+        mod["theta"],
+        mod["delta"],
+        mod["a"],
+        mod["P"],
+        mod["Pn"],
+        -1,
+        True,
+    )
+    nobs = model["nobs"] + (~np.isnan(x)).sum()
+    return {
+        **model,
+        "x": np.append(model["x"], y),
+        "xreg": None if model["xreg"] is None else np.vstack([model["xreg"], xreg]),
+        "residuals": np.append(model["residuals"], resid),
+        "nobs": nobs,
+        "model": mod,
+    }
+
+# %% ../nbs/src/arima.ipynb 119
 def print_statsforecast_ARIMA(model, digits=3, se=True):
     print(arima_string(model, padding=False))
     if model["lambda"] is not None:
@@ -2352,7 +2939,7 @@ def print_statsforecast_ARIMA(model, digits=3, se=True):
     if not np.isnan(model["aic"]):
         print(f'AIC={round(model["aic"], 2)}')
 
-# %% ../nbs/src/arima.ipynb 99
+# %% ../nbs/src/arima.ipynb 121
 class ARIMASummary:
     """ARIMA Summary."""
 
@@ -2365,12 +2952,16 @@ class ARIMASummary:
     def summary(self):
         return print_statsforecast_ARIMA(self.model)
 
-# %% ../nbs/src/arima.ipynb 100
+# %% ../nbs/src/arima.ipynb 122
 class AutoARIMA:
     """An AutoARIMA estimator.
 
     Returns best ARIMA model according to either AIC, AICc or BIC value.
     The function conducts a search over possible model within the order constraints provided.
+    The models are fitted with the exact gradient of their likelihood, up to version 1.5.0 it was
+    approximated by finite differences that stopped the fits earlier, so the selected orders can
+    differ from those versions. Fits whose moving average part ends on the non invertible boundary
+    are refitted inside it instead of being discarded.
 
     Parameters
     ----------
@@ -2470,11 +3061,13 @@ class AutoARIMA:
         mean forecasts and fitted values.
     parallel: bool (default False)
         If True and stepwise = False, then the specification search
-        is done in parallel.
+        is done in parallel. If True and stepwise = True, the neighbors
+        of the best model are fitted in parallel at each step and the
+        search moves to the best of them.
         This can give a significant speedup on multicore machines.
     num_cores: int (default 2)
         Allows the user to specify the amount of parallel processes to be used
-        if parallel = True and stepwise = False.
+        if parallel = True.
         If None, then the number of logical cores is
         automatically detected and all available cores are used.
     period: int (default 1)
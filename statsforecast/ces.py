@@ -239,7 +239,21 @@ def cesforecast(states, n, m, season, f, h, alpha_0, alpha_1, beta_0, beta_1):
     )
     return new_states
 
-# %% ../nbs/src/ces.ipynb 20
+# %% ../nbs/src/ces.ipynb 12
+@njit(nogil=NOGIL, cache=CACHE)
+def cesfilter(y, states, n, m, season, alpha_0, alpha_1, beta_0, beta_1, e):
+    # filters `y` starting from the states of the `n` previous observations
+    f = np.zeros(m)
+    for i in range(n + m, n + m + len(y)):
+        cesfcst(states, i, m, season, f, 1, alpha_0, alpha_1, beta_0, beta_1)
+        e[i - n - m] = y[i - n - m] - f[0]
+        cesupdate(states, i, m, season, alpha_0, alpha_1, beta_0, beta_1, y[i - n - m])
+    new_states = cesfcst(
+        states, n + len(y) + m, m, season, f, m, alpha_0, alpha_1, beta_0, beta_1
+    )
+    states[-m:] = new_states[-m:]
+
+# %% ../nbs/src/ces.ipynb 21
 @njit(nogil=NOGIL, cache=CACHE)
 def initparamces(
     alpha_0: float, alpha_1: float, beta_0: float, beta_1: float, seasontype: str
@@ -290,12 +304,12 @@ def initparamces(
         "optimize_beta_1": optimize_beta_1,
     }
 
-# %% ../nbs/src/ces.ipynb 22
+# %% ../nbs/src/ces.ipynb 23
 @njit(nogil=NOGIL, cache=CACHE)
 def switch_ces(x: str):
     return {"N": 0, "S": 1, "P": 2, "F": 3}[x]
 
-# %% ../nbs/src/ces.ipynb 24
+# %% ../nbs/src/ces.ipynb 25
 @njit(nogil=NOGIL, cache=CACHE)
 def pegelsresid_ces(
     y: np.ndarray,
@@ -332,7 +346,7 @@ def pegelsresid_ces(
             lik = np.nan
     return amse, e, states, lik
 
-# %% ../nbs/src/ces.ipynb 25
+# %% ../nbs/src/ces.ipynb 26
 @njit(nogil=NOGIL, cache=CACHE)
 def ces_target_fn(
     optimal_param,
@@ -402,7 +416,7 @@ def ces_target_fn(
         lik = -np.inf
     return lik
 
-# %% ../nbs/src/ces.ipynb 26
+# %% ../nbs/src/ces.ipynb 27
 def optimize_ces_target_fn(
     init_par, optimize_params, y, m, init_states, n_components, seasontype, nmse
 ):
@@ -448,7 +462,7 @@ def optimize_ces_target_fn(
     )
     return res
 
-# %% ../nbs/src/ces.ipynb 27
+# %% ../nbs/src/ces.ipynb 28
 def cesmodel(
     y: np.ndarray,
     m: int,
@@ -545,7 +559,7 @@ def cesmodel(
         sigma2=sigma2,
     )
 
-# %% ../nbs/src/ces.ipynb 29
+# %% ../nbs/src/ces.ipynb 30
 def pegelsfcast_C(h, obj, npaths=None, level=None, bootstrap=None):
     forecast = np.full(h, fill_value=np.nan)
     m = obj["m"]
@@ -562,7 +576,7 @@ def pegelsfcast_C(h, obj, npaths=None, level=None, bootstrap=None):
     )
     return forecast
 
-# %% ../nbs/src/ces.ipynb 30
+# %% ../nbs/src/ces.ipynb 31
 def _simulate_pred_intervals(model, h, level):
     np.random.seed(1)
     nsim = 5000
@@ -592,7 +606,7 @@ def _simulate_pred_intervals(model, h, level):
 
     return pi
 
-# %% ../nbs/src/ces.ipynb 31
+# %% ../nbs/src/ces.ipynb 32
 def forecast_ces(obj, h, level=None):
     fcst = pegelsfcast_C(h, obj)
     out = {"mean": fcst}
@@ -602,7 +616,7 @@ def forecast_ces(obj, h, level=None):
         out = {**out, **pi}
     return out
 
-# %% ../nbs/src/ces.ipynb 33
+# %% ../nbs/src/ces.ipynb 34
 def auto_ces(
     y,
     m,
@@ -667,7 +681,7 @@ def auto_ces(
         raise Exception("no model able to be fitted")
     return model
 
-# %% ../nbs/src/ces.ipynb 35
+# %% ../nbs/src/ces.ipynb 36
 def forward_ces(fitted_model, y):
     m = fitted_model["m"]
     model = fitted_model["seasontype"]
@@ -684,3 +698,31 @@ def forward_ces(fitted_model, y):
         beta_0=beta_0,
         beta_1=beta_1,
     )
+
+# %% ../nbs/src/ces.ipynb 38
+def update_ces(model, y):
+    # filters the new observations `y` starting from the last states of `model`
+    m = model["m"]
+    n = model["n"]
+    states = np.zeros((n + len(y) + 2 * m, model["states"].shape[1]), dtype=np.float32)
+    states[: n + m] = model["states"][: n + m]
+    e = np.full_like(y, fill_value=np.nan)
+    cesfilter(
+        y=y,
+        states=states,
+        n=n,
+        m=m,
+        season=switch_ces(model["seasontype"]),
+        e=e,
+        **model["par"]
+    )
+    e = np.append(model["residuals"], e)
+    np_ = states.shape[1] + 1
+    return {
+        **model,
+        "fitted": np.append(model["fitted"], y - e[n:]),
+        "residuals": e,
+        "states": states,
+        "n": e.size,
+        "sigma2": np.sum(e**2) / (e.size - np_ - 1),
+    }
@@ -1,17 +1,28 @@
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/src/core/core.ipynb.
 
 # %% auto 0
-__all__ = ['StatsForecast']
+__all__ = ['write_panel', 'PreparedPanel', 'StatsForecast']
 
 # %% ../nbs/src/core/core.ipynb 5
 import inspect
+import json
 import logging
+import mmap
+import multiprocessing
+import os
 import random
 import re
+import tempfile
+from collections import deque
+from contextlib import contextmanager
+from functools import lru_cache
 from itertools import product
+from multiprocessing import resource_tracker
+from multiprocessing.pool import ThreadPool
+from multiprocessing.shared_memory import SharedMemory
 from os import cpu_count
-from typing import Any, List, Optional, Union, Dict
-import pkg_resources
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Union
 
 from fugue.execution.factory import make_execution_engine
 import matplotlib.pyplot as plt
@@ -19,6 +30,10 @@ import matplotlib.colors as cm
 import numpy as np
 import pandas as pd
 import polars as pl
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset
+import pyarrow.parquet as pq
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 from tqdm.autonotebook import tqdm
@@ -36,6 +51,94 @@ if __name__ == "__main__":
 logger = logging.getLogger(__name__)
 
 # %% ../nbs/src/core/core.ipynb 9
+@lru_cache(maxsize=None)
+def _has_level(model_cls, attr):
+    return "level" in inspect.signature(getattr(model_cls, attr)).parameters
+
+
+class _OutputLayout:
+    """Columns of the outputs of the models in an output array.
+
+    The outputs of each model are found by their keys in its first result,
+    the following results are written into the same columns without
+    looking at the keys again. A single output fills all the columns
+    of its model."""
+
+    def __init__(self, models, cuts, matches, offset=0):
+        self.names = [repr(model) for model in models]
+        self.cuts = cuts
+        self.matches = matches
+        self.offset = offset
+        self.keys = [None] * len(models)
+        self.cols = [[] for _ in models]
+
+    def compile(self, i_model, keys):
+        keys = [key for key in keys if any(key.startswith(m) for m in self.matches)]
+        n_cols = self.cuts[i_model + 1] - self.cuts[i_model]
+        name = self.names[i_model]
+        if len(keys) > 1 and len(keys) != n_cols:
+            raise ValueError(
+                f"{name} returned {len(keys)} outputs ({keys}), expected {n_cols}."
+            )
+        self.keys[i_model] = keys
+        self.cols[i_model] = [
+            name if key == self.matches[0] else f"{name}-{key.replace('fitted-', '')}"
+            for key in keys
+        ]
+
+    def write(self, out, rows, i_model, res):
+        if self.keys[i_model] is None:
+            self.compile(i_model, res.keys())
+        start = self.offset + self.cuts[i_model]
+        keys = self.keys[i_model]
+        if len(keys) == 1:
+            end = self.offset + self.cuts[i_model + 1]
+            out[rows, start:end] = np.reshape(res[keys[0]], (-1, 1))
+            return
+        for j, key in enumerate(keys):
+            out[rows, start + j] = res[key]
+
+    @property
+    def all_cols(self):
+        return [col for cols_m in self.cols for col in cols_m]
+
+
+def _cv_fitted_spans(indptr, h, test_size, step_size, input_size):
+    # [start, end) of the training rows of each serie and window, from the start of the serie
+    ends = np.diff(indptr)[:, None] + np.arange(-test_size, -h + 1, step_size)
+    ends = np.maximum(ends, 0)
+    if input_size is None:
+        starts = np.zeros_like(ends)
+    else:
+        starts = np.maximum(ends - input_size, 0)
+    return np.stack([starts, ends], axis=-1)
+
+
+def _cv_fitted_offsets(spans):
+    # first row of each serie and window in the fitted values, which are stored
+    # one serie after the other and the windows of each serie one after the other
+    sizes = spans[..., 1] - spans[..., 0]
+    return np.append(0, np.cumsum(sizes)).astype(np.int64)
+
+
+def _cv_fitted_windows(spans, indptr):
+    # rows of the fitted values and of the series in the training sets of each window,
+    # with the last row of the training set of each one
+    sizes = spans[..., 1] - spans[..., 0]
+    offsets = _cv_fitted_offsets(spans)[:-1].reshape(sizes.shape)
+    firsts = indptr[:-1, None] + spans[..., 0]
+    for i_window in range(sizes.shape[1]):
+        keep = sizes[:, i_window] > 0
+        size, first = sizes[keep, i_window], firsts[keep, i_window]
+        # position of each row in its training set
+        pos = np.arange(size.sum()) - np.repeat(np.cumsum(size) - size, size)
+        yield (
+            np.repeat(offsets[keep, i_window], size) + pos,
+            np.repeat(first, size) + pos,
+            np.repeat(first + size - 1, size),
+        )
+
+
 class GroupedArray:
     def __init__(self, data, indptr):
         self.data = data
@@ -83,10 +186,7 @@ class GroupedArray:
         cuts[0] = 0
         for i_model, model in enumerate(models):
             len_cols = 1  # mean
-            has_level = (
-                "level" in inspect.signature(getattr(model, attr)).parameters
-                and len(level) > 0
-            )
+            has_level = len(level) > 0 and _has_level(type(model), attr)
             has_level_models[i_model] = has_level
             if has_level:
                 len_cols += 2 * len(level)  # levels
@@ -109,35 +209,20 @@ class GroupedArray:
         fcsts, cuts, has_level_models = self._output_fcst(
             models=fm[0], attr="predict", h=h, X=X, level=level
         )
-        matches = ["mean", "lo", "hi"]
-        cols = []
+        layout = _OutputLayout(models=fm[0], cuts=cuts, matches=["mean", "lo", "hi"])
         for i_model in range(fm.shape[1]):
             has_level = has_level_models[i_model]
             kwargs = {}
             if has_level:
                 kwargs["level"] = level
-            for i, _ in enumerate(self):
+            for i in range(self.n_groups):
                 if X is not None:
                     X_ = X[i]
                 else:
                     X_ = None
                 res_i = fm[i, i_model].predict(h=h, X=X_, **kwargs)
-                cols_m = [
-                    key
-                    for key in res_i.keys()
-                    if any(key.startswith(m) for m in matches)
-                ]
-                fcsts_i = np.vstack([res_i[key] for key in cols_m]).T
-                model_name = repr(fm[i, i_model])
-                cols_m = [
-                    f"{model_name}" if col == "mean" else f"{model_name}-{col}"
-                    for col in cols_m
-                ]
-                if fcsts_i.ndim == 1:
-                    fcsts_i = fcsts_i[:, None]
-                fcsts[i * h : (i + 1) * h, cuts[i_model] : cuts[i_model + 1]] = fcsts_i
-            cols += cols_m
-        return fcsts, cols
+                layout.write(fcsts, slice(i * h, (i + 1) * h), i_model, res_i)
+        return fcsts, layout.all_cols
 
     def fit_predict(self, models, h, X=None, level=tuple()):
         # fitted models
@@ -146,6 +231,39 @@ class GroupedArray:
         fcsts, cols = self.predict(fm=fm, h=h, X=X, level=level)
         return fm, fcsts, cols
 
+    def _forecast_panel(self, model, h, fitted, out, fitted_out, level, fallback_model):
+        # models can forecast all the series in a single call when they
+        # implement `_forecast_panel`, the ones that can't compute the fitted
+        # values don't take `fitted`. Returns the output columns or None if
+        # the series have to be forecasted one by one.
+        if not hasattr(model, "_forecast_panel"):
+            return None
+        if self.data.ndim == 2 and self.data.shape[1] > 1:
+            return None
+        kwargs = {} if level is None else {"level": level}
+        if fitted:
+            if "fitted" not in inspect.signature(model._forecast_panel).parameters:
+                return None
+            kwargs["fitted"] = fitted
+        y = self.data[:, 0] if self.data.ndim == 2 else self.data
+        y = np.ascontiguousarray(y)
+        if fitted_out is None:
+            fitted_out = np.empty((0, out.shape[1]), dtype=out.dtype)
+        try:
+            return model._forecast_panel(
+                y=y,
+                indptr=self.indptr,
+                h=h,
+                out=out,
+                fitted_out=fitted_out,
+                **kwargs,
+            )
+        except Exception:
+            if fallback_model is None:
+                raise
+            # the serial path uses the fallback model in the series that fail
+            return None
+
     def forecast(
         self,
         models,
@@ -159,8 +277,14 @@ class GroupedArray:
         fcsts, cuts, has_level_models = self._output_fcst(
             models=models, attr="forecast", h=h, X=X, level=level
         )
-        matches = ["mean", "lo", "hi"]
-        matches_fitted = ["fitted", "fitted-lo", "fitted-hi"]
+        layout = _OutputLayout(models=models, cuts=cuts, matches=["mean", "lo", "hi"])
+        # first column of the fitted values is the actual y
+        fitted_layout = _OutputLayout(
+            models=models,
+            cuts=cuts,
+            matches=["fitted", "fitted-lo", "fitted-hi"],
+            offset=1,
+        )
         if fitted:
             # for the moment we dont return levels for fitted values in
             # forecast mode
@@ -171,9 +295,36 @@ class GroupedArray:
                 fitted_vals[:, 0] = self.data
             else:
                 fitted_vals[:, 0] = self.data[:, 0]
-        iterable = tqdm(
-            enumerate(self), disable=(not verbose), total=len(self), desc="Forecast"
-        )
+        serial_models = []
+        for i_model, model in enumerate(models):
+            panel_cols = None
+            if X is None:
+                panel_cols = self._forecast_panel(
+                    model=model,
+                    h=h,
+                    fitted=fitted,
+                    out=fcsts[:, cuts[i_model] : cuts[i_model + 1]],
+                    fitted_out=fitted_vals[
+                        :, (cuts[i_model] + 1) : (cuts[i_model + 1] + 1)
+                    ]
+                    if fitted
+                    else None,
+                    level=level if has_level_models[i_model] else None,
+                    fallback_model=fallback_model,
+                )
+            if panel_cols is None:
+                serial_models.append(i_model)
+                continue
+            cols_m, cols_m_fitted = panel_cols
+            layout.compile(i_model, cols_m)
+            if fitted:
+                fitted_layout.compile(i_model, cols_m_fitted)
+        if serial_models:
+            iterable = tqdm(
+                enumerate(self), disable=(not verbose), total=len(self), desc="Forecast"
+            )
+        else:
+            iterable = []
         for i, grp in iterable:
             y_train = grp[:, 0] if grp.ndim == 2 else grp
             X_train = grp[:, 1:] if (grp.ndim == 2 and grp.shape[1] > 1) else None
@@ -181,9 +332,8 @@ class GroupedArray:
                 X_f = X[i]
             else:
                 X_f = None
-            cols = []
-            cols_fitted = []
-            for i_model, model in enumerate(models):
+            for i_model in serial_models:
+                model = models[i_model]
                 has_level = has_level_models[i_model]
                 kwargs = {}
                 if has_level:
@@ -204,42 +354,18 @@ class GroupedArray:
                         )
                     else:
                         raise error
-                cols_m = [
-                    key
-                    for key in res_i.keys()
-                    if any(key.startswith(m) for m in matches)
-                ]
-                fcsts_i = np.vstack([res_i[key] for key in cols_m]).T
-                cols_m = [
-                    f"{repr(model)}" if col == "mean" else f"{repr(model)}-{col}"
-                    for col in cols_m
-                ]
-                if fcsts_i.ndim == 1:
-                    fcsts_i = fcsts_i[:, None]
-                fcsts[i * h : (i + 1) * h, cuts[i_model] : cuts[i_model + 1]] = fcsts_i
-                cols += cols_m
+                layout.write(fcsts, slice(i * h, (i + 1) * h), i_model, res_i)
                 if fitted:
-                    cols_m_fitted = [
-                        key
-                        for key in res_i.keys()
-                        if any(key.startswith(m) for m in matches_fitted)
-                    ]
-                    fitted_i = np.vstack([res_i[key] for key in cols_m_fitted]).T
-                    cols_m_fitted = [
-                        f"{repr(model)}"
-                        if col == "fitted"
-                        else f"{repr(model)}-{col.replace('fitted-', '')}"
-                        for col in cols_m_fitted
-                    ]
-                    fitted_vals[
-                        self.indptr[i] : self.indptr[i + 1],
-                        (cuts[i_model] + 1) : (cuts[i_model + 1] + 1),
-                    ] = fitted_i
-                    cols_fitted += cols_m_fitted
-        result = {"forecasts": fcsts, "cols": cols}
+                    fitted_layout.write(
+                        fitted_vals,
+                        slice(self.indptr[i], self.indptr[i + 1]),
+                        i_model,
+                        res_i,
+                    )
+        result = {"forecasts": fcsts, "cols": layout.all_cols}
         if fitted:
             result["fitted"] = {"values": fitted_vals}
-            result["fitted"]["cols"] = ["y"] + cols_fitted
+            result["fitted"]["cols"] = ["y"] + fitted_layout.all_cols
         return result
 
     def cross_validation(
@@ -268,13 +394,24 @@ class GroupedArray:
             (self.n_groups, n_windows, h, 1 + cuts[-1]), np.nan, dtype=np.float32
         )
         if fitted:
+            # only the training rows of each window are stored
+            fitted_spans = _cv_fitted_spans(
+                self.indptr, h, test_size, step_size, input_size
+            )
+            fitted_offsets = _cv_fitted_offsets(fitted_spans)
             fitted_vals = np.full(
-                (self.data.shape[0], n_windows, n_models + 1), np.nan, dtype=np.float32
+                (fitted_offsets[-1], n_models + 1), np.nan, dtype=np.float32
             )
-            fitted_idxs = np.full((self.data.shape[0], n_windows), False, dtype=bool)
-            last_fitted_idxs = np.full_like(fitted_idxs, False, dtype=bool)
-        matches = ["mean", "lo", "hi"]
+        # first column of out is the actual y
+        layout = _OutputLayout(
+            models=models, cuts=cuts, matches=["mean", "lo", "hi"], offset=1
+        )
         steps = list(range(-test_size, -h + 1, step_size))
+        # without refit the models are only trained on the first window
+        refit_every = int(refit)
+        # with expanding windows the models that support it only filter
+        # the observations after the previous cutoff
+        incremental = input_size is None
         for i_ts, grp in enumerate(self):
             iterable = tqdm(
                 enumerate(steps, start=0),
@@ -282,6 +419,7 @@ class GroupedArray:
                 disable=(not verbose),
                 total=len(steps),
             )
+            states = [None] * n_models
             for i_window, cutoff in iterable:
                 end_cutoff = cutoff + h
                 in_size_disp = cutoff if input_size is None else input_size
@@ -296,22 +434,17 @@ class GroupedArray:
                 )
                 out[i_ts, i_window, :, 0] = y_test[:, 0] if y.ndim == 2 else y_test
                 if fitted:
-                    fitted_vals[self.indptr[i_ts] : self.indptr[i_ts + 1], i_window, 0][
-                        (cutoff - in_size_disp) : cutoff
-                    ] = y_train
-                    fitted_idxs[self.indptr[i_ts] : self.indptr[i_ts + 1], i_window][
-                        (cutoff - in_size_disp) : cutoff
-                    ] = True
-                    last_fitted_idxs[
-                        self.indptr[i_ts] : self.indptr[i_ts + 1], i_window
-                    ][cutoff - 1] = True
-                cols = ["y"]
+                    i_fitted = i_ts * n_windows + i_window
+                    fitted_rows = slice(
+                        fitted_offsets[i_fitted], fitted_offsets[i_fitted + 1]
+                    )
+                    fitted_vals[fitted_rows, 0] = y_train
                 for i_model, model in enumerate(models):
                     has_level = has_level_models[i_model]
                     kwargs = {}
                     if has_level:
                         kwargs["level"] = level
-                    if refit:
+                    if refit_every == 1:
                         try:
                             res_i = model.forecast(
                                 h=h,
@@ -334,22 +467,34 @@ class GroupedArray:
                             else:
                                 raise error
                     else:
-                        if i_window == 0:
+                        if i_window % (refit_every or n_windows) == 0:
                             # for the first window we have to fit each model
                             model = model.fit(y=y_train, X=X_train)
+                            states[i_model] = None
                             if fallback_model is not None:
                                 fallback_model = fallback_model.fit(
                                     y=y_train, X=X_train
                                 )
                         try:
-                            res_i = model.forward(
-                                h=h,
-                                y=y_train,
-                                X=X_train,
-                                X_future=X_future,
-                                fitted=fitted,
-                                **kwargs,
-                            )
+                            if incremental and hasattr(model, "_forward_update"):
+                                res_i, states[i_model] = model._forward_update(
+                                    states[i_model],
+                                    h=h,
+                                    y=y_train,
+                                    X=X_train,
+                                    X_future=X_future,
+                                    fitted=fitted,
+                                    **kwargs,
+                                )
+                            else:
+                                res_i = model.forward(
+                                    h=h,
+                                    y=y_train,
+                                    X=X_train,
+                                    X_future=X_future,
+                                    fitted=fitted,
+                                    **kwargs,
+                                )
                         except Exception as error:
                             if fallback_model is not None:
                                 res_i = fallback_model.forward(
@@ -362,32 +507,17 @@ class GroupedArray:
                                 )
                             else:
                                 raise error
-                    cols_m = [
-                        key
-                        for key in res_i.keys()
-                        if any(key.startswith(m) for m in matches)
-                    ]
-                    fcsts_i = np.vstack([res_i[key] for key in cols_m]).T
-                    cols_m = [
-                        f"{repr(model)}" if col == "mean" else f"{repr(model)}-{col}"
-                        for col in cols_m
-                    ]
-                    out[
-                        i_ts, i_window, :, (1 + cuts[i_model]) : (1 + cuts[i_model + 1])
-                    ] = fcsts_i
+                    layout.write(out[i_ts, i_window], slice(None), i_model, res_i)
                     if fitted:
-                        fitted_vals[
-                            self.indptr[i_ts] : self.indptr[i_ts + 1],
-                            i_window,
-                            i_model + 1,
-                        ][(cutoff - in_size_disp) : cutoff] = res_i["fitted"]
-                    cols += cols_m
-        result = {"forecasts": out.reshape(-1, 1 + cuts[-1]), "cols": cols}
+                        fitted_vals[fitted_rows, i_model + 1] = res_i["fitted"]
+        result = {
+            "forecasts": out.reshape(-1, 1 + cuts[-1]),
+            "cols": ["y"] + layout.all_cols,
+        }
         if fitted:
             result["fitted"] = {
                 "values": fitted_vals,
-                "idxs": fitted_idxs,
-                "last_idxs": last_fitted_idxs,
+                "spans": fitted_spans,
                 "cols": ["y"] + [repr(model) for model in models],
             }
         return result
@@ -406,7 +536,57 @@ class GroupedArray:
             if x.size
         ]
 
-# %% ../nbs/src/core/core.ipynb 22
+# %% ../nbs/src/core/core.ipynb 23
+def _pl_to_numpy(ser):
+    # polars strings without nulls are read as numpy strings instead of objects
+    arr = ser.to_numpy()
+    if ser.dtype == pl.Utf8 and not ser.has_validity():
+        arr = arr.astype(str)
+    return arr
+
+
+def _columns_dict(values, cols):
+    # columns of a 2d array by name, to build a DataFrame at once
+    if cols is None:
+        return {}
+    return {col: values[:, i] for i, col in enumerate(cols)}
+
+
+def _group_starts(unique_id):
+    # positions where a run of equal ids begins
+    is_start = np.empty(unique_id.size, dtype=bool)
+    is_start[:1] = True
+    is_start[1:] = unique_id[1:] != unique_id[:-1]
+    return np.flatnonzero(is_start)
+
+
+def _is_sorted(unique_id, ds, starts):
+    # linear check that every serie is a single run, the runs are in increasing
+    # order of their ids and the rows of each run are in increasing order of time
+    if isinstance(unique_id, (pd.Series, pd.Index)) and isinstance(
+        unique_id.dtype, pd.CategoricalDtype
+    ):
+        unique_id = np.asarray(
+            unique_id.cat.codes if isinstance(unique_id, pd.Series) else unique_id.codes
+        )
+    run_ids = np.asarray(unique_id)[starts]
+    try:
+        if not (run_ids[1:] > run_ids[:-1]).all():
+            return False
+    except TypeError:
+        return False
+    ds = np.asarray(ds)
+    in_run = np.ones(ds.size, dtype=bool)
+    in_run[starts] = False
+    return bool((ds[1:] >= ds[:-1])[in_run[1:]].all())
+
+
+def _sort_order(unique_id, ds):
+    # positions of the rows sorted by serie and time
+    codes, _ = pd.factorize(unique_id, sort=True)
+    return np.lexsort((np.asarray(ds), codes))
+
+
 class DataFrameProcessing:
     """
     A utility to process Pandas or Polars dataframes for time series forecasting.
@@ -431,7 +611,7 @@ class DataFrameProcessing:
         sorts the dataframe if required, and separates the data into different
         arrays for future operations.
     _to_np_and_engine():
-        Converts the dataframe to a numpy structured array and identifies the
+        Reads the columns of the dataframe as numpy arrays and identifies the
         dataframe engine (pandas or polars).
     _validate_dataframe(dataframe: Union[pd.DataFrame, pl.DataFrame]):
         Checks if the required columns ('unique_id', 'ds', 'y') are present in the
@@ -460,66 +640,57 @@ class DataFrameProcessing:
     def __call__(self):
         """Sequential execution of the code"""
         # Declaring values that will be utilized
-        self.np_df = self._to_np_and_engine()
-        self.dataframe_columns = self.np_df.dtype.names
+        columns, order, starts = self._to_np_and_engine()
+        self.dataframe_columns = tuple(columns)
+        take = (lambda arr: arr) if order is None else (lambda arr: arr[order])
 
-        # Processing value columns
+        # Processing value columns, each of them is read as a float array
+        # and a single float column is used without copying it
         value_columns = [
             column
             for column in self.dataframe_columns
             if column not in self.non_value_columns
         ]
-        self.value_array = self.np_df[value_columns]
-        if self.value_array.ndim == 1 and len(value_columns) > 1:
-            self.value_array = np.stack(
-                [
-                    self.value_array[name].astype(float)
-                    for name in self.value_array.dtype.names
-                ],
-                axis=1,
-            )
-        if self.value_array.ndim == 1 and len(value_columns) == 1:
-            self.value_array = (
-                self.value_array[value_columns].astype(float).reshape(-1, 1)
+        if len(value_columns) == 1 and order is None:
+            self.value_array = np.asarray(
+                columns[value_columns[0]], dtype=np.float64
+            ).reshape(-1, 1)
+        else:
+            self.value_array = np.empty(
+                (len(columns["unique_id"]), len(value_columns)), dtype=np.float64
             )
+            for i, column in enumerate(value_columns):
+                self.value_array[:, i] = take(columns[column])
 
-        # Processing unique_id
-        self.unique_id = self.np_df["unique_id"]
-        if self.unique_id.dtype.kind == "O":
-            self.unique_id.astype(str)
+        # Processing unique_id, the series are the runs of equal ids
+        self.unique_id = take(columns["unique_id"])
+        if starts is None:
+            starts = _group_starts(self.unique_id)
+        self.indptr = np.append(starts, self.unique_id.size).astype(np.int32)
+        indices = self.unique_id[starts]
 
         # If values are already int or float then they won't be converted
-        if self.unique_id.dtype.kind not in ["i", "f"]:
+        if indices.dtype.kind not in ["i", "f"]:
             # If all values in the numpy array are numerical then proceed with conversion
-            if np.char.isnumeric(self.unique_id.astype(str)).all():
+            if np.char.isnumeric(indices.astype(str)).all():
                 # If number are whole then they will be converted to `int`, else `float`
                 # This is pure aesthetics addition.
-                self.unique_id = self.unique_id.astype(float)
-                if np.isclose(self.unique_id, np.round(self.unique_id)).all():
-                    self.unique_id = self.unique_id.astype(int)
-        # NOTE: When sorting with Numpy, character values may be prioritized over numerical values if the data
-        # type is set to 'object'. For instance, the value '10' would come before '3' because it contains '1' and '0'
-        # at the beginning. One solution to this problem is to convert the data to 'float' if it is numerical.
-        unique_id_count = pd.Series(self.unique_id).value_counts(sort=False)
-        self.indices, sizes = unique_id_count.index, unique_id_count.values
-        cum_sizes = np.cumsum(sizes)
+                indices = indices.astype(float)
+                if np.isclose(indices, np.round(indices)).all():
+                    indices = indices.astype(int)
+        self.indices = pd.Index(indices)
 
         # Processing datestamp
-        self.dates = self.np_df[self.datetime_column_name]
+        self.ds = take(columns["ds"])
+        self.dates = self.ds[self.indptr[1:] - 1]
         if self.engine_dataframe == pd.DataFrame:
-            self.dates = self.dataframe.index.get_level_values(
-                self.datetime_column_name
-            )
-        self.dates = self.dates[cum_sizes - 1]
-        self.indptr = np.append(0, cum_sizes).astype(np.int32)
-
-        # Index that will be used by pandas, not polars
-        self.index = pd.MultiIndex.from_arrays(
-            [
-                self.np_df["unique_id"],
-                self.np_df["ds"],
-            ],
-            names=["unique_id", "ds"],
+            self.dates = pd.Index(self.dates, name=self.datetime_column_name)
+
+    @property
+    def index(self):
+        # row level index, only built when it's needed by the pandas fitted values
+        return pd.MultiIndex.from_arrays(
+            [self.unique_id, self.ds], names=["unique_id", "ds"]
         )
 
     def grouped_array(self):
@@ -527,11 +698,12 @@ class DataFrameProcessing:
 
     def _to_np_and_engine(self):
         """
-        This function will be utilised to convert DataFrame to dictionary.
+        Reads the columns of the DataFrame as numpy arrays, without building records.
 
         Returns:
-            tuple[pd.DataFrame or pl.DataFrame, dict]: the engine that will be used to construct
-                the output DataFrame and dictionary of DataFrame values
+            tuple[dict, np.ndarray or None, np.ndarray or None]: arrays of the columns, with `unique_id`
+                and `ds` first, the positions that sort them by serie and time, None if they're already
+                sorted, and the starts of the series when they were found while checking the order
 
         Raises:
             ValueError: If DataFrame engine is not supported and/or accounted for.
@@ -556,36 +728,25 @@ class DataFrameProcessing:
                     pl.from_numpy(processed_dt_arr.to_numpy(), schema=["ds"])
                 )
 
-            sample_index_df = self.dataframe[self.non_value_columns]
-            sorted_index_df = sample_index_df.sort(self.non_value_columns)
-            is_monotonic_increasing = sample_index_df.frame_equal(sorted_index_df)
-
+            columns = {
+                column: _pl_to_numpy(self.dataframe[column])
+                for column in self.non_value_columns
+            }
+            starts = _group_starts(columns["unique_id"])
             # Sorting will be performed if sort is set to true and values are unsorted
-            if not is_monotonic_increasing and self.sort_dataframe:
+            if self.sort_dataframe and not _is_sorted(
+                columns["unique_id"], columns["ds"], starts
+            ):
                 self.dataframe = self.dataframe.sort(self.non_value_columns)
-
-            # resources: https://github.com/pola-rs/polars/blob/4fca1ae51864f74e0367d8bc91b4a2db00e54174/py-polars/polars/dataframe/frame.py#L1975
-            # resources: https://numpy.org/doc/stable/user/basics.rec.html
-            # resources: https://numpy.org/doc/stable/reference/generated/numpy.core.records.fromarrays.html
-            # NOTE: Structured array is not available in polars under the version 0.17.12
-            pl_version = pkg_resources.get_distribution("polars").version
-            min_pl_v = pkg_resources.parse_version("0.17.12")
-            if pkg_resources.parse_version(pl_version) >= min_pl_v:
-                return self.dataframe.to_numpy(structured=True)
-            else:
-                arrays = []
-                for column, column_dtype in self.dataframe.schema.items():
-                    ser = self.dataframe[column]
-                    arr = ser.to_numpy()
-                    arrays.append(
-                        arr.astype(str, copy=False)
-                        if str(column_dtype) == "Utf8" and not ser.has_validity()
-                        else arr
-                    )
-                arr_dtypes = list(
-                    zip(self.dataframe.columns, (a.dtype for a in arrays))
-                )
-                return np.rec.fromarrays(arrays, dtype=np.dtype(arr_dtypes))
+                columns = {
+                    column: _pl_to_numpy(self.dataframe[column])
+                    for column in self.non_value_columns
+                }
+                starts = None
+            for column in self.dataframe.columns:
+                if column not in self.non_value_columns:
+                    columns[column] = _pl_to_numpy(self.dataframe[column])
+            return columns, None, starts
 
         ####################
         # Pandas DataFrame #
@@ -593,39 +754,35 @@ class DataFrameProcessing:
         elif isinstance(self.dataframe, pd.DataFrame):
             self.engine_dataframe = pd.DataFrame
             # Ensure that all required columns are present in the DataFrame:
+            uid_in_index = self.dataframe.index.name == "unique_id"
+            # only the names of the columns are needed
+            df_columns = (
+                self.dataframe.head(0).reset_index() if uid_in_index else self.dataframe
+            )
             # Full validation
-            if self.validate and self.dataframe.index.name == "unique_id":
-                reset_df = self.dataframe.reset_index()
-                self._validate_dataframe(reset_df)
-                del reset_df
-
-            elif self.validate and self.dataframe.index.name != "unique_id":
-                self._validate_dataframe(self.dataframe)
-                self.dataframe = self.dataframe.set_index("unique_id")
-
+            if self.validate:
+                self._validate_dataframe(df_columns)
             # Partial validation
-            elif self.validate == False and self.dataframe.index.name == "unique_id":
-                reset_df = self.dataframe.reset_index()
-                self._partial_val_df(reset_df)
-                del reset_df
-
-            elif self.validate == False and self.dataframe.index.name != "unique_id":
-                self._partial_val_df(self.dataframe)
-                self.dataframe = self.dataframe.set_index("unique_id")
+            elif self.validate == False:
+                self._partial_val_df(df_columns)
 
+            unique_id = (
+                self.dataframe.index if uid_in_index else self.dataframe["unique_id"]
+            )
             # Datetime check
-            dt_arr = self.dataframe["ds"].values
-            self.dataframe["ds"] = self._check_datetime(dt_arr)
-
-            self.dataframe = self.dataframe.set_index("ds", append=True)
+            ds = self._check_datetime(self.dataframe["ds"].values)
+            columns = {"unique_id": np.asarray(unique_id), "ds": ds}
+            for column in self.dataframe.columns:
+                if column not in self.non_value_columns:
+                    columns[column] = self.dataframe[column].values
 
             # Sorting will be performed if sort is set to true and values are unsorted
-            if not self.dataframe.index.is_monotonic_increasing and self.sort_dataframe:
-                self.dataframe = self.dataframe.sort_values(self.non_value_columns)
-
-            np_df = self.dataframe.to_records(index=True)
-
-            return np_df
+            order = None
+            starts = _group_starts(columns["unique_id"])
+            if self.sort_dataframe and not _is_sorted(unique_id, ds, starts):
+                order = _sort_order(unique_id, ds)
+                starts = None
+            return columns, order, starts
 
         ####################
         # Not Supported DF #
@@ -696,46 +853,363 @@ class DataFrameProcessing:
                 raise Exception(msg) from e
         return arr
 
-# %% ../nbs/src/core/core.ipynb 25
-def _cv_dates(last_dates, freq, h, test_size, step_size=1):
-    # assuming step_size = 1
-    if (test_size - h) % step_size:
-        raise Exception("`test_size - h` should be module `step_size`")
-    n_windows = int((test_size - h) / step_size) + 1
-    if len(np.unique(last_dates)) == 1:
-        if issubclass(last_dates.dtype.type, np.integer):
-            total_dates = np.arange(last_dates[0] - test_size + 1, last_dates[0] + 1)
-            out = np.empty((h * n_windows, 2), dtype=last_dates.dtype)
-            freq = 1
-        else:
-            total_dates = pd.date_range(end=last_dates[0], periods=test_size, freq=freq)
-            out = np.empty((h * n_windows, 2), dtype="datetime64[s]")
-        for i_window, cutoff in enumerate(
-            range(-test_size, -h + 1, step_size), start=0
-        ):
-            end_cutoff = cutoff + h
-            out[h * i_window : h * (i_window + 1), 0] = (
-                total_dates[cutoff:]
-                if end_cutoff == 0
-                else total_dates[cutoff:end_cutoff]
-            )
-            out[h * i_window : h * (i_window + 1), 1] = np.tile(
-                total_dates[cutoff] - freq, h
-            )
-        dates = pd.DataFrame(
-            np.tile(out, (len(last_dates), 1)), columns=["ds", "cutoff"]
+# %% ../nbs/src/core/core.ipynb 28
+def write_panel(
+    df: Union[pd.DataFrame, pl.DataFrame, Iterable[Union[pd.DataFrame, pl.DataFrame]]],
+    path: Union[str, os.PathLike],
+    sort_df: bool = True,
+):
+    """Write a panel to disk.
+
+    The values, datestamps and ids of the series are stored in `path` so that `StatsForecast`
+    can memory map them instead of holding the whole panel in memory, pass `path` as the `df`
+    argument of its methods to use it. Only the pages of the series that are being processed
+    are read and the parallel jobs map the same files.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame | polars.DataFrame or iterable of them
+        DataFrame with columns [`unique_id`, `ds`, `y`] and exogenous.
+        An iterable of DataFrames is written one at a time, each serie must be contained in a single DataFrame.
+    path : str or os.PathLike
+        Directory where the panel is stored.
+    sort_df : bool (default=True)
+        If True, sort each DataFrame by [`unique_id`,`ds`].
+    """
+    if isinstance(df, (pd.DataFrame, pl.DataFrame)):
+        df = [df]
+    path = Path(path)
+    path.mkdir(parents=True, exist_ok=True)
+    meta = None
+    uid_chunks, sizes, last_dates = [], [], []
+    with open(path / "values.bin", "wb") as values_f, open(
+        path / "ds.bin", "wb"
+    ) as ds_f:
+        for chunk in df:
+            df_process = DataFrameProcessing(chunk, sort_df)
+            values = np.ascontiguousarray(df_process.value_array)
+            ds = np.asarray(df_process.ds)
+            chunk_meta = {
+                "columns": [
+                    c
+                    for c in df_process.dataframe_columns
+                    if c not in df_process.non_value_columns
+                ],
+                "values_dtype": values.dtype.str,
+                "ds_dtype": ds.dtype.str,
+            }
+            if meta is None:
+                meta = chunk_meta
+            elif chunk_meta != meta:
+                raise ValueError(
+                    "All the DataFrames must have the same columns and types."
+                )
+            values.tofile(values_f)
+            ds.tofile(ds_f)
+            uid_chunks.append(np.asarray(df_process.indices))
+            sizes.append(np.diff(df_process.indptr))
+            last_dates.append(np.asarray(df_process.dates))
+    if meta is None:
+        raise ValueError("`df` must contain at least one DataFrame.")
+    uids = np.hstack(uid_chunks)
+    if uids.dtype.kind == "O":
+        uids = uids.astype(str)
+    if not pd.Index(uids).is_unique:
+        raise ValueError("Each serie must be contained in a single DataFrame.")
+    # int64 since large panels can have more than 2^31 rows
+    indptr = np.append(0, np.cumsum(np.hstack(sizes))).astype(np.int64)
+    np.save(path / "indptr.npy", indptr)
+    np.save(path / "uids.npy", uids)
+    np.save(path / "last_dates.npy", np.hstack(last_dates))
+    (path / "meta.json").write_text(json.dumps(meta))
+
+# %% ../nbs/src/core/core.ipynb 29
+def _read_panel(path):
+    # memory maps the values of a panel written by `write_panel`
+    path = Path(path)
+    meta = json.loads((path / "meta.json").read_text())
+    indptr = np.load(path / "indptr.npy")
+    data = np.memmap(
+        path / "values.bin",
+        dtype=meta["values_dtype"],
+        mode="r",
+        shape=(indptr[-1], len(meta["columns"])),
+    )
+    uids = pd.Index(np.load(path / "uids.npy"))
+    last_dates = pd.Index(np.load(path / "last_dates.npy"))
+    return GroupedArray(data, indptr), uids, last_dates
+
+
+def _read_panel_rows(path):
+    # unique_id and ds of the rows of a panel written by `write_panel`
+    path = Path(path)
+    meta = json.loads((path / "meta.json").read_text())
+    indptr = np.load(path / "indptr.npy")
+    uids = np.load(path / "uids.npy")
+    ds = np.memmap(
+        path / "ds.bin", dtype=meta["ds_dtype"], mode="r", shape=(indptr[-1],)
+    )
+    return np.repeat(uids, np.diff(indptr)), np.asarray(ds)
+
+
+def _read_panel_index(path):
+    # (unique_id, ds) index of the rows of a panel written by `write_panel`
+    return pd.MultiIndex.from_arrays(
+        list(_read_panel_rows(path)), names=["unique_id", "ds"]
+    )
+
+# %% ../nbs/src/core/core.ipynb 30
+class PreparedPanel:
+    """Panel of series processed once to be reused by `StatsForecast`.
+
+    Pass it as the `df` argument of `fit`, `forecast`, `fit_predict` and `cross_validation`
+    to skip processing the same DataFrame on every call, build it with `StatsForecast.prepare`.
+    It can be pickled, the one of a panel written with `write_panel` only keeps its directory
+    and memory maps its files again when it's loaded.
+
+    Attributes
+    ----------
+    ga : GroupedArray
+        Values of the series.
+    uids : pandas.Index
+        Ids of the series.
+    last_dates : pandas.Index or numpy.ndarray
+        Last datestamp of each serie.
+    engine : type
+        Type of the DataFrames returned, `pandas.DataFrame` or `polars.DataFrame`.
+    unique_id : numpy.ndarray, optional
+        Id of each row, None for a panel on disk.
+    ds : numpy.ndarray, optional
+        Datestamp of each row, None for a panel on disk.
+    sort_df : bool
+        Whether the rows were sorted by [`unique_id`,`ds`].
+    path : str or os.PathLike, optional
+        Directory of the panel if it was written with `write_panel`.
+    """
+
+    def __init__(
+        self,
+        ga,
+        uids,
+        last_dates,
+        engine,
+        unique_id=None,
+        ds=None,
+        sort_df=True,
+        path=None,
+    ):
+        self.ga = ga
+        self.uids = uids
+        self.last_dates = last_dates
+        self.engine = engine
+        self.unique_id = unique_id
+        self.ds = ds
+        self.sort_df = sort_df
+        self.path = path
+
+    def rows(self):
+        # unique_id and ds of each row, the ones of a panel on disk are read from its files
+        if self.path is not None:
+            return _read_panel_rows(self.path)
+        return self.unique_id, self.ds
+
+    def index(self):
+        # the index of the rows is only built when it's needed
+        return pd.MultiIndex.from_arrays(list(self.rows()), names=["unique_id", "ds"])
+
+    def __len__(self):
+        return len(self.ga)
+
+    def __repr__(self):
+        return (
+            f"PreparedPanel(n_series={len(self):,}, n_rows={self.ga.data.shape[0]:,})"
         )
+
+    def __getstate__(self):
+        if self.path is None:
+            return self.__dict__
+        return {"path": self.path, "sort_df": self.sort_df}
+
+    def __setstate__(self, state):
+        if "ga" not in state:
+            state = _prepare_panel(state["path"], state["sort_df"]).__dict__
+        self.__dict__.update(state)
+
+# %% ../nbs/src/core/core.ipynb 31
+def _prepare_panel(df, sort_df):
+    if isinstance(df, PreparedPanel):
+        return df
+    if isinstance(df, (str, os.PathLike)):
+        ga, uids, last_dates = _read_panel(df)
+        return PreparedPanel(
+            ga, uids, last_dates, pd.DataFrame, sort_df=sort_df, path=df
+        )
+    df_process = DataFrameProcessing(df, sort_df)
+    return PreparedPanel(
+        ga=df_process.grouped_array(),
+        uids=df_process.indices,
+        last_dates=df_process.dates,
+        engine=df_process.engine_dataframe,
+        unique_id=df_process.unique_id,
+        ds=df_process.ds,
+        sort_df=sort_df,
+    )
+
+
+def _panel_from_arrays(y, indptr, X=None):
+    # panel of the series stored contiguously in `y` and the rows of `X`, with the offsets `indptr`
+    y = np.asarray(y, dtype=np.float64)
+    if y.ndim != 1:
+        raise ValueError(f"`y` must be a 1 dimensional array, got {y.ndim} dimensions.")
+    indptr = np.asarray(indptr)
+    if (
+        indptr.ndim != 1
+        or indptr.size < 2
+        or indptr[0] != 0
+        or indptr[-1] != y.size
+        or (np.diff(indptr) <= 0).any()
+    ):
+        raise ValueError(
+            "`indptr` must be increasing, start at 0 and end at the size of `y`."
+        )
+    if X is None:
+        data = y.reshape(-1, 1)
+    else:
+        X = np.asarray(X, dtype=np.float64)
+        if X.ndim == 1:
+            X = X.reshape(-1, 1)
+        if X.shape[0] != y.size:
+            raise ValueError(f"`X` must have {y.size} rows, got {X.shape[0]}.")
+        data = np.hstack([y.reshape(-1, 1), X])
+    n_series = indptr.size - 1
+    return PreparedPanel(
+        ga=GroupedArray(data, indptr),
+        uids=pd.RangeIndex(n_series),
+        last_dates=None,
+        engine=None,
+        sort_df=False,
+    )
+
+
+def _cv_n_windows(h, n_windows, step_size, test_size, refit):
+    # number of windows and test size of a cross validation
+    if test_size is None:
+        test_size = h + step_size * (n_windows - 1)
+    elif n_windows is None:
+        if (test_size - h) % step_size:
+            raise Exception("`test_size - h` should be module `step_size`")
+        n_windows = int((test_size - h) / step_size) + 1
+    elif (n_windows is None) and (test_size is None):
+        raise Exception("you must define `n_windows` or `test_size`")
     else:
-        dates = pd.concat(
-            [
-                _cv_dates(np.array([ld]), freq, h, test_size, step_size)
-                for ld in last_dates
-            ]
+        raise Exception("you must define `n_windows` or `test_size` but not both")
+    if refit < 0:
+        raise ValueError("`refit` must be a boolean or a non-negative integer.")
+    return n_windows, test_size
+
+# %% ../nbs/src/core/core.ipynb 32
+def _tail_start(ids):
+    # position where the run of the last id of a column starts
+    if pa.types.is_dictionary(ids.type):
+        ids = ids.cast(ids.type.value_type)
+    not_last = np.flatnonzero(~pc.equal(ids, ids[-1]).to_numpy())
+    return 0 if not_last.size == 0 else not_last[-1] + 1
+
+
+def _read_parquet_chunks(path, chunk_rows, columns=None):
+    # polars DataFrames of at least `chunk_rows` rows of a parquet dataset, except the last one,
+    # the rows of the last serie of the batches read are kept for the next chunk so no serie is split
+    dataset = pyarrow.dataset.dataset(path, format="parquet", partitioning="hive")
+    seen = set()
+
+    def to_df(table):
+        df = pl.from_arrow(table)
+        uids = set(df["unique_id"].unique().to_list())
+        if not seen.isdisjoint(uids):
+            raise ValueError(
+                "The rows of each serie must be contiguous in the dataset."
+            )
+        seen.update(uids)
+        return df
+
+    tables, n_rows = [], 0
+    for batch in dataset.to_batches(columns=columns):
+        tables.append(pa.Table.from_batches([batch]))
+        n_rows += batch.num_rows
+        if n_rows < chunk_rows:
+            continue
+        table = pa.concat_tables(tables)
+        tail_start = _tail_start(table["unique_id"])
+        if tail_start == 0:
+            # a single serie, its rows keep being read
+            continue
+        yield to_df(table.slice(0, tail_start))
+        tables = [table.slice(tail_start)]
+        n_rows = tables[0].num_rows
+    if n_rows:
+        yield to_df(pa.concat_tables(tables))
+
+
+# rows of the chunks of series in which a LazyFrame is collected
+_LAZY_CHUNK_ROWS = 1_000_000
+
+
+def _lazy_chunks(lf, chunk_rows, sort_df):
+    # ids and DataFrames of the series of a LazyFrame, in chunks of at least `chunk_rows` rows,
+    # its query runs once and its rows are streamed to a temporary parquet file that is read by chunks
+    if sort_df:
+        # the chunks are then in the order of the whole LazyFrame sorted
+        lf = lf.sort(["unique_id", "ds"])
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, "data.parquet")
+        try:
+            lf.sink_parquet(path, row_group_size=chunk_rows)
+        except pl.exceptions.InvalidOperationError:
+            # the query can't be streamed
+            lf.collect(streaming=True).write_parquet(path, row_group_size=chunk_rows)
+        for chunk in _read_parquet_chunks(path, chunk_rows):
+            yield chunk["unique_id"].unique(maintain_order=True), chunk
+
+# %% ../nbs/src/core/core.ipynb 34
+def _shift_dates(last_dates, offsets, freq):
+    # dates `offsets` periods after `last_dates`, of shape (n_series, n_offsets)
+    if issubclass(last_dates.dtype.type, np.integer):
+        return (np.asarray(last_dates)[:, None] + offsets).astype(
+            last_dates.dtype, copy=False
         )
-        dates = dates.reset_index(drop=True)
-    return dates
+    last_dates = pd.DatetimeIndex(last_dates)
+    freq = pd.tseries.frequencies.to_offset(freq)
+    if isinstance(freq, pd.offsets.Tick):
+        return last_dates.values[:, None] + offsets * np.timedelta64(freq.nanos, "ns")
+    # calendar offsets are applied to all the series at once for each offset
+    uniq_offsets, inverse = np.unique(offsets, return_inverse=True)
+    dates = np.empty((last_dates.size, uniq_offsets.size), dtype="datetime64[ns]")
+    for i, offset in enumerate(uniq_offsets):
+        dates[:, i] = (last_dates + offset * freq).values
+    return dates[:, inverse]
+
+
+def _cv_grid(last_dates, freq, h, test_size, step_size=1):
+    # dates and cutoffs of every window for each serie, flattened by serie and window
+    if (test_size - h) % step_size:
+        raise Exception("`test_size - h` should be module `step_size`")
+    cutoffs = np.arange(-test_size, -h + 1, step_size)
+    offsets = np.hstack(
+        [
+            (cutoffs[:, None] + np.arange(1, h + 1)).ravel(),
+            np.repeat(cutoffs, h),
+        ]
+    )
+    dates = _shift_dates(last_dates, offsets, freq)
+    n_out = cutoffs.size * h
+    return dates[:, :n_out].ravel(), dates[:, n_out:].ravel()
 
-# %% ../nbs/src/core/core.ipynb 29
+
+def _cv_dates(last_dates, freq, h, test_size, step_size=1):
+    ds, cutoff = _cv_grid(last_dates, freq, h, test_size, step_size)
+    return pd.DataFrame({"ds": ds, "cutoff": cutoff})
+
+# %% ../nbs/src/core/core.ipynb 39
 def _get_n_jobs(n_groups, n_jobs):
     if n_jobs == -1 or (n_jobs is None):
         actual_n_jobs = cpu_count()
@@ -743,7 +1217,241 @@ def _get_n_jobs(n_groups, n_jobs):
         actual_n_jobs = n_jobs
     return min(n_groups, actual_n_jobs)
 
-# %% ../nbs/src/core/core.ipynb 32
+# %% ../nbs/src/core/core.ipynb 40
+def _chunk_bounds(indptr, n_jobs, chunks_per_job=4):
+    # splits the series in contiguous chunks with a similar number of samples,
+    # sorted from the most to the least expensive. The workers pick them up as
+    # they become free, so long series start first and don't delay the end.
+    n_groups = indptr.size - 1
+    n_chunks = min(n_groups, n_jobs * chunks_per_job)
+    costs = np.diff(indptr) + 1  # +1 for the per serie overhead
+    cum_costs = np.cumsum(costs)
+    targets = cum_costs[-1] * np.arange(1, n_chunks) / n_chunks
+    # the series that cross a target are isolated, which leaves
+    # the ones more expensive than a chunk in their own chunks
+    crossing = np.searchsorted(cum_costs, targets)
+    cuts = np.unique(np.hstack([0, crossing, crossing + 1, n_groups]))
+    chunk_costs = np.diff(np.hstack([0, cum_costs])[cuts])
+    return [(cuts[i], cuts[i + 1]) for i in np.argsort(-chunk_costs, kind="stable")]
+
+
+def _sort_chunks(bounds, results):
+    # results of the chunks in the order of the series
+    return [res for _, res in sorted(zip(bounds, results), key=lambda x: x[0][0])]
+
+
+def _cv_window_bounds(n_groups, n_windows, refit, n_jobs, chunks_per_job=4):
+    # windows of each serie computed by the same job. They're only split when there
+    # aren't enough series to keep the workers busy, and every chunk starts at a window
+    # where the models are trained so that they don't depend on the previous chunks.
+    refit_every = int(refit) or n_windows
+    n_blocks = -(-n_windows // refit_every)
+    n_chunks = min(n_blocks, -(-n_jobs * chunks_per_job // n_groups))
+    return [
+        (blocks[0] * refit_every, min((blocks[-1] + 1) * refit_every, n_windows))
+        for blocks in np.array_split(np.arange(n_blocks), n_chunks)
+    ]
+
+
+def _cv_windows_serie(data, indptr, i, n_windows, end, step_size):
+    # serie `i` without the observations after the window `end`, whose cross validation
+    # with the test size of the last `n_windows` windows computes only those windows
+    last = indptr[i + 1] - (n_windows - end) * step_size
+    return GroupedArray(data[indptr[i] : last], np.array([0, last - indptr[i]]))
+
+
+def _grouped_array_view(data, indptr, start, end):
+    # series [start, end) of a grouped array without copying `data`
+    return GroupedArray(
+        data[indptr[start] : indptr[end]], indptr[start : end + 1] - indptr[start]
+    )
+
+
+class _SharedArrays:
+    """Arrays allocated in shared memory by the main process.
+
+    Workers receive specs `(name, shape, dtype, offset)` instead of the arrays
+    and attach to them with `_run_on_shared`. The blocks are released
+    when leaving the context. They have to be allocated before starting
+    the workers so that all processes share the same resource tracker.
+    Memory mapped files aren't copied, their specs have the name of the
+    file and its offset so that the workers map it again."""
+
+    def __init__(self):
+        self.blocks = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        for shm in self.blocks:
+            shm.close()
+            shm.unlink()
+        self.blocks = []
+
+    def _allocate(self, shape, dtype, value):
+        dtype = np.dtype(dtype)
+        shm = SharedMemory(
+            create=True, size=max(int(np.prod(shape)) * dtype.itemsize, 1)
+        )
+        self.blocks.append(shm)
+        np.ndarray(shape, dtype=dtype, buffer=shm.buf)[...] = value
+        return (shm.name, shape, dtype.str, None)
+
+    def full(self, shape, fill_value, dtype):
+        return self._allocate(shape, dtype, fill_value)
+
+    def share(self, arr):
+        if isinstance(arr, np.memmap) and isinstance(arr.base, mmap.mmap):
+            return (arr.filename, arr.shape, arr.dtype.str, arr.offset)
+        return self._allocate(arr.shape, arr.dtype, arr)
+
+    def read(self, spec):
+        # copy of the array, the shared block can be released afterwards
+        name, shape, dtype, _ = spec
+        shm = next(shm for shm in self.blocks if shm.name == name)
+        return np.ndarray(shape, dtype=dtype, buffer=shm.buf).copy()
+
+
+def _attach(spec):
+    # shared block (None for files) and array of a spec from `_SharedArrays`
+    name, shape, dtype, offset = spec
+    if offset is not None:
+        return None, np.memmap(name, dtype=dtype, mode="r", offset=offset, shape=shape)
+    shm = SharedMemory(name=name)
+    return shm, np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+
+
+def _run_on_shared(fn, specs, *args):
+    # attaches to the shared blocks in `specs` and calls `fn` with
+    # the arrays followed by `args`. None specs are passed as None.
+    blocks, arrays = [], []
+    try:
+        for spec in specs:
+            shm, arr = (None, None) if spec is None else _attach(spec)
+            blocks.append(shm)
+            arrays.append(arr)
+        return fn(*arrays, *args)
+    finally:
+        arrays = None
+        for shm in blocks:
+            if shm is None:
+                continue
+            try:
+                shm.close()
+            except BufferError:
+                # a traceback still references the arrays,
+                # the block is released when it's collected
+                pass
+
+
+def _fit_shared_chunk(data, indptr, start, end, models):
+    return _grouped_array_view(data, indptr, start, end).fit(models=models)
+
+
+def _forecast_shared_chunk(
+    data,
+    indptr,
+    X_data,
+    X_indptr,
+    fcsts,
+    fitted_vals,
+    start,
+    end,
+    models,
+    h,
+    fallback_model,
+    fitted,
+    level,
+):
+    ga = _grouped_array_view(data, indptr, start, end)
+    X = None if X_data is None else _grouped_array_view(X_data, X_indptr, start, end)
+    res = ga.forecast(
+        models=models,
+        h=h,
+        fallback_model=fallback_model,
+        fitted=fitted,
+        X=X,
+        level=level,
+    )
+    fcsts[start * h : end * h] = res["forecasts"]
+    if not fitted:
+        return res["cols"], None
+    fitted_vals[indptr[start] : indptr[end]] = res["fitted"]["values"]
+    return res["cols"], res["fitted"]["cols"]
+
+
+def _cross_validation_shared_chunk(
+    data,
+    indptr,
+    fcsts,
+    fitted_vals,
+    fitted_offsets,
+    start,
+    end,
+    models,
+    h,
+    test_size,
+    fallback_model,
+    step_size,
+    input_size,
+    fitted,
+    level,
+    refit,
+):
+    ga = _grouped_array_view(data, indptr, start, end)
+    res = ga.cross_validation(
+        models=models,
+        h=h,
+        test_size=test_size,
+        fallback_model=fallback_model,
+        step_size=step_size,
+        input_size=input_size,
+        fitted=fitted,
+        level=level,
+        refit=refit,
+    )
+    rows_per_serie = fcsts.shape[0] // (indptr.size - 1)
+    fcsts[start * rows_per_serie : end * rows_per_serie] = res["forecasts"]
+    if not fitted:
+        return res["cols"], None
+    n_windows = res["fitted"]["spans"].shape[1]
+    fitted_vals[
+        fitted_offsets[start * n_windows] : fitted_offsets[end * n_windows]
+    ] = res["fitted"]["values"]
+    return res["cols"], res["fitted"]["cols"]
+
+
+def _cross_validation_shared_windows(data, indptr, i, n_windows, end, step_size, *args):
+    ga = _cv_windows_serie(data, indptr, i, n_windows, end, step_size)
+    return ga.cross_validation(*args)
+
+
+def _warm_worker(models, fallback_model):
+    # initializer of the persistent pool, compiles the numba kernels
+    # of the models so that the first call doesn't pay for them
+    from statsforecast.utils import AirPassengers
+
+    # same types as the data of `DataFrameProcessing`
+    ga = GroupedArray(
+        AirPassengers.astype(np.float64)[:, None],
+        np.array([0, AirPassengers.size], dtype=np.int32),
+    )
+    try:
+        # all the models at once, their outputs are views of the same array
+        ga.forecast(models=models, h=2, fallback_model=fallback_model)
+        return
+    except Exception:
+        pass
+    for model in [*models, fallback_model]:
+        if model is None:
+            continue
+        try:
+            ga.forecast(models=[model], h=2)
+        except Exception:
+            pass
+
+# %% ../nbs/src/core/core.ipynb 45
 def _parse_ds_type(df):
     dt_col = df["ds"]
     dt_check = pd.api.types.is_datetime64_any_dtype(dt_col)
@@ -761,7 +1469,7 @@ def _parse_ds_type(df):
             raise Exception(msg) from e
     return df
 
-# %% ../nbs/src/core/core.ipynb 33
+# %% ../nbs/src/core/core.ipynb 46
 class _StatsForecast:
     def __init__(
         self,
@@ -772,6 +1480,8 @@ class _StatsForecast:
         sort_df: bool = True,
         fallback_model: Optional[Any] = None,
         verbose: bool = False,
+        shared_memory: bool = False,
+        executor: str = "processes",
     ):
         """Train statistical models.
 
@@ -798,6 +1508,8 @@ class _StatsForecast:
             Number of jobs used in the parallel processing, use -1 for all cores.
         df : pandas.DataFrame or pl.DataFrame, optional (default=None)
             DataFrame with columns [`unique_id`, `ds`, `y`] and exogenous.
+            It can also be the directory of a panel written with `write_panel`
+            or a panel returned by `StatsForecast.prepare`.
         sort_df : bool (default=True)
             If True, sort `df` by [`unique_id`,`ds`].
         fallback_model : Any, optional (default=None)
@@ -805,40 +1517,86 @@ class _StatsForecast:
             Only works with the `forecast` and `cross_validation` methods.
         verbose : bool (default=True)
             Prints TQDM progress bar when `n_jobs=1`.
+        shared_memory : bool (default=False)
+            If True and `n_jobs > 1`, the series and the outputs of `fit`, `forecast` and
+            `cross_validation` are placed in shared memory so that each job only receives
+            the limits of its series instead of a pickled copy of them.
+        executor : str (default='processes')
+            Kind of workers used when `n_jobs > 1`, either 'processes' or 'threads'.
+            Threads share the series without copying them, but they only run in parallel
+            while the models are inside numba functions that release the GIL, which requires
+            setting the `NUMBA_RELEASE_GIL` environment variable to `true` before importing statsforecast.
         """
 
         # TODO @fede: needed for residuals, think about it later
         self.models = models
         self.freq = pd.tseries.frequencies.to_offset(freq)
         self.n_jobs = n_jobs
+        # `n_jobs` is capped by the number of series of each call
+        self._max_n_jobs = n_jobs
         self.fallback_model = fallback_model
         self.verbose = verbose
+        self.shared_memory = shared_memory
+        self.executor = executor
+        self._set_executor(None)
+        self._pool: Optional[multiprocessing.pool.Pool] = None
+        self._panel = None
         self.n_jobs == 1
         self._prepare_fit(df=df, sort_df=sort_df)
 
     def _prepare_fit(self, df, sort_df):
-        if df is not None:
-            df_process = DataFrameProcessing(df, sort_df)
-            self.ga = df_process.grouped_array()
-            self.uids = df_process.indices
-            self.last_dates = df_process.dates
-            self.ds = df_process.index
-            self.og_dates = df_process.np_df["ds"]
-            self.og_unique_id = df_process.np_df["unique_id"]
-            self.engine = df_process.engine_dataframe
-            self.n_jobs = _get_n_jobs(len(self.ga), self.n_jobs)
-            self.sort_df = sort_df
+        if df is None:
+            return
+        self._panel = _prepare_panel(df, sort_df)
+        self.ga = self._panel.ga
+        self.uids = self._panel.uids
+        self.last_dates = self._panel.last_dates
+        self.og_dates = self._panel.ds
+        self.og_unique_id = self._panel.unique_id
+        self.engine = self._panel.engine
+        self.n_jobs = _get_n_jobs(len(self.ga), self._max_n_jobs)
+        self.sort_df = self._panel.sort_df
+
+    def _fitted_index(self):
+        return self._panel.index()
 
     def _set_prediction_intervals(self, prediction_intervals):
         for model in self.models:
             if hasattr(model, "prediction_intervals"):
                 setattr(model, "prediction_intervals", prediction_intervals)
 
+    def prepare(
+        self,
+        df: Union[pd.DataFrame, pl.DataFrame, str, os.PathLike],
+        sort_df: bool = True,
+    ):
+        """Process a panel once to reuse it.
+
+        The returned panel can be passed as the `df` argument of `fit`, `forecast`,
+        `fit_predict` and `cross_validation` instead of processing `df` on every call.
+        The `sort_df` argument of those methods is ignored for it.
+
+        Parameters
+        ----------
+        df : pandas.DataFrame | polars.DataFrame
+            DataFrame with columns [`unique_id`, `ds`, `y`] and exogenous.
+            It can also be the directory of a panel written with `write_panel`.
+        sort_df : bool (default=True)
+            If True, sort `df` by [`unique_id`,`ds`].
+
+        Returns
+        -------
+        panel : PreparedPanel
+            Processed panel.
+        """
+        return _prepare_panel(df, sort_df)
+
     def fit(
         self,
         df: Optional[Union[pd.DataFrame, pl.DataFrame]] = None,
         sort_df: bool = True,
         prediction_intervals: Optional[ConformalIntervals] = None,
+        executor: Optional[str] = None,
     ):
         """Fit statistical models.
 
@@ -851,16 +1609,22 @@ class _StatsForecast:
             DataFrame with columns [`unique_id`, `ds`, `y`] and exogenous.
             If None, the `StatsForecast` class should have been instantiated
             using `df`.
+            It can also be the directory of a panel written with `write_panel`
+            or a panel returned by `StatsForecast.prepare`.
         sort_df : bool (default=True)
             If True, sort `df` by [`unique_id`,`ds`].
         prediction_intervals : ConformalIntervals, optional (default=None)
             Configuration to calibrate prediction intervals (Conformal Prediction).
+        executor : str, optional (default=None)
+            Kind of workers used when `n_jobs > 1`, either 'processes' or 'threads'.
+            If None, the one of the constructor is used.
 
         Returns
         -------
         self : StatsForecast
             Returns with stored `StatsForecast` fitted `models`.
         """
+        self._set_executor(executor)
         self._set_prediction_intervals(prediction_intervals=prediction_intervals)
         self._prepare_fit(df, sort_df)
         if self.n_jobs == 1:
@@ -869,36 +1633,70 @@ class _StatsForecast:
             self.fitted_ = self._fit_parallel()
         return self
 
-    def _make_future_df(self, h: int):
-        if issubclass(self.last_dates.dtype.type, np.integer):
-            last_date_f = lambda x: np.arange(
-                x + 1, x + 1 + h, dtype=self.last_dates.dtype
-            )
-        else:
-            last_date_f = lambda x: pd.date_range(
-                x + self.freq, periods=h, freq=self.freq
+    def _make_future_df(
+        self,
+        h: int,
+        start: int = 0,
+        end: Optional[int] = None,
+        fcsts: Optional[np.ndarray] = None,
+        cols: Optional[List[str]] = None,
+    ):
+        # future dates of the series [start, end) with their forecasts `fcsts` as the columns `cols`
+        last_dates = self.last_dates[start:end]
+        dates = _shift_dates(last_dates, np.arange(1, h + 1), self.freq).ravel()
+        # the ids are taken from their codes, only the unique ones are converted
+        uids = self.uids[start:end]
+        codes = np.repeat(np.arange(len(uids)), h)
+        if self.engine == pd.DataFrame:
+            idx = pd.Index(uids, name="unique_id").take(codes)
+            df = self.engine({"ds": dates}, index=idx)
+            if cols is not None:
+                df[cols] = fcsts
+        elif self.engine == pl.DataFrame:
+            # the frame is built at once from the columns of the forecasts,
+            # setting them afterwards copies all of them again
+            df = self.engine(
+                {
+                    "unique_id": self._pl_unique_id(start + codes),
+                    "ds": dates,
+                    **_columns_dict(fcsts, cols),
+                }
             )
-        if len(np.unique(self.last_dates)) == 1:
-            dates = np.tile(last_date_f(self.last_dates[0]), len(self.ga))
-        else:
-            dates = np.hstack([last_date_f(last_date) for last_date in self.last_dates])
-        u_id_ser: Union[pd.Series, pl.Series] = np.repeat(self.uids, h)
-        unique_id: np.ndarray = u_id_ser.to_numpy()
+        return df
 
+    def _pl_unique_id(self, codes, uids=None):
+        # ids of the series `codes` as a polars Series, only the unique ones are converted,
+        # `uids` are the ids of the series, by default the processed ones
+        unique_id = np.asarray(self.uids if uids is None else uids)
         # In older versions to_numpy converts string values into object,
         # creating bytes error, this fixes it
         if unique_id.dtype.kind == "O":
             unique_id = unique_id.astype(str)
+        return pl.Series(unique_id)[codes]
 
-        if self.engine == pd.DataFrame:
-            idx = pd.Index(unique_id, name="unique_id")
-            df = self.engine({"ds": dates}, index=idx)
-        elif self.engine == pl.DataFrame:
-            df = self.engine({"unique_id": unique_id, "ds": dates})
-        return df
+    def _input_uids(self):
+        # ids of the series with the type they have in `df`,
+        # numeric strings are converted to numbers in the processed ones
+        return self._panel.unique_id[self.ga.indptr[:-1]]
+
+    def _rows_codes(self):
+        # serie of each row of the panel
+        return np.repeat(np.arange(len(self.uids)), np.diff(self.ga.indptr))
 
     def _parse_X_level(self, h, X, level):
-        if X is not None:
+        if isinstance(X, np.ndarray):
+            # future exogenous of the array API, with the rows of each serie in order
+            if X.ndim == 1:
+                X = X.reshape(-1, 1)
+            expected_shape = (h * len(self.ga), self.ga.data.shape[1] - 1)
+            if X.shape != expected_shape:
+                raise ValueError(
+                    f"Expected X to have shape {expected_shape}, but got {X.shape}"
+                )
+            X = GroupedArray(
+                X.astype(np.float64, copy=False), np.arange(0, X.shape[0] + 1, h)
+            )
+        elif X is not None:
             if isinstance(X, pd.DataFrame):
                 if X.index.name != "unique_id":
                     X = X.set_index("unique_id")
@@ -926,6 +1724,7 @@ class _StatsForecast:
         h: int,
         X_df: Optional[Union[pd.DataFrame, pl.DataFrame]] = None,
         level: Optional[List[int]] = None,
+        executor: Optional[str] = None,
     ):
         """Predict statistical models.
 
@@ -939,6 +1738,9 @@ class _StatsForecast:
             DataFrame with [`unique_id`, `ds`] columns and `df`'s future exogenous.
         level : List[float], optional (default=None)
             Confidence levels between 0 and 100 for prediction intervals.
+        executor : str, optional (default=None)
+            Kind of workers used when `n_jobs > 1`, either 'processes' or 'threads'.
+            If None, the one of the constructor is used.
 
         Returns
         -------
@@ -946,13 +1748,13 @@ class _StatsForecast:
             DataFrame with `models` columns for point predictions and probabilistic
             predictions for all fitted `models`.
         """
+        self._set_executor(executor)
         X, level = self._parse_X_level(h=h, X=X_df, level=level)
         if self.n_jobs == 1:
             fcsts, cols = self.ga.predict(fm=self.fitted_, h=h, X=X, level=level)
         else:
             fcsts, cols = self._predict_parallel(h=h, X=X, level=level)
-        fcsts_df = self._make_future_df(h=h)
-        fcsts_df[cols] = fcsts
+        fcsts_df = self._make_future_df(h=h, fcsts=fcsts, cols=cols)
         return fcsts_df
 
     def fit_predict(
@@ -963,6 +1765,7 @@ class _StatsForecast:
         level: Optional[List[int]] = None,
         sort_df: bool = True,
         prediction_intervals: Optional[ConformalIntervals] = None,
+        executor: Optional[str] = None,
     ):
         """Fit and Predict with statistical models.
 
@@ -980,6 +1783,8 @@ class _StatsForecast:
             DataFrame with columns [`unique_id`, `ds`, `y`] and exogenous variables.
             If None, the `StatsForecast` class should have been instantiated
             using `df`.
+            It can also be the directory of a panel written with `write_panel`
+            or a panel returned by `StatsForecast.prepare`.
         X_df : pandas.DataFrame | polars.DataFrame, optional (default=None)
             DataFrame with [`unique_id`, `ds`] columns and `df`'s future exogenous.
         level : List[float], optional (default=None)
@@ -988,6 +1793,9 @@ class _StatsForecast:
             If True, sort `df` by [`unique_id`,`ds`].
         prediction_intervals : ConformalIntervals, optional (default=None)
             Configuration to calibrate prediction intervals (Conformal Prediction).
+        executor : str, optional (default=None)
+            Kind of workers used when `n_jobs > 1`, either 'processes' or 'threads'.
+            If None, the one of the constructor is used.
 
         Returns
         -------
@@ -995,6 +1803,7 @@ class _StatsForecast:
             DataFrame with `models` columns for point predictions and probabilistic
             predictions for all fitted `models`.
         """
+        self._set_executor(executor)
         self._set_prediction_intervals(prediction_intervals=prediction_intervals)
         self._prepare_fit(df, sort_df)
         X, level = self._parse_X_level(h=h, X=X_df, level=level)
@@ -1006,8 +1815,7 @@ class _StatsForecast:
             self.fitted_, fcsts, cols = self._fit_predict_parallel(
                 h=h, X=X, level=level
             )
-        fcsts_df = self._make_future_df(h=h)
-        fcsts_df[cols] = fcsts
+        fcsts_df = self._make_future_df(h=h, fcsts=fcsts, cols=cols)
         return fcsts_df
 
     def forecast(
@@ -1019,6 +1827,7 @@ class _StatsForecast:
         fitted: bool = False,
         sort_df: bool = True,
         prediction_intervals: Optional[ConformalIntervals] = None,
+        executor: Optional[str] = None,
     ):
         """Memory Efficient predictions.
 
@@ -1030,30 +1839,59 @@ class _StatsForecast:
         ----------
         h : int
             Forecast horizon.
-        df : pandas.DataFrame | polars.DataFrame, optional (default=None)
+        df : pandas.DataFrame | polars.DataFrame | polars.LazyFrame, optional (default=None)
             DataFrame with columns [`unique_id`, `ds`, `y`] and exogenous.
             If None, the `StatsForecast` class should have been instantiated
             using `df`.
+            It can also be the directory of a panel written with `write_panel`
+            or a panel returned by `StatsForecast.prepare`.
+            A polars LazyFrame is collected once to a temporary parquet file, which is read
+            by chunks of series of about a million rows processed one after the other,
+            and a LazyFrame is returned.
+            If `sort_df` is False, the rows of each serie must be contiguous in the LazyFrame.
         X_df : pandas.DataFrame | polars.DataFrame, optional (default=None)
             DataFrame with [`unique_id`, `ds`] columns and `df`'s future exogenous.
         level : List[float], optional (default=None)
             Confidence levels between 0 and 100 for prediction intervals.
         fitted : bool (default=False)
-            Wether or not return insample predictions.
+            Wether or not return insample predictions. Not supported for a LazyFrame.
         sort_df : bool (default=True)
             If True, sort `df` by [`unique_id`,`ds`].
         prediction_intervals : ConformalIntervals, optional (default=None)
             Configuration to calibrate prediction intervals (Conformal Prediction).
+        executor : str, optional (default=None)
+            Kind of workers used when `n_jobs > 1`, either 'processes' or 'threads'.
+            If None, the one of the constructor is used.
 
         Returns
         -------
-        fcsts_df : pandas.DataFrame | polars.DataFrame
+        fcsts_df : pandas.DataFrame | polars.DataFrame | polars.LazyFrame
             DataFrame with `models` columns for point predictions and probabilistic
             predictions for all fitted `models`.
         """
+        if isinstance(df, pl.LazyFrame):
+            return self._run_lazy(
+                self.forecast,
+                df=df,
+                fitted=fitted,
+                executor=executor,
+                X_df=X_df,
+                h=h,
+                level=level,
+                sort_df=sort_df,
+                prediction_intervals=prediction_intervals,
+            )
+        self._set_executor(executor)
         self._set_prediction_intervals(prediction_intervals=prediction_intervals)
         self._prepare_fit(df, sort_df)
         X, level = self._parse_X_level(h=h, X=X_df, level=level)
+        res_fcsts = self._run_forecast(h=h, fitted=fitted, X=X, level=level)
+        fcsts = res_fcsts["forecasts"]
+        cols = res_fcsts["cols"]
+        fcsts_df = self._make_future_df(h=h, fcsts=fcsts, cols=cols)
+        return fcsts_df
+
+    def _run_forecast(self, h, fitted, X, level):
         if self.n_jobs == 1:
             res_fcsts = self.ga.forecast(
                 models=self.models,
@@ -1068,11 +1906,264 @@ class _StatsForecast:
             res_fcsts = self._forecast_parallel(h=h, fitted=fitted, X=X, level=level)
         if fitted:
             self.fcst_fitted_values_ = res_fcsts["fitted"]
-        fcsts = res_fcsts["forecasts"]
-        cols = res_fcsts["cols"]
-        fcsts_df = self._make_future_df(h=h)
-        fcsts_df[cols] = fcsts
-        return fcsts_df
+        return res_fcsts
+
+    def forecast_arrays(
+        self,
+        h: int,
+        y: np.ndarray,
+        indptr: np.ndarray,
+        X: Optional[np.ndarray] = None,
+        X_future: Optional[np.ndarray] = None,
+        level: Optional[List[int]] = None,
+        fitted: bool = False,
+        prediction_intervals: Optional[ConformalIntervals] = None,
+        executor: Optional[str] = None,
+    ):
+        """Memory Efficient predictions from numpy arrays.
+
+        Same as `StatsForecast.forecast` for a panel that is already stored as arrays,
+        without building any DataFrame. The values of the i-th serie are `y[indptr[i]:indptr[i + 1]]`,
+        sorted by time, and the rows of the outputs follow the order of the series.
+
+        Parameters
+        ----------
+        h : int
+            Forecast horizon.
+        y : numpy.ndarray
+            Values of all the series, one after the other.
+        indptr : numpy.ndarray
+            Offsets of the series in `y`, of size `n_series + 1`.
+        X : numpy.ndarray, optional (default=None)
+            Exogenous variables, with a row for each value of `y`.
+        X_future : numpy.ndarray, optional (default=None)
+            Future exogenous variables, with `h` rows for each serie.
+        level : List[float], optional (default=None)
+            Confidence levels between 0 and 100 for prediction intervals.
+        fitted : bool (default=False)
+            Wether or not return insample predictions.
+        prediction_intervals : ConformalIntervals, optional (default=None)
+            Configuration to calibrate prediction intervals (Conformal Prediction).
+        executor : str, optional (default=None)
+            Kind of workers used when `n_jobs > 1`, either 'processes' or 'threads'.
+            If None, the one of the constructor is used.
+
+        Returns
+        -------
+        res : dict
+            `forecasts` array with `h` rows for each serie, `cols` names of its columns
+            and, if `fitted`, the insample `values` and their `cols` in `fitted`.
+        """
+        self._set_executor(executor)
+        self._set_prediction_intervals(prediction_intervals=prediction_intervals)
+        self._prepare_fit(_panel_from_arrays(y, indptr, X), sort_df=False)
+        if X_future is not None:
+            X_future = np.asarray(X_future)
+        X_future, level = self._parse_X_level(h=h, X=X_future, level=level)
+        return self._run_forecast(h=h, fitted=fitted, X=X_future, level=level)
+
+    def forecast_iter(
+        self,
+        h: int,
+        df: Optional[Union[pd.DataFrame, pl.DataFrame]] = None,
+        X_df: Optional[Union[pd.DataFrame, pl.DataFrame]] = None,
+        level: Optional[List[int]] = None,
+        chunk_size: int = 1_000,
+        sort_df: bool = True,
+        prediction_intervals: Optional[ConformalIntervals] = None,
+        executor: Optional[str] = None,
+    ):
+        """Memory Efficient predictions by chunks of series.
+
+        Analogous to `StatsForecast.forecast` but the series are processed in chunks of
+        `chunk_size` series and the predictions of each chunk are yielded as soon as they're
+        available, so the predictions of the whole panel are never held in memory.
+        The chunks are yielded in the order of the series.
+
+        Parameters
+        ----------
+        h : int
+            Forecast horizon.
+        df : pandas.DataFrame | polars.DataFrame, optional (default=None)
+            DataFrame with columns [`unique_id`, `ds`, `y`] and exogenous.
+            If None, the `StatsForecast` class should have been instantiated
+            using `df`.
+            It can also be the directory of a panel written with `write_panel`
+            or a panel returned by `StatsForecast.prepare`.
+        X_df : pandas.DataFrame | polars.DataFrame, optional (default=None)
+            DataFrame with [`unique_id`, `ds`] columns and `df`'s future exogenous.
+        level : List[float], optional (default=None)
+            Confidence levels between 0 and 100 for prediction intervals.
+        chunk_size : int (default=1000)
+            Number of series in each DataFrame.
+        sort_df : bool (default=True)
+            If True, sort `df` by [`unique_id`,`ds`].
+        prediction_intervals : ConformalIntervals, optional (default=None)
+            Configuration to calibrate prediction intervals (Conformal Prediction).
+        executor : str, optional (default=None)
+            Kind of workers used when `n_jobs > 1`, either 'processes' or 'threads'.
+            If None, the one of the constructor is used.
+
+        Returns
+        -------
+        fcsts_dfs : generator of pandas.DataFrame | polars.DataFrame
+            DataFrames with `models` columns for point predictions and probabilistic
+            predictions for all fitted `models`, one for each chunk of series.
+        """
+        self._set_executor(executor)
+        if chunk_size < 1:
+            raise ValueError("`chunk_size` must be a positive integer.")
+        self._set_prediction_intervals(prediction_intervals=prediction_intervals)
+        self._prepare_fit(df, sort_df)
+        X, level = self._parse_X_level(h=h, X=X_df, level=level)
+        n_groups = len(self.ga)
+        bounds = [
+            (start, min(start + chunk_size, n_groups))
+            for start in range(0, n_groups, chunk_size)
+        ]
+        if self.n_jobs == 1:
+            results = self._forecast_chunks(h=h, X=X, level=level, bounds=bounds)
+        else:
+            results = self._forecast_chunks_parallel(
+                h=h, X=X, level=level, bounds=bounds
+            )
+        return self._chunks_to_df(h=h, bounds=bounds, results=results)
+
+    def _forecast_chunks(self, h, X, level, bounds):
+        for start, end in bounds:
+            ga = _grouped_array_view(self.ga.data, self.ga.indptr, start, end)
+            X_ = None if X is None else X[start:end]
+            yield ga.forecast(
+                models=self.models,
+                h=h,
+                fallback_model=self.fallback_model,
+                X=X_,
+                level=level,
+            )
+
+    def _chunks_to_df(self, h, bounds, results):
+        for (start, end), res in zip(bounds, results):
+            fcsts_df = self._make_future_df(
+                h=h, start=start, end=end, fcsts=res["forecasts"], cols=res["cols"]
+            )
+            yield fcsts_df
+
+    @contextmanager
+    def _chunks_pool(self, executor):
+        # the workers are started once for all the chunks
+        self._set_executor(executor)
+        own_pool = not self._threads and self._pool is None and self._max_n_jobs != 1
+        if own_pool:
+            self.start_pool()
+        try:
+            yield
+        finally:
+            if own_pool:
+                self.close_pool()
+
+    def _run_parquet(
+        self, method, path, output_path, chunk_rows, columns, executor, **kwargs
+    ):
+        # runs `method` on the chunks of a parquet dataset or a LazyFrame and writes their outputs to `output_path`
+        if chunk_rows < 1:
+            raise ValueError("`chunk_rows` must be a positive integer.")
+        if isinstance(path, pl.LazyFrame):
+            lf = path if columns is None else path.select(columns)
+            chunks = (
+                chunk for _, chunk in _lazy_chunks(lf, chunk_rows, kwargs["sort_df"])
+            )
+        else:
+            chunks = _read_parquet_chunks(path, chunk_rows, columns)
+        writer = None
+        with self._chunks_pool(executor):
+            try:
+                for chunk in chunks:
+                    out = method(df=chunk, executor=executor, **kwargs).to_arrow()
+                    if writer is None:
+                        writer = pq.ParquetWriter(output_path, out.schema)
+                    writer.write_table(out)
+            finally:
+                if writer is not None:
+                    writer.close()
+        if writer is None:
+            raise ValueError("The dataset doesn't contain any rows.")
+
+    def _run_lazy(self, method, df, fitted, executor, X_df=None, **kwargs):
+        # runs `method` on the chunks of series of a LazyFrame and concatenates their outputs
+        if fitted:
+            raise ValueError("`fitted=True` is not supported when `df` is a LazyFrame.")
+        if X_df is not None and not isinstance(X_df, (pl.DataFrame, pl.LazyFrame)):
+            raise ValueError(
+                "`X_df` must be a polars DataFrame or LazyFrame when `df` is a LazyFrame."
+            )
+        outs = []
+        with self._chunks_pool(executor):
+            for uids, chunk in _lazy_chunks(df, _LAZY_CHUNK_ROWS, kwargs["sort_df"]):
+                if X_df is not None:
+                    kwargs["X_df"] = (
+                        X_df.lazy().filter(pl.col("unique_id").is_in(uids)).collect()
+                    )
+                outs.append(method(df=chunk, executor=executor, **kwargs).lazy())
+        if not outs:
+            raise ValueError("The LazyFrame doesn't contain any rows.")
+        return pl.concat(outs)
+
+    def forecast_parquet(
+        self,
+        h: int,
+        path: Union[str, os.PathLike],
+        output_path: Union[str, os.PathLike],
+        level: Optional[List[int]] = None,
+        chunk_rows: int = 1_000_000,
+        columns: Optional[List[str]] = None,
+        sort_df: bool = True,
+        prediction_intervals: Optional[ConformalIntervals] = None,
+        executor: Optional[str] = None,
+    ):
+        """Memory Efficient predictions of a parquet dataset.
+
+        The dataset is read in chunks of about `chunk_rows` rows that don't split any serie,
+        each chunk is forecasted and its predictions are appended to the parquet file `output_path`,
+        so neither the dataset nor the predictions are held in memory.
+        The rows of each serie must be contiguous in the dataset.
+
+        Parameters
+        ----------
+        h : int
+            Forecast horizon.
+        path : str, os.PathLike or polars.LazyFrame
+            Parquet file or directory of a (hive partitioned) parquet dataset
+            with columns [`unique_id`, `ds`, `y`] and exogenous.
+            A polars LazyFrame is collected once to a temporary parquet file read by chunks,
+            if `sort_df` is False the rows of each serie must be contiguous in it.
+        output_path : str or os.PathLike
+            Parquet file where the predictions are written.
+        level : List[float], optional (default=None)
+            Confidence levels between 0 and 100 for prediction intervals.
+        chunk_rows : int (default=1_000_000)
+            Minimum number of rows of each chunk.
+        columns : List[str], optional (default=None)
+            Columns of the dataset that are read. If None, all of them are read.
+        sort_df : bool (default=True)
+            If True, sort each chunk by [`unique_id`,`ds`], a LazyFrame is sorted as a whole.
+        prediction_intervals : ConformalIntervals, optional (default=None)
+            Configuration to calibrate prediction intervals (Conformal Prediction).
+        executor : str, optional (default=None)
+            Kind of workers used when `n_jobs > 1`, either 'processes' or 'threads'.
+            If None, the one of the constructor is used.
+        """
+        self._run_parquet(
+            self.forecast,
+            path=path,
+            output_path=output_path,
+            chunk_rows=chunk_rows,
+            columns=columns,
+            executor=executor,
+            h=h,
+            level=level,
+            sort_df=sort_df,
+            prediction_intervals=prediction_intervals,
+        )
 
     def forecast_fitted_values(self):
         """Access insample predictions.
@@ -1097,11 +2188,20 @@ class _StatsForecast:
         cols = self.fcst_fitted_values_["cols"]
         if self.engine == pd.DataFrame:
             df = self.engine(
-                self.fcst_fitted_values_["values"], columns=cols, index=self.ds
+                self.fcst_fitted_values_["values"],
+                columns=cols,
+                index=self._fitted_index(),
             ).reset_index(level=1)
         elif self.engine == pl.DataFrame:
-            df = self.engine({"unique_id": self.og_unique_id, "ds": self.og_dates})
-            df[cols] = self.fcst_fitted_values_["values"]
+            df = self.engine(
+                {
+                    "unique_id": self._pl_unique_id(
+                        self._rows_codes(), self._input_uids()
+                    ),
+                    "ds": self._panel.rows()[1],
+                    **_columns_dict(self.fcst_fitted_values_["values"], cols),
+                }
+            )
         return df
 
     def cross_validation(
@@ -1114,9 +2214,10 @@ class _StatsForecast:
         input_size: Optional[int] = None,
         level: Optional[List[int]] = None,
         fitted: bool = False,
-        refit: bool = True,
+        refit: Union[bool, int] = True,
         sort_df: bool = True,
         prediction_intervals: Optional[ConformalIntervals] = None,
+        executor: Optional[str] = None,
     ):
         """Temporal Cross-Validation.
 
@@ -1131,10 +2232,16 @@ class _StatsForecast:
         ----------
         h : int
             Forecast horizon.
-        df : pandas.DataFrame | polars.DataFrame, optional (default=None)
+        df : pandas.DataFrame | polars.DataFrame | polars.LazyFrame, optional (default=None)
             DataFrame with columns [`unique_id`, `ds`, `y`] and exogenous.
             If None, the `StatsForecast` class should have been instantiated
             using `df`.
+            It can also be the directory of a panel written with `write_panel`
+            or a panel returned by `StatsForecast.prepare`.
+            A polars LazyFrame is collected once to a temporary parquet file, which is read
+            by chunks of series of about a million rows processed one after the other,
+            and a LazyFrame is returned.
+            If `sort_df` is False, the rows of each serie must be contiguous in the LazyFrame.
         n_windows : int (default=1)
             Number of windows used for cross validation.
         step_size : int (default=1)
@@ -1146,33 +2253,89 @@ class _StatsForecast:
         level : List[float], optional (default=None)
             Confidence levels between 0 and 100 for prediction intervals.
         fitted : bool (default=False)
-            Wether or not returns insample predictions.
-        refit : bool (default=True)
+            Wether or not returns insample predictions. Not supported for a LazyFrame.
+        refit : bool or int (default=True)
             Wether or not refit the model for each window.
+            If int, train the models every `refit` windows.
+            Between trainings the ETS, CES, Theta and ARIMA models only filter
+            the observations after the previous window, unless `input_size` is set.
         sort_df : bool (default=True)
             If True, sort `df` by `unique_id` and `ds`.
         prediction_intervals : ConformalIntervals, optional (default=None)
             Configuration to calibrate prediction intervals (Conformal Prediction).
+        executor : str, optional (default=None)
+            Kind of workers used when `n_jobs > 1`, either 'processes' or 'threads'.
+            If None, the one of the constructor is used.
 
         Returns
         -------
-        fcsts_df : pandas.DataFrame
+        fcsts_df : pandas.DataFrame | polars.DataFrame | polars.LazyFrame
             DataFrame with insample `models` columns for point predictions and probabilistic
             predictions for all fitted `models`.
         """
-        if test_size is None:
-            test_size = h + step_size * (n_windows - 1)
-        elif n_windows is None:
-            if (test_size - h) % step_size:
-                raise Exception("`test_size - h` should be module `step_size`")
-            n_windows = int((test_size - h) / step_size) + 1
-        elif (n_windows is None) and (test_size is None):
-            raise Exception("you must define `n_windows` or `test_size`")
-        else:
-            raise Exception("you must define `n_windows` or `test_size` but not both")
+        if isinstance(df, pl.LazyFrame):
+            return self._run_lazy(
+                self.cross_validation,
+                df=df,
+                fitted=fitted,
+                executor=executor,
+                h=h,
+                n_windows=n_windows,
+                step_size=step_size,
+                test_size=test_size,
+                input_size=input_size,
+                level=level,
+                refit=refit,
+                sort_df=sort_df,
+                prediction_intervals=prediction_intervals,
+            )
+        self._set_executor(executor)
+        n_windows, test_size = _cv_n_windows(h, n_windows, step_size, test_size, refit)
         self._set_prediction_intervals(prediction_intervals=prediction_intervals)
         self._prepare_fit(df, sort_df)
+        res_fcsts = self._run_cross_validation(
+            h=h,
+            n_windows=n_windows,
+            test_size=test_size,
+            step_size=step_size,
+            input_size=input_size,
+            level=level,
+            fitted=fitted,
+            refit=refit,
+        )
+        fcsts = res_fcsts["forecasts"]
+        cols = res_fcsts["cols"]
+        ds, cutoff = _cv_grid(
+            last_dates=self.last_dates,
+            freq=self.freq,
+            h=h,
+            test_size=test_size,
+            step_size=step_size,
+        )
+        unique_id = np.repeat(np.asarray(self.uids), h * n_windows)
+        data = {
+            "ds": ds,
+            "cutoff": cutoff,
+            **{col: fcsts[:, i] for i, col in enumerate(cols)},
+        }
+        if self.engine == pl.DataFrame:
+            if unique_id.dtype.kind == "O":
+                unique_id = unique_id.astype(str)
+            return pl.DataFrame({"unique_id": unique_id, **data})
+        return pd.DataFrame(data, index=pd.Index(unique_id, name="unique_id"))
+
+    def _run_cross_validation(
+        self, h, n_windows, test_size, step_size, input_size, level, fitted, refit
+    ):
         _, level = self._parse_X_level(h=h, X=None, level=level)
+        # with few series the windows of each serie are split across the jobs as well
+        window_bounds = _cv_window_bounds(
+            len(self.ga),
+            n_windows,
+            refit,
+            _get_n_jobs(len(self.ga) * n_windows, self._max_n_jobs),
+        )
+        self.n_jobs = _get_n_jobs(len(self.ga) * len(window_bounds), self._max_n_jobs)
         if self.n_jobs == 1:
             res_fcsts = self.ga.cross_validation(
                 models=self.models,
@@ -1195,27 +2358,167 @@ class _StatsForecast:
                 fitted=fitted,
                 level=level,
                 refit=refit,
+                window_bounds=window_bounds,
             )
 
         if fitted:
             self.cv_fitted_values_ = res_fcsts["fitted"]
             self.n_cv_ = n_windows
+        return res_fcsts
 
-        fcsts = res_fcsts["forecasts"]
-        cols = res_fcsts["cols"]
-        fcsts_df = _cv_dates(
-            last_dates=self.last_dates,
-            freq=self.freq,
+    def cross_validation_arrays(
+        self,
+        h: int,
+        y: np.ndarray,
+        indptr: np.ndarray,
+        X: Optional[np.ndarray] = None,
+        n_windows: int = 1,
+        step_size: int = 1,
+        test_size: Optional[int] = None,
+        input_size: Optional[int] = None,
+        level: Optional[List[int]] = None,
+        fitted: bool = False,
+        refit: Union[bool, int] = True,
+        prediction_intervals: Optional[ConformalIntervals] = None,
+        executor: Optional[str] = None,
+    ):
+        """Temporal Cross-Validation from numpy arrays.
+
+        Same as `StatsForecast.cross_validation` for a panel that is already stored as arrays,
+        without building any DataFrame. The values of the i-th serie are `y[indptr[i]:indptr[i + 1]]`,
+        sorted by time, and the rows of the outputs follow the order of the series, then of the windows.
+
+        Parameters
+        ----------
+        h : int
+            Forecast horizon.
+        y : numpy.ndarray
+            Values of all the series, one after the other.
+        indptr : numpy.ndarray
+            Offsets of the series in `y`, of size `n_series + 1`.
+        X : numpy.ndarray, optional (default=None)
+            Exogenous variables, with a row for each value of `y`.
+        n_windows : int (default=1)
+            Number of windows used for cross validation.
+        step_size : int (default=1)
+            Step size between each window.
+        test_size : int, optional (default=None)
+            Length of test size. If passed, set `n_windows=None`.
+        input_size : int, optional (default=None)
+            Input size for each window, if not none rolled windows.
+        level : List[float], optional (default=None)
+            Confidence levels between 0 and 100 for prediction intervals.
+        fitted : bool (default=False)
+            Wether or not returns insample predictions.
+        refit : bool or int (default=True)
+            Wether or not refit the model for each window.
+            If int, train the models every `refit` windows.
+        prediction_intervals : ConformalIntervals, optional (default=None)
+            Configuration to calibrate prediction intervals (Conformal Prediction).
+        executor : str, optional (default=None)
+            Kind of workers used when `n_jobs > 1`, either 'processes' or 'threads'.
+            If None, the one of the constructor is used.
+
+        Returns
+        -------
+        res : dict
+            `forecasts` array with `h` rows for each window of each serie, whose first column is `y`,
+            `cols` names of its columns and, if `fitted`, the insample `values` of the training rows
+            of each serie and window, one after the other, in `fitted` with their `spans`,
+            the [start, end) rows of each training set from the start of its serie.
+        """
+        self._set_executor(executor)
+        n_windows, test_size = _cv_n_windows(h, n_windows, step_size, test_size, refit)
+        self._set_prediction_intervals(prediction_intervals=prediction_intervals)
+        self._prepare_fit(_panel_from_arrays(y, indptr, X), sort_df=False)
+        return self._run_cross_validation(
             h=h,
+            n_windows=n_windows,
             test_size=test_size,
             step_size=step_size,
+            input_size=input_size,
+            level=level,
+            fitted=fitted,
+            refit=refit,
+        )
+
+    def cross_validation_parquet(
+        self,
+        h: int,
+        path: Union[str, os.PathLike],
+        output_path: Union[str, os.PathLike],
+        n_windows: int = 1,
+        step_size: int = 1,
+        test_size: Optional[int] = None,
+        input_size: Optional[int] = None,
+        level: Optional[List[int]] = None,
+        refit: Union[bool, int] = True,
+        chunk_rows: int = 1_000_000,
+        columns: Optional[List[str]] = None,
+        sort_df: bool = True,
+        prediction_intervals: Optional[ConformalIntervals] = None,
+        executor: Optional[str] = None,
+    ):
+        """Temporal Cross-Validation of a parquet dataset.
+
+        The dataset is read in chunks of about `chunk_rows` rows that don't split any serie,
+        each chunk is cross validated and its results are appended to the parquet file `output_path`,
+        so neither the dataset nor the results are held in memory.
+        The rows of each serie must be contiguous in the dataset.
+
+        Parameters
+        ----------
+        h : int
+            Forecast horizon.
+        path : str, os.PathLike or polars.LazyFrame
+            Parquet file or directory of a (hive partitioned) parquet dataset
+            with columns [`unique_id`, `ds`, `y`] and exogenous.
+            A polars LazyFrame is collected once to a temporary parquet file read by chunks,
+            if `sort_df` is False the rows of each serie must be contiguous in it.
+        output_path : str or os.PathLike
+            Parquet file where the results are written.
+        n_windows : int (default=1)
+            Number of windows used for cross validation.
+        step_size : int (default=1)
+            Step size between each window.
+        test_size : int, optional (default=None)
+            Length of test size. If passed, set `n_windows=None`.
+        input_size : int, optional (default=None)
+            Input size for each window, if not none rolled windows.
+        level : List[float], optional (default=None)
+            Confidence levels between 0 and 100 for prediction intervals.
+        refit : bool or int (default=True)
+            Wether or not refit the model for each window.
+            If int, train the models every `refit` windows.
+        chunk_rows : int (default=1_000_000)
+            Minimum number of rows of each chunk.
+        columns : List[str], optional (default=None)
+            Columns of the dataset that are read. If None, all of them are read.
+        sort_df : bool (default=True)
+            If True, sort each chunk by [`unique_id`,`ds`], a LazyFrame is sorted as a whole.
+        prediction_intervals : ConformalIntervals, optional (default=None)
+            Configuration to calibrate prediction intervals (Conformal Prediction).
+        executor : str, optional (default=None)
+            Kind of workers used when `n_jobs > 1`, either 'processes' or 'threads'.
+            If None, the one of the constructor is used.
+        """
+        self._run_parquet(
+            self.cross_validation,
+            path=path,
+            output_path=output_path,
+            chunk_rows=chunk_rows,
+            columns=columns,
+            executor=executor,
+            h=h,
+            n_windows=n_windows,
+            step_size=step_size,
+            test_size=test_size,
+            input_size=input_size,
+            level=level,
+            refit=refit,
+            sort_df=sort_df,
+            prediction_intervals=prediction_intervals,
         )
-        idx = pd.Index(np.repeat(self.uids, h * n_windows), name="unique_id")
-        fcsts_df.index = idx
-        fcsts_df[cols] = fcsts
-        if self.engine == pl.DataFrame:
-            fcsts_df = pl.from_pandas(fcsts_df, include_index=True)
-        return fcsts_df
 
     def cross_validation_fitted_values(self):
         """Access insample cross validated predictions.
@@ -1237,20 +2540,41 @@ class _StatsForecast:
         """
         if not hasattr(self, "cv_fitted_values_"):
             raise Exception("Please run `cross_validation` mehtod using `fitted=True`")
-        index = pd.MultiIndex.from_tuples(
-            np.tile(self.ds, self.n_cv_), names=["unique_id", "ds"]
-        )
-        df = pd.DataFrame(index=index)
-        df["cutoff"] = self.cv_fitted_values_["last_idxs"].flatten(order="F")
-        df[self.cv_fitted_values_["cols"]] = np.reshape(
-            self.cv_fitted_values_["values"], (-1, len(self.models) + 1), order="F"
-        )
-        idxs = self.cv_fitted_values_["idxs"].flatten(order="F")
-        df = df.iloc[idxs].reset_index(level=1)
-        df["cutoff"] = df["ds"].where(df["cutoff"]).bfill()
-
+        fitted = self.cv_fitted_values_
+        spans = fitted["spans"]
+        unique_id, ds = self._panel.rows()
         if self.engine == pl.DataFrame:
-            df = pl.from_pandas(df, include_index=True)
+            # the ids are gathered by serie at the end
+            unique_id = self._rows_codes()
+        # the columns are filled one window after the other,
+        # so that only the rows of a window are indexed at once
+        n_rows = int((spans[..., 1] - spans[..., 0]).sum())
+        out = {
+            "unique_id": np.empty(n_rows, dtype=unique_id.dtype),
+            "ds": np.empty(n_rows, dtype=ds.dtype),
+            "cutoff": np.empty(n_rows, dtype=ds.dtype),
+            **{
+                col: np.empty(n_rows, dtype=fitted["values"].dtype)
+                for col in fitted["cols"]
+            },
+        }
+        start = 0
+        for values_rows, rows, last_rows in _cv_fitted_windows(spans, self.ga.indptr):
+            window = slice(start, start + rows.size)
+            out["unique_id"][window] = unique_id[rows]
+            out["ds"][window] = ds[rows]
+            # the cutoff of each row is the datestamp of the last row of its training set
+            out["cutoff"][window] = ds[last_rows]
+            for i, col in enumerate(fitted["cols"]):
+                out[col][window] = fitted["values"][values_rows, i]
+            start = window.stop
+        unique_id = out.pop("unique_id")
+        if self.engine == pd.DataFrame:
+            df = self.engine(out, index=pd.Index(unique_id, name="unique_id"))
+        elif self.engine == pl.DataFrame:
+            df = self.engine(
+                {"unique_id": self._pl_unique_id(unique_id, self._input_uids()), **out}
+            )
         return df
 
     def _get_pool(self):
@@ -1259,21 +2583,113 @@ class _StatsForecast:
         pool_kwargs = dict()
         return Pool, pool_kwargs
 
+    def start_pool(self, start_method: Optional[str] = None):
+        """Start a pool of workers reused by all the parallel calls.
+
+        By default each `fit`, `predict`, `forecast` and `cross_validation` call
+        with `n_jobs > 1` starts and stops its own pool of processes. The pool
+        started here lives until `StatsForecast.close_pool` is called, its workers
+        import statsforecast and compile the numba kernels of `models` once.
+        The object can also be used as a context manager, which starts the pool
+        with the default start method and closes it when leaving the context.
+
+        Parameters
+        ----------
+        start_method : str, optional (default=None)
+            Start method of the workers: 'fork', 'spawn' or 'forkserver'.
+            If None, uses the default of the platform.
+
+        Returns
+        -------
+        self : StatsForecast
+            `StatsForecast` with the pool of workers started.
+        """
+        if self._pool is not None:
+            raise Exception("The pool is already running, call `close_pool` first.")
+        n_jobs = cpu_count() if self._max_n_jobs in (-1, None) else self._max_n_jobs
+        # the workers share the resource tracker of the main process,
+        # which owns the shared memory blocks
+        resource_tracker.ensure_running()
+        ctx = multiprocessing.get_context(start_method)
+        self._pool = ctx.Pool(
+            n_jobs,
+            initializer=_warm_worker,
+            initargs=(self.models, self.fallback_model),
+        )
+        return self
+
+    def close_pool(self):
+        """Stop the pool of workers started by `StatsForecast.start_pool`."""
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
+
+    def __enter__(self):
+        if self._pool is None:
+            self.start_pool()
+        return self
+
+    def __exit__(self, *args):
+        self.close_pool()
+
+    def __getstate__(self):
+        # the pool can't be pickled
+        state = self.__dict__.copy()
+        state["_pool"] = None
+        return state
+
+    def _set_executor(self, executor):
+        # kind of workers of the current call
+        executor = self.executor if executor is None else executor
+        if executor not in ["processes", "threads"]:
+            raise ValueError(
+                f"`executor` must be either 'processes' or 'threads', got {executor}"
+            )
+        self._threads = executor == "threads"
+
+    def _use_shared(self):
+        # the jobs map the files of panels on disk instead of receiving a copy,
+        # threads already share them.
+        return not self._threads and (
+            self.shared_memory or isinstance(self.ga.data, np.memmap)
+        )
+
+    @contextmanager
+    def _executor(self):
+        if self._threads:
+            with ThreadPool(self.n_jobs) as executor:
+                yield executor
+        elif self._pool is not None:
+            yield self._pool
+        else:
+            Pool, pool_kwargs = self._get_pool()
+            with Pool(self.n_jobs, **pool_kwargs) as executor:
+                yield executor
+
     def _fit_parallel(self):
-        gas = self.ga.split(self.n_jobs)
-        Pool, pool_kwargs = self._get_pool()
-        with Pool(self.n_jobs, **pool_kwargs) as executor:
+        if self._use_shared():
+            return self._fit_parallel_shared()
+        bounds = _chunk_bounds(self.ga.indptr, self.n_jobs)
+        gas, _ = self._get_gas_Xs(X=None, bounds=bounds)
+        with self._executor() as executor:
             futures = []
             for ga in gas:
                 future = executor.apply_async(ga.fit, (self.models,))
                 futures.append(future)
-            fm = np.vstack([f.get() for f in futures])
+            fm = np.vstack(_sort_chunks(bounds, [f.get() for f in futures]))
         return fm
 
-    def _get_gas_Xs(self, X):
-        gas = self.ga.split(self.n_jobs)
+    def _get_chunk(self, ga, start, end):
+        # threads use views of the series, processes receive copies
+        if self._threads:
+            return _grouped_array_view(ga.data, ga.indptr, start, end)
+        return ga[start:end]
+
+    def _get_gas_Xs(self, X, bounds):
+        gas = [self._get_chunk(self.ga, start, end) for start, end in bounds]
         if X is not None:
-            Xs = X.split(self.n_jobs)
+            Xs = [self._get_chunk(X, start, end) for start, end in bounds]
         else:
             from itertools import repeat
 
@@ -1282,11 +2698,11 @@ class _StatsForecast:
 
     def _predict_parallel(self, h, X, level):
         # create elements for each core
-        gas, Xs = self._get_gas_Xs(X=X)
-        fms = self.ga.split_fm(self.fitted_, self.n_jobs)
-        Pool, pool_kwargs = self._get_pool()
+        bounds = _chunk_bounds(self.ga.indptr, self.n_jobs)
+        gas, Xs = self._get_gas_Xs(X=X, bounds=bounds)
+        fms = [self.fitted_[start:end] for start, end in bounds]
         # compute parallel forecasts
-        with Pool(self.n_jobs, **pool_kwargs) as executor:
+        with self._executor() as executor:
             futures = []
             for ga, fm, X_ in zip(gas, fms, Xs):
                 future = executor.apply_async(
@@ -1299,7 +2715,7 @@ class _StatsForecast:
                     ),
                 )
                 futures.append(future)
-            out = [f.get() for f in futures]
+            out = _sort_chunks(bounds, [f.get() for f in futures])
             fcsts, cols = list(zip(*out))
             fcsts = np.vstack(fcsts)
             cols = cols[0]
@@ -1307,10 +2723,10 @@ class _StatsForecast:
 
     def _fit_predict_parallel(self, h, X, level):
         # create elements for each core
-        gas, Xs = self._get_gas_Xs(X=X)
-        Pool, pool_kwargs = self._get_pool()
+        bounds = _chunk_bounds(self.ga.indptr, self.n_jobs)
+        gas, Xs = self._get_gas_Xs(X=X, bounds=bounds)
         # compute parallel forecasts
-        with Pool(self.n_jobs, **pool_kwargs) as executor:
+        with self._executor() as executor:
             futures = []
             for ga, X_ in zip(gas, Xs):
                 future = executor.apply_async(
@@ -1323,7 +2739,7 @@ class _StatsForecast:
                     ),
                 )
                 futures.append(future)
-            out = [f.get() for f in futures]
+            out = _sort_chunks(bounds, [f.get() for f in futures])
             fm, fcsts, cols = list(zip(*out))
             fm = np.vstack(fm)
             fcsts = np.vstack(fcsts)
@@ -1331,12 +2747,14 @@ class _StatsForecast:
         return fm, fcsts, cols
 
     def _forecast_parallel(self, h, fitted, X, level):
+        if self._use_shared():
+            return self._forecast_parallel_shared(h=h, fitted=fitted, X=X, level=level)
         # create elements for each core
-        gas, Xs = self._get_gas_Xs(X=X)
-        Pool, pool_kwargs = self._get_pool()
+        bounds = _chunk_bounds(self.ga.indptr, self.n_jobs)
+        gas, Xs = self._get_gas_Xs(X=X, bounds=bounds)
         # compute parallel forecasts
         result = {}
-        with Pool(self.n_jobs, **pool_kwargs) as executor:
+        with self._executor() as executor:
             futures = []
             for ga, X_ in zip(gas, Xs):
                 future = executor.apply_async(
@@ -1351,7 +2769,7 @@ class _StatsForecast:
                     ),
                 )
                 futures.append(future)
-            out = [f.get() for f in futures]
+            out = _sort_chunks(bounds, [f.get() for f in futures])
             fcsts = [d["forecasts"] for d in out]
             fcsts = np.vstack(fcsts)
             cols = out[0]["cols"]
@@ -1364,24 +2782,77 @@ class _StatsForecast:
                 result["fitted"]["cols"] = out[0]["fitted"]["cols"]
         return result
 
+    def _forecast_chunks_parallel(self, h, X, level, bounds):
+        # at most two chunks per job are in flight, so the results
+        # waiting to be consumed don't grow with the number of series
+        with self._executor() as executor:
+            futures = deque()
+            for start, end in bounds:
+                X_ = None if X is None else self._get_chunk(X, start, end)
+                future = executor.apply_async(
+                    self._get_chunk(self.ga, start, end).forecast,
+                    (self.models, h, self.fallback_model, False, X_, level),
+                )
+                futures.append(future)
+                if len(futures) == 2 * self.n_jobs:
+                    yield futures.popleft().get()
+            while futures:
+                yield futures.popleft().get()
+
     def _cross_validation_parallel(
-        self, h, test_size, step_size, input_size, fitted, level, refit
+        self,
+        h,
+        test_size,
+        step_size,
+        input_size,
+        fitted,
+        level,
+        refit,
+        window_bounds=None,
     ):
+        if window_bounds is not None and len(window_bounds) > 1:
+            return self._cross_validation_parallel_windows(
+                h=h,
+                test_size=test_size,
+                step_size=step_size,
+                input_size=input_size,
+                fitted=fitted,
+                level=level,
+                refit=refit,
+                window_bounds=window_bounds,
+            )
+        if self._use_shared():
+            return self._cross_validation_parallel_shared(
+                h=h,
+                test_size=test_size,
+                step_size=step_size,
+                input_size=input_size,
+                fitted=fitted,
+                level=level,
+                refit=refit,
+            )
         # create elements for each core
-        gas = self.ga.split(self.n_jobs)
-        Pool, pool_kwargs = self._get_pool()
+        bounds = _chunk_bounds(self.ga.indptr, self.n_jobs)
+        gas, _ = self._get_gas_Xs(X=None, bounds=bounds)
         # compute parallel forecasts
         result = {}
-        with Pool(self.n_jobs, **pool_kwargs) as executor:
+        with self._executor() as executor:
             futures = []
             for ga in gas:
+                models, fallback_model = self.models, self.fallback_model
+                if self._threads and refit != 1:
+                    # the models are fitted in place without refit, each thread needs its own
+                    models = [model.new() for model in models]
+                    fallback_model = (
+                        None if fallback_model is None else fallback_model.new()
+                    )
                 future = executor.apply_async(
                     ga.cross_validation,
                     (
-                        self.models,
+                        models,
                         h,
                         test_size,
-                        self.fallback_model,
+                        fallback_model,
                         step_size,
                         input_size,
                         fitted,
@@ -1390,7 +2861,7 @@ class _StatsForecast:
                     ),
                 )
                 futures.append(future)
-            out = [f.get() for f in futures]
+            out = _sort_chunks(bounds, [f.get() for f in futures])
             fcsts = [d["forecasts"] for d in out]
             fcsts = np.vstack(fcsts)
             cols = out[0]["cols"]
@@ -1401,13 +2872,231 @@ class _StatsForecast:
                 result["fitted"]["values"] = np.concatenate(
                     [d["fitted"]["values"] for d in out]
                 )
-                for key in ["last_idxs", "idxs"]:
-                    result["fitted"][key] = np.concatenate(
-                        [d["fitted"][key] for d in out]
-                    )
+                result["fitted"]["spans"] = np.concatenate(
+                    [d["fitted"]["spans"] for d in out]
+                )
                 result["fitted"]["cols"] = out[0]["fitted"]["cols"]
         return result
 
+    def _cross_validation_parallel_windows(
+        self, h, test_size, step_size, input_size, fitted, level, refit, window_bounds
+    ):
+        # each job computes the windows [start, end) of a serie
+        n_windows = int((test_size - h) / step_size) + 1
+        indptr = self.ga.indptr
+        sizes = np.diff(indptr)
+        tasks = [
+            (i, start, end)
+            for i in range(self.ga.n_groups)
+            for start, end in window_bounds
+        ]
+        # the most expensive first
+        tasks.sort(
+            key=lambda t: -(sizes[t[0]] - (n_windows - t[2]) * step_size)
+            * (t[2] - t[1])
+        )
+        cuts, _ = self.ga._get_cols(
+            models=self.models, attr="forecast", h=h, X=None, level=level
+        )
+        out = np.full(
+            (self.ga.n_groups, n_windows, h, 1 + cuts[-1]), np.nan, dtype=np.float32
+        )
+        if fitted:
+            fitted_spans = _cv_fitted_spans(indptr, h, test_size, step_size, input_size)
+            fitted_offsets = _cv_fitted_offsets(fitted_spans)
+            fitted_vals = np.full(
+                (fitted_offsets[-1], len(self.models) + 1), np.nan, dtype=np.float32
+            )
+        use_shared = self._use_shared()
+        with _SharedArrays() as shared:
+            if use_shared:
+                specs = [shared.share(self.ga.data), shared.share(indptr)]
+            with self._executor() as executor:
+                futures = []
+                for i, start, end in tasks:
+                    models, fallback_model = self.models, self.fallback_model
+                    if self._threads and refit != 1:
+                        # the models are fitted in place without refit, each thread needs its own
+                        models = [model.new() for model in models]
+                        fallback_model = (
+                            None if fallback_model is None else fallback_model.new()
+                        )
+                    args = (
+                        models,
+                        h,
+                        (end - start - 1) * step_size + h,
+                        fallback_model,
+                        step_size,
+                        input_size,
+                        fitted,
+                        level,
+                        refit,
+                    )
+                    if use_shared:
+                        future = executor.apply_async(
+                            _run_on_shared,
+                            (
+                                _cross_validation_shared_windows,
+                                specs[:2],
+                                i,
+                                n_windows,
+                                end,
+                                step_size,
+                                *args,
+                            ),
+                        )
+                    else:
+                        ga = _cv_windows_serie(
+                            self.ga.data, indptr, i, n_windows, end, step_size
+                        )
+                        future = executor.apply_async(ga.cross_validation, args)
+                    futures.append(future)
+                for (i, start, end), future in zip(tasks, futures):
+                    res = future.get()
+                    out[i, start:end] = res["forecasts"].reshape(end - start, h, -1)
+                    if not fitted:
+                        continue
+                    # the windows of a serie are contiguous in the fitted values
+                    rows = slice(
+                        fitted_offsets[i * n_windows + start],
+                        fitted_offsets[i * n_windows + end],
+                    )
+                    fitted_vals[rows] = res["fitted"]["values"]
+        result = {"forecasts": out.reshape(-1, 1 + cuts[-1]), "cols": res["cols"]}
+        if fitted:
+            result["fitted"] = {
+                "values": fitted_vals,
+                "spans": fitted_spans,
+                "cols": res["fitted"]["cols"],
+            }
+        return result
+
+    def _fit_parallel_shared(self):
+        bounds = _chunk_bounds(self.ga.indptr, self.n_jobs)
+        with _SharedArrays() as shared:
+            specs = [shared.share(self.ga.data), shared.share(self.ga.indptr)]
+            with self._executor() as executor:
+                futures = [
+                    executor.apply_async(
+                        _run_on_shared,
+                        (_fit_shared_chunk, specs, start, end, self.models),
+                    )
+                    for start, end in bounds
+                ]
+                fm = np.vstack(_sort_chunks(bounds, [f.get() for f in futures]))
+        return fm
+
+    def _forecast_parallel_shared(self, h, fitted, X, level):
+        bounds = _chunk_bounds(self.ga.indptr, self.n_jobs)
+        cuts, _ = self.ga._get_cols(
+            models=self.models, attr="forecast", h=h, X=X, level=level
+        )
+        result = {}
+        with _SharedArrays() as shared:
+            specs = [shared.share(self.ga.data), shared.share(self.ga.indptr)]
+            if X is not None:
+                specs += [shared.share(X.data), shared.share(X.indptr)]
+            else:
+                specs += [None, None]
+            fcsts_spec = shared.full(
+                (self.ga.n_groups * h, cuts[-1]), np.nan, np.float32
+            )
+            fitted_spec = None
+            if fitted:
+                fitted_spec = shared.full(
+                    (self.ga.data.shape[0], 1 + cuts[-1]), np.nan, np.float32
+                )
+            specs += [fcsts_spec, fitted_spec]
+            with self._executor() as executor:
+                futures = [
+                    executor.apply_async(
+                        _run_on_shared,
+                        (
+                            _forecast_shared_chunk,
+                            specs,
+                            start,
+                            end,
+                            self.models,
+                            h,
+                            self.fallback_model,
+                            fitted,
+                            level,
+                        ),
+                    )
+                    for start, end in bounds
+                ]
+                cols, fitted_cols = [f.get() for f in futures][0]
+            result["forecasts"] = shared.read(fcsts_spec)
+            result["cols"] = cols
+            if fitted:
+                result["fitted"] = {
+                    "values": shared.read(fitted_spec),
+                    "cols": fitted_cols,
+                }
+        return result
+
+    def _cross_validation_parallel_shared(
+        self, h, test_size, step_size, input_size, fitted, level, refit
+    ):
+        if (test_size - h) % step_size:
+            raise Exception("`test_size - h` should be module `step_size`")
+        n_windows = int((test_size - h) / step_size) + 1
+        bounds = _chunk_bounds(self.ga.indptr, self.n_jobs)
+        cuts, _ = self.ga._get_cols(
+            models=self.models, attr="forecast", h=h, X=None, level=level
+        )
+        result = {}
+        with _SharedArrays() as shared:
+            specs = [shared.share(self.ga.data), shared.share(self.ga.indptr)]
+            fcsts_spec = shared.full(
+                (self.ga.n_groups * n_windows * h, 1 + cuts[-1]), np.nan, np.float32
+            )
+            fitted_specs = [None, None]
+            if fitted:
+                fitted_spans = _cv_fitted_spans(
+                    self.ga.indptr, h, test_size, step_size, input_size
+                )
+                fitted_offsets = _cv_fitted_offsets(fitted_spans)
+                fitted_specs = [
+                    shared.full(
+                        (fitted_offsets[-1], len(self.models) + 1), np.nan, np.float32
+                    ),
+                    shared.share(fitted_offsets),
+                ]
+            specs += [fcsts_spec, *fitted_specs]
+            with self._executor() as executor:
+                futures = [
+                    executor.apply_async(
+                        _run_on_shared,
+                        (
+                            _cross_validation_shared_chunk,
+                            specs,
+                            start,
+                            end,
+                            self.models,
+                            h,
+                            test_size,
+                            self.fallback_model,
+                            step_size,
+                            input_size,
+                            fitted,
+                            level,
+                            refit,
+                        ),
+                    )
+                    for start, end in bounds
+                ]
+                cols, fitted_cols = [f.get() for f in futures][0]
+            result["forecasts"] = shared.read(fcsts_spec)
+            result["cols"] = cols
+            if fitted:
+                result["fitted"] = {
+                    "values": shared.read(fitted_specs[0]),
+                    "spans": fitted_spans,
+                    "cols": fitted_cols,
+                }
+        return result
+
     @staticmethod
     def plot(
         df: Union[pd.DataFrame, pl.DataFrame],
@@ -1763,7 +3452,7 @@ class _StatsForecast:
     def __repr__(self):
         return f"StatsForecast(models=[{','.join(map(repr, self.models))}])"
 
-# %% ../nbs/src/core/core.ipynb 34
+# %% ../nbs/src/core/core.ipynb 47
 class ParallelBackend:
     def forecast(self, df, models, freq, fallback_model=None, **kwargs: Any) -> Any:
         model = _StatsForecast(
@@ -1784,7 +3473,7 @@ class ParallelBackend:
 def make_backend(obj: Any, *args: Any, **kwargs: Any) -> ParallelBackend:
     return ParallelBackend()
 
-# %% ../nbs/src/core/core.ipynb 35
+# %% ../nbs/src/core/core.ipynb 48
 class StatsForecast(_StatsForecast):
     """Train statistical models.
 
@@ -1811,6 +3500,8 @@ class StatsForecast(_StatsForecast):
         Number of jobs used in the parallel processing, use -1 for all cores.
     df : pandas.DataFrame | pl.DataFrame, optional (default=None)
         DataFrame with columns [`unique_id`, `ds`, `y`] and exogenous.
+        It can also be the directory of a panel written with `write_panel`
+        or a panel returned by `StatsForecast.prepare`.
     sort_df : bool (default=True)
         If True, sort `df` by [`unique_id`,`ds`].
     fallback_model : Any, optional (default=None)
@@ -1818,6 +3509,15 @@ class StatsForecast(_StatsForecast):
         Only works with the `forecast` and `cross_validation` methods.
     verbose : bool (default=True)
         Prints TQDM progress bar when `n_jobs=1`.
+    shared_memory : bool (default=False)
+        If True and `n_jobs > 1`, the series and the outputs of `fit`, `forecast` and
+        `cross_validation` are placed in shared memory so that each job only receives
+        the limits of its series instead of a pickled copy of them.
+    executor : str (default='processes')
+        Kind of workers used when `n_jobs > 1`, either 'processes' or 'threads'.
+        Threads share the series without copying them, but they only run in parallel
+        while the models are inside numba functions that release the GIL, which requires
+        setting the `NUMBA_RELEASE_GIL` environment variable to `true` before importing statsforecast.
     """
 
     def forecast(
@@ -1829,6 +3529,7 @@ class StatsForecast(_StatsForecast):
         fitted: bool = False,
         sort_df: bool = True,
         prediction_intervals: Optional[ConformalIntervals] = None,
+        executor: Optional[str] = None,
     ):
         if self._is_native(df=df):
             return super().forecast(
@@ -1839,6 +3540,7 @@ class StatsForecast(_StatsForecast):
                 fitted=fitted,
                 sort_df=sort_df,
                 prediction_intervals=prediction_intervals,
+                executor=executor,
             )
         assert df is not None
         engine = make_execution_engine(infer_by=[df])
@@ -1865,9 +3567,10 @@ class StatsForecast(_StatsForecast):
         input_size: Optional[int] = None,
         level: Optional[List[int]] = None,
         fitted: bool = False,
-        refit: bool = True,
+        refit: Union[bool, int] = True,
         sort_df: bool = True,
         prediction_intervals: Optional[ConformalIntervals] = None,
+        executor: Optional[str] = None,
     ):
         if self._is_native(df=df):
             return super().cross_validation(
@@ -1882,6 +3585,7 @@ class StatsForecast(_StatsForecast):
                 refit=refit,
                 sort_df=sort_df,
                 prediction_intervals=prediction_intervals,
+                executor=executor,
             )
         assert df is not None
         engine = make_execution_engine(infer_by=[df])
@@ -1905,5 +3609,16 @@ class StatsForecast(_StatsForecast):
     def _is_native(self, df) -> bool:
         engine = try_get_context_execution_engine()
         return engine is None and (
-            df is None or isinstance(df, pd.DataFrame) or isinstance(df, pl.DataFrame)
+            df is None
+            or isinstance(
+                df,
+                (
+                    pd.DataFrame,
+                    pl.DataFrame,
+                    pl.LazyFrame,
+                    str,
+                    os.PathLike,
+                    PreparedPanel,
+                ),
+            )
         )
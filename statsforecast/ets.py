@@ -1647,3 +1647,41 @@ def forecast_ets(obj, h, level=None):
 # %% ../nbs/src/ets.ipynb 45
 def forward_ets(fitted_model, y):
     return ets_f(y=y, m=fitted_model["m"], model=fitted_model)
+
+# %% ../nbs/src/ets.ipynb 46
+def update_ets(model, y):
+    # filters the new observations `y` starting from the last states of `model`
+    errortype, trendtype, seasontype = model["components"][:3]
+    damped = model["components"][3] != "N"
+    alpha, beta, gamma, phi = model["par"][:4]
+    _, e, states, _ = pegelsresid_C(
+        y=y,
+        m=model["m"],
+        init_state=model["states"][-1],
+        errortype=errortype,
+        trendtype=trendtype,
+        seasontype=seasontype,
+        damped=damped,
+        alpha=alpha,
+        beta=beta,
+        gamma=gamma,
+        phi=phi,
+        nmse=3,
+    )
+    if errortype == "A":
+        fits = y - e
+    else:
+        # protect e == -1
+        aux_e = np.copy(e)
+        aux_e[aux_e == -1.0] = -1 + 1e-3
+        fits = y / (1 + aux_e)
+    e = np.append(model["residuals"], e)
+    sq_e = e**2
+    sigma2 = sq_e[~np.isinf(sq_e)].sum() / (e.size - model["n_params"] - 1)
+    return {
+        **model,
+        "residuals": e,
+        "fitted": np.append(model["fitted"], fits),
+        "states": np.vstack([model["states"], states[1:]]),
+        "sigma2": sigma2,
+    }
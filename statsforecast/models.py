@@ -24,11 +24,12 @@ from statsforecast.arima import (
     forecast_arima,
     fitted_arima,
     forward_arima,
+    update_arima,
 )
-from .ces import auto_ces, forecast_ces, forward_ces
-from .ets import ets_f, forecast_ets, forward_ets
+from .ces import auto_ces, forecast_ces, forward_ces, update_ces
+from .ets import ets_f, forecast_ets, forward_ets, update_ets
 from .mstl import mstl
-from .theta import auto_theta, forecast_theta, forward_theta
+from .theta import auto_theta, forecast_theta, forward_theta, update_theta
 from .garch import garch_model, garch_forecast
 from statsforecast.utils import (
     _seasonal_naive,
@@ -97,6 +98,39 @@ def _get_conformal_method(method: str):
     return available_methods[method]
 
 # %% ../nbs/src/core/models.ipynb 11
+def _panel_levels(level):
+    # output keys and normal quantiles of the panel kernels. The order matches
+    # the dicts built by `_calculate_intervals` and `_add_fitted_pi`.
+    level = [] if level is None else list(level)
+    sorted_level = sorted(level)
+    keys = ["mean"] + [f"lo-{lv}" for lv in level] + [f"hi-{lv}" for lv in level]
+    fitted_keys = (
+        ["fitted"]
+        + [f"fitted-lo-{lv}" for lv in reversed(sorted_level)]
+        + [f"fitted-hi-{lv}" for lv in sorted_level]
+    )
+    z = _quantiles(np.asarray(level, dtype=np.float64))
+    z_fitted_lo = _quantiles(np.asarray(sorted_level[::-1], dtype=np.float64))
+    z_fitted_hi = _quantiles(np.asarray(sorted_level, dtype=np.float64))
+    return keys, fitted_keys, (z, z_fitted_lo, z_fitted_hi)
+
+
+@njit
+def _fill_levels(out, row, mean, sigmah, z_lo, z_hi):
+    n_levels = z_lo.size
+    for j in range(n_levels):
+        out[row, 1 + j] = mean - z_lo[j] * sigmah
+        out[row, 1 + n_levels + j] = mean + z_hi[j] * sigmah
+
+
+@njit
+def _panel_sigma(ssr, n):
+    # same as `_calculate_sigma` without numba's ZeroDivisionError
+    if n == 0:
+        return np.nan if ssr == 0 else np.inf
+    return np.sqrt(ssr / n)
+
+# %% ../nbs/src/core/models.ipynb 12
 class _TS:
     def new(self):
         b = type(self).__new__(type(self))
@@ -130,7 +164,7 @@ class _TS:
     def _conformal_method(self):
         return _get_conformal_method(self.prediction_intervals.method)
 
-# %% ../nbs/src/core/models.ipynb 16
+# %% ../nbs/src/core/models.ipynb 17
 class AutoARIMA(_TS):
     """AutoARIMA model.
 
@@ -139,6 +173,10 @@ class AutoARIMA(_TS):
 
     **Note:**<br>
     This implementation is a mirror of Hyndman's [forecast::auto.arima](https://github.com/robjhyndman/forecast).
+    Unlike versions up to 1.5.0, the likelihoods are maximized with their exact gradients instead of
+    finite differences. The fits usually reach higher likelihoods, but the stepwise search can then
+    follow another path, so the orders selected for some series differ from those versions,
+    sometimes with a higher information criterion.
 
     **References:**<br>
     [Rob J. Hyndman, Yeasmin Khandakar (2008). "Automatic Time Series Forecasting: The forecast package for R"](https://www.jstatsoft.org/article/view/v027i03).
@@ -207,6 +245,7 @@ class AutoARIMA(_TS):
         Use adjusted back-transformed mean Box-Cox.
     parallel : bool
         If True and stepwise=False, then parallel search.
+        If True and stepwise=True, the neighbors of the best model are fitted in parallel.
     num_cores : int
         Amount of parallel processes to be used if parallel=True.
     season_length : int
@@ -545,8 +584,32 @@ class AutoARIMA(_TS):
         """
         if not hasattr(self, "model_"):
             raise Exception("You have to use the `fit` method first")
-        with np.errstate(invalid="ignore"):
-            mod = forward_arima(self.model_, y=y, xreg=X, method=self.method)
+        res, _ = self._forward_update(
+            None, y=y, h=h, X=X, X_future=X_future, level=level, fitted=fitted
+        )
+        return res
+
+    def _forward_update(
+        self,
+        mod: Optional[Dict[str, Any]],
+        y: np.ndarray,
+        h: int,
+        X: Optional[np.ndarray] = None,
+        X_future: Optional[np.ndarray] = None,
+        level: Optional[List[int]] = None,
+        fitted: bool = False,
+    ):
+        """Apply the fitted model to `y` only filtering the observations that come after
+        the states `mod` returned by a previous call, or all of them if `mod` is None.
+        Returns the forecasts and the new states."""
+        if mod is None or self.method == "CSS":
+            # the state isn't filtered by the CSS method
+            with np.errstate(invalid="ignore"):
+                mod = forward_arima(self.model_, y=y, xreg=X, method=self.method)
+        else:
+            n = mod["x"].size
+            with np.errstate(invalid="ignore"):
+                mod = update_arima(mod, y=y[n:], xreg=None if X is None else X[n:])
         fcst = forecast_arima(mod, h, xreg=X_future, level=level)
         res = {"mean": fcst["mean"]}
         if fitted:
@@ -566,9 +629,9 @@ class AutoARIMA(_TS):
                 # add prediction intervals for fitted values
                 se = np.sqrt(mod["sigma2"])
                 res = _add_fitted_pi(res=res, se=se, level=level)
-        return res
+        return res, mod
 
-# %% ../nbs/src/core/models.ipynb 31
+# %% ../nbs/src/core/models.ipynb 32
 class AutoETS(_TS):
     """Automatic Exponential Smoothing model.
 
@@ -784,7 +847,28 @@ class AutoETS(_TS):
         """
         if not hasattr(self, "model_"):
             raise Exception("You have to use the `fit` method first")
-        mod = forward_ets(self.model_, y=y)
+        res, _ = self._forward_update(
+            None, y=y, h=h, X=X, X_future=X_future, level=level, fitted=fitted
+        )
+        return res
+
+    def _forward_update(
+        self,
+        mod: Optional[Dict[str, Any]],
+        y: np.ndarray,
+        h: int,
+        X: Optional[np.ndarray] = None,
+        X_future: Optional[np.ndarray] = None,
+        level: Optional[List[int]] = None,
+        fitted: bool = False,
+    ):
+        """Apply the fitted model to `y` only filtering the observations that come after
+        the states `mod` returned by a previous call, or all of them if `mod` is None.
+        Returns the forecasts and the new states."""
+        if mod is None:
+            mod = forward_ets(self.model_, y=y)
+        else:
+            mod = update_ets(mod, y=y[mod["residuals"].size :])
         fcst = forecast_ets(mod, h=h, level=level)
         keys = ["mean"]
         if fitted:
@@ -801,9 +885,9 @@ class AutoETS(_TS):
                 # add prediction intervals for fitted values
                 se = _calculate_sigma(y - mod["fitted"], len(y) - mod["n_params"])
                 res = _add_fitted_pi(res=res, se=se, level=level)
-        return res
+        return res, mod
 
-# %% ../nbs/src/core/models.ipynb 44
+# %% ../nbs/src/core/models.ipynb 45
 class ETS(AutoETS):
     @classmethod
     def _warn(cls):
@@ -829,7 +913,7 @@ class ETS(AutoETS):
     def __repr__(self):
         return self.alias
 
-# %% ../nbs/src/core/models.ipynb 49
+# %% ../nbs/src/core/models.ipynb 50
 class AutoCES(_TS):
     """Complex Exponential Smoothing model.
 
@@ -1050,7 +1134,28 @@ class AutoCES(_TS):
         """
         if not hasattr(self, "model_"):
             raise Exception("You have to use the `fit` method first")
-        mod = forward_ces(self.model_, y=y)
+        res, _ = self._forward_update(
+            None, y=y, h=h, X=X, X_future=X_future, level=level, fitted=fitted
+        )
+        return res
+
+    def _forward_update(
+        self,
+        mod: Optional[Dict[str, Any]],
+        y: np.ndarray,
+        h: int,
+        X: Optional[np.ndarray] = None,
+        X_future: Optional[np.ndarray] = None,
+        level: Optional[List[int]] = None,
+        fitted: bool = False,
+    ):
+        """Apply the fitted model to `y` only filtering the observations that come after
+        the states `mod` returned by a previous call, or all of them if `mod` is None.
+        Returns the forecasts and the new states."""
+        if mod is None:
+            mod = forward_ces(self.model_, y=y)
+        else:
+            mod = update_ces(mod, y=y[mod["n"] :])
         fcst = forecast_ces(mod, h, level=level)
         keys = ["mean"]
         if fitted:
@@ -1071,9 +1176,9 @@ class AutoCES(_TS):
                 # add prediction intervals for fitted values
                 se = _calculate_sigma(y - mod["fitted"], len(y))
                 res = _add_fitted_pi(res=res, se=se, level=level)
-        return res
+        return res, mod
 
-# %% ../nbs/src/core/models.ipynb 66
+# %% ../nbs/src/core/models.ipynb 67
 class AutoTheta(_TS):
     """AutoTheta model.
 
@@ -1281,7 +1386,28 @@ class AutoTheta(_TS):
         """
         if not hasattr(self, "model_"):
             raise Exception("You have to use the `fit` method first")
-        mod = forward_theta(self.model_, y=y)
+        res, _ = self._forward_update(
+            None, y=y, h=h, X=X, X_future=X_future, level=level, fitted=fitted
+        )
+        return res
+
+    def _forward_update(
+        self,
+        mod: Optional[Dict[str, Any]],
+        y: np.ndarray,
+        h: int,
+        X: Optional[np.ndarray] = None,
+        X_future: Optional[np.ndarray] = None,
+        level: Optional[List[int]] = None,
+        fitted: bool = False,
+    ):
+        """Apply the fitted model to `y` only filtering the observations that come after
+        the states `mod` returned by a previous call, or all of them if `mod` is None.
+        Returns the forecasts and the new states."""
+        if mod is None:
+            mod = forward_theta(self.model_, y=y)
+        else:
+            mod = update_theta(mod, y=y[mod["n"] :])
         res = forecast_theta(mod, h, level=level)
         if self.prediction_intervals is not None and level is not None:
             res = self._conformal_method(fcst=res, cs=self._cs, level=level)
@@ -1291,9 +1417,9 @@ class AutoTheta(_TS):
             # add prediction intervals for fitted values
             se = np.std(mod["residuals"][3:], ddof=1)
             res = _add_fitted_pi(res=res, se=se, level=level)
-        return res
+        return res, mod
 
-# %% ../nbs/src/core/models.ipynb 82
+# %% ../nbs/src/core/models.ipynb 83
 class ARIMA(_TS):
     """ARIMA model.
 
@@ -1572,8 +1698,32 @@ class ARIMA(_TS):
         """
         if not hasattr(self, "model_"):
             raise Exception("You have to use the `fit` method first")
-        with np.errstate(invalid="ignore"):
-            mod = forward_arima(self.model_, y=y, xreg=X, method=self.method)
+        res, _ = self._forward_update(
+            None, y=y, h=h, X=X, X_future=X_future, level=level, fitted=fitted
+        )
+        return res
+
+    def _forward_update(
+        self,
+        mod: Optional[Dict[str, Any]],
+        y: np.ndarray,
+        h: int,
+        X: Optional[np.ndarray] = None,
+        X_future: Optional[np.ndarray] = None,
+        level: Optional[List[int]] = None,
+        fitted: bool = False,
+    ):
+        """Apply the fitted model to `y` only filtering the observations that come after
+        the states `mod` returned by a previous call, or all of them if `mod` is None.
+        Returns the forecasts and the new states."""
+        if mod is None or self.method == "CSS":
+            # the state isn't filtered by the CSS method
+            with np.errstate(invalid="ignore"):
+                mod = forward_arima(self.model_, y=y, xreg=X, method=self.method)
+        else:
+            n = mod["x"].size
+            with np.errstate(invalid="ignore"):
+                mod = update_arima(mod, y=y[n:], xreg=None if X is None else X[n:])
         fcst = forecast_arima(mod, h, xreg=X_future, level=level)
         res = {"mean": fcst["mean"]}
         if fitted:
@@ -1593,9 +1743,9 @@ class ARIMA(_TS):
                 # add prediction intervals for fitted values
                 se = np.sqrt(mod["sigma2"])
                 res = _add_fitted_pi(res=res, se=se, level=level)
-        return res
+        return res, mod
 
-# %% ../nbs/src/core/models.ipynb 97
+# %% ../nbs/src/core/models.ipynb 98
 class AutoRegressive(ARIMA):
     """Simple Autoregressive model.
 
@@ -1670,7 +1820,7 @@ class AutoRegressive(ARIMA):
     def __repr__(self):
         return self.alias
 
-# %% ../nbs/src/core/models.ipynb 112
+# %% ../nbs/src/core/models.ipynb 113
 @njit
 def _ses_fcst_mse(x: np.ndarray, alpha: float) -> Tuple[float, float, np.ndarray]:
     """Perform simple exponential smoothing on a series.
@@ -1756,7 +1906,7 @@ def _chunk_sums(array: np.ndarray, chunk_size: int) -> np.ndarray:
         sums[i] = array[start : start + chunk_size].sum()
     return sums
 
-# %% ../nbs/src/core/models.ipynb 113
+# %% ../nbs/src/core/models.ipynb 114
 @njit
 def _ses(
     y: np.ndarray,  # time series
@@ -1771,7 +1921,7 @@ def _ses(
         fcst["fitted"] = fitted_vals
     return fcst
 
-# %% ../nbs/src/core/models.ipynb 114
+# %% ../nbs/src/core/models.ipynb 115
 class SimpleExponentialSmoothing(_TS):
     """SimpleExponentialSmoothing model.
 
@@ -1902,7 +2052,7 @@ class SimpleExponentialSmoothing(_TS):
         out = _ses(y=y, h=h, fitted=fitted, alpha=self.alpha)
         return out
 
-# %% ../nbs/src/core/models.ipynb 124
+# %% ../nbs/src/core/models.ipynb 125
 def _ses_optimized(
     y: np.ndarray,  # time series
     h: int,  # forecasting horizon
@@ -1915,7 +2065,7 @@ def _ses_optimized(
         fcst["fitted"] = fitted_vals
     return fcst
 
-# %% ../nbs/src/core/models.ipynb 125
+# %% ../nbs/src/core/models.ipynb 126
 class SimpleExponentialSmoothingOptimized(_TS):
     """SimpleExponentialSmoothing model.
 
@@ -2042,7 +2192,7 @@ class SimpleExponentialSmoothingOptimized(_TS):
         out = _ses_optimized(y=y, h=h, fitted=fitted)
         return out
 
-# %% ../nbs/src/core/models.ipynb 135
+# %% ../nbs/src/core/models.ipynb 136
 @njit
 def _seasonal_exponential_smoothing(
     y: np.ndarray,  # time series
@@ -2067,7 +2217,7 @@ def _seasonal_exponential_smoothing(
         fcst["fitted"] = fitted_vals
     return fcst
 
-# %% ../nbs/src/core/models.ipynb 136
+# %% ../nbs/src/core/models.ipynb 137
 class SeasonalExponentialSmoothing(_TS):
     """SeasonalExponentialSmoothing model.
 
@@ -2215,7 +2365,7 @@ class SeasonalExponentialSmoothing(_TS):
         )
         return out
 
-# %% ../nbs/src/core/models.ipynb 149
+# %% ../nbs/src/core/models.ipynb 150
 def _seasonal_ses_optimized(
     y: np.ndarray,  # time series
     h: int,  # forecasting horizon
@@ -2238,7 +2388,7 @@ def _seasonal_ses_optimized(
         fcst["fitted"] = fitted_vals
     return fcst
 
-# %% ../nbs/src/core/models.ipynb 150
+# %% ../nbs/src/core/models.ipynb 151
 class SeasonalExponentialSmoothingOptimized(_TS):
     def __init__(self, season_length: int, alias: str = "SeasESOpt"):
         """SeasonalExponentialSmoothingOptimized model.
@@ -2382,7 +2532,7 @@ class SeasonalExponentialSmoothingOptimized(_TS):
         )
         return out
 
-# %% ../nbs/src/core/models.ipynb 161
+# %% ../nbs/src/core/models.ipynb 162
 class Holt(AutoETS):
     """Holt's method.
 
@@ -2414,7 +2564,7 @@ class Holt(AutoETS):
     def __repr__(self):
         return self.alias
 
-# %% ../nbs/src/core/models.ipynb 173
+# %% ../nbs/src/core/models.ipynb 174
 class HoltWinters(AutoETS):
     """Holt-Winters' method.
 
@@ -2449,7 +2599,7 @@ class HoltWinters(AutoETS):
     def __repr__(self):
         return self.alias
 
-# %% ../nbs/src/core/models.ipynb 186
+# %% ../nbs/src/core/models.ipynb 187
 @njit
 def _historic_average(
     y: np.ndarray,  # time series
@@ -2465,7 +2615,30 @@ def _historic_average(
         fcst["fitted"] = fitted_vals
     return fcst
 
-# %% ../nbs/src/core/models.ipynb 187
+
+@njit
+def _historic_average_panel(
+    y, indptr, h, fitted, z, z_fitted_lo, z_fitted_hi, out, fitted_out
+):
+    for i in range(indptr.size - 1):
+        start, end = indptr[i], indptr[i + 1]
+        n = end - start
+        mean = np.float32(y[start:end].mean())
+        ssr = 0.0
+        for t in range(start, end):
+            res = y[t] - mean
+            if not np.isnan(res):
+                ssr += res * res
+        sigmah = _panel_sigma(ssr, n - 1) * np.sqrt(1 + (1 / n))
+        for k in range(h):
+            out[i * h + k, 0] = mean
+            _fill_levels(out, i * h + k, mean, sigmah, z, z)
+        if fitted:
+            for t in range(start, end):
+                fitted_out[t, 0] = mean
+                _fill_levels(fitted_out, t, mean, sigmah, z_fitted_lo, z_fitted_hi)
+
+# %% ../nbs/src/core/models.ipynb 188
 class HistoricAverage(_TS):
     def __init__(self, alias: str = "HistoricAverage"):
         """HistoricAverage model.
@@ -2622,7 +2795,36 @@ class HistoricAverage(_TS):
 
         return res
 
-# %% ../nbs/src/core/models.ipynb 198
+    def _forecast_panel(self, y, indptr, h, out, fitted_out, level=None, fitted=False):
+        """HistoricAverage forecasts for all the series delimited by `indptr`."""
+        keys, fitted_keys, z = _panel_levels(level)
+        _historic_average_panel(y, indptr, h, fitted, *z, out, fitted_out)
+        return keys, fitted_keys
+
+# %% ../nbs/src/core/models.ipynb 199
+@njit
+def _naive_panel(y, indptr, h, fitted, z, z_fitted_lo, z_fitted_hi, out, fitted_out):
+    for i in range(indptr.size - 1):
+        start, end = indptr[i], indptr[i + 1]
+        mean = np.float32(y[end - 1])
+        ssr = 0.0
+        for t in range(start + 1, end):
+            res = y[t] - np.float32(y[t - 1])
+            if not np.isnan(res):
+                ssr += res * res
+        sigma = _panel_sigma(ssr, end - start - 1)
+        for k in range(h):
+            out[i * h + k, 0] = mean
+            _fill_levels(out, i * h + k, mean, sigma * np.sqrt(k + 1), z, z)
+        if fitted:
+            fitted_out[start, 0] = np.nan
+            _fill_levels(fitted_out, start, np.nan, sigma, z_fitted_lo, z_fitted_hi)
+            for t in range(start + 1, end):
+                fitted_val = np.float32(y[t - 1])
+                fitted_out[t, 0] = fitted_val
+                _fill_levels(fitted_out, t, fitted_val, sigma, z_fitted_lo, z_fitted_hi)
+
+# %% ../nbs/src/core/models.ipynb 200
 class Naive(_TS):
     def __init__(self, alias: str = "Naive"):
         """Naive model.
@@ -2777,7 +2979,13 @@ class Naive(_TS):
 
         return res
 
-# %% ../nbs/src/core/models.ipynb 211
+    def _forecast_panel(self, y, indptr, h, out, fitted_out, level=None, fitted=False):
+        """Naive forecasts for all the series delimited by `indptr`."""
+        keys, fitted_keys, z = _panel_levels(level)
+        _naive_panel(y, indptr, h, fitted, *z, out, fitted_out)
+        return keys, fitted_keys
+
+# %% ../nbs/src/core/models.ipynb 213
 @njit
 def _random_walk_with_drift(
     y: np.ndarray,  # time series
@@ -2797,7 +3005,35 @@ def _random_walk_with_drift(
         fcst["fitted"] = fitted_vals
     return fcst
 
-# %% ../nbs/src/core/models.ipynb 212
+
+@njit
+def _random_walk_with_drift_panel(
+    y, indptr, h, fitted, z, z_fitted_lo, z_fitted_hi, out, fitted_out
+):
+    for i in range(indptr.size - 1):
+        start, end = indptr[i], indptr[i + 1]
+        n = end - start
+        slope = (y[end - 1] - y[start]) / (n - 1)
+        ssr = 0.0
+        for t in range(start + 1, end):
+            res = y[t] - np.float32(slope + y[t - 1])
+            if not np.isnan(res):
+                ssr += res * res
+        sigma = _panel_sigma(ssr, n - 1)
+        for k in range(h):
+            mean = np.float32(slope * (1 + k) + y[end - 1])
+            sigmah = sigma * np.sqrt((k + 1) * (1 + (k + 1) / (n - 1)))
+            out[i * h + k, 0] = mean
+            _fill_levels(out, i * h + k, mean, sigmah, z, z)
+        if fitted:
+            fitted_out[start, 0] = np.nan
+            _fill_levels(fitted_out, start, np.nan, sigma, z_fitted_lo, z_fitted_hi)
+            for t in range(start + 1, end):
+                fitted_val = np.float32(slope + y[t - 1])
+                fitted_out[t, 0] = fitted_val
+                _fill_levels(fitted_out, t, fitted_val, sigma, z_fitted_lo, z_fitted_hi)
+
+# %% ../nbs/src/core/models.ipynb 214
 class RandomWalkWithDrift(_TS):
     def __init__(self, alias: str = "RWD"):
         """RandomWalkWithDrift model.
@@ -2954,7 +3190,50 @@ class RandomWalkWithDrift(_TS):
 
         return res
 
-# %% ../nbs/src/core/models.ipynb 225
+    def _forecast_panel(self, y, indptr, h, out, fitted_out, level=None, fitted=False):
+        """RandomWalkWithDrift forecasts for all the series delimited by `indptr`."""
+        keys, fitted_keys, z = _panel_levels(level)
+        _random_walk_with_drift_panel(y, indptr, h, fitted, *z, out, fitted_out)
+        return keys, fitted_keys
+
+# %% ../nbs/src/core/models.ipynb 227
+@njit
+def _seasonal_naive_panel(
+    y, indptr, h, fitted, season_length, z, z_fitted_lo, z_fitted_hi, out, fitted_out
+):
+    for i in range(indptr.size - 1):
+        start, end = indptr[i], indptr[i + 1]
+        n = end - start
+        if n < season_length:
+            if fitted or z.size:
+                # the single series version doesn't return fitted values here
+                raise ValueError("series shorter than season_length")
+            for k in range(h):
+                out[i * h + k, 0] = np.nan
+            continue
+        # first fitted value of each season, see `_seasonal_naive`
+        first_fitted = start + n % season_length + season_length
+        ssr = 0.0
+        for t in range(first_fitted, end):
+            res = y[t] - np.float32(y[t - season_length])
+            if not np.isnan(res):
+                ssr += res * res
+        sigma = _panel_sigma(ssr, n - season_length)
+        sigmah = sigma * np.sqrt(np.floor((h - 1) / season_length) + 1)
+        for k in range(h):
+            mean = np.float32(y[end - season_length + k % season_length])
+            out[i * h + k, 0] = mean
+            _fill_levels(out, i * h + k, mean, sigmah, z, z)
+        if fitted:
+            for t in range(start, end):
+                if t < first_fitted:
+                    fitted_val = np.float32(np.nan)
+                else:
+                    fitted_val = np.float32(y[t - season_length])
+                fitted_out[t, 0] = fitted_val
+                _fill_levels(fitted_out, t, fitted_val, sigma, z_fitted_lo, z_fitted_hi)
+
+# %% ../nbs/src/core/models.ipynb 228
 class SeasonalNaive(_TS):
     def __init__(self, season_length: int, alias: str = "SeasonalNaive"):
         """Seasonal naive model.
@@ -3122,7 +3401,15 @@ class SeasonalNaive(_TS):
 
         return res
 
-# %% ../nbs/src/core/models.ipynb 238
+    def _forecast_panel(self, y, indptr, h, out, fitted_out, level=None, fitted=False):
+        """SeasonalNaive forecasts for all the series delimited by `indptr`."""
+        keys, fitted_keys, z = _panel_levels(level)
+        _seasonal_naive_panel(
+            y, indptr, h, fitted, self.season_length, *z, out, fitted_out
+        )
+        return keys, fitted_keys
+
+# %% ../nbs/src/core/models.ipynb 241
 @njit
 def _window_average(
     y: np.ndarray,  # time series
@@ -3138,7 +3425,19 @@ def _window_average(
     mean = _repeat_val(val=wavg, h=h)
     return {"mean": mean}
 
-# %% ../nbs/src/core/models.ipynb 239
+
+@njit
+def _window_average_panel(y, indptr, h, window_size, out):
+    for i in range(indptr.size - 1):
+        start, end = indptr[i], indptr[i + 1]
+        if end - start < window_size:
+            mean = np.float32(np.nan)
+        else:
+            mean = np.float32(y[end - window_size : end].mean())
+        for k in range(h):
+            out[i * h + k, 0] = mean
+
+# %% ../nbs/src/core/models.ipynb 242
 class WindowAverage(_TS):
     def __init__(self, window_size: int, alias: str = "WindowAverage"):
         """WindowAverage model.
@@ -3263,7 +3562,13 @@ class WindowAverage(_TS):
         out = _window_average(y=y, h=h, fitted=fitted, window_size=self.window_size)
         return out
 
-# %% ../nbs/src/core/models.ipynb 249
+    def _forecast_panel(self, y, indptr, h, out, fitted_out, level=None):
+        """WindowAverage forecasts for all the series delimited by `indptr`."""
+        # it doesn't take `fitted` since the model has no fitted values
+        _window_average_panel(y, indptr, h, self.window_size, out)
+        return ["mean"], []
+
+# %% ../nbs/src/core/models.ipynb 252
 @njit
 def _seasonal_window_average(
     y: np.ndarray,
@@ -3284,7 +3589,23 @@ def _seasonal_window_average(
     out = _repeat_val_seas(season_vals=season_avgs, h=h, season_length=season_length)
     return {"mean": out}
 
-# %% ../nbs/src/core/models.ipynb 250
+
+@njit
+def _seasonal_window_average_panel(y, indptr, h, season_length, window_size, out):
+    min_samples = season_length * window_size
+    season_avgs = np.empty(season_length, np.float32)
+    for i in range(indptr.size - 1):
+        start, end = indptr[i], indptr[i + 1]
+        if end - start < min_samples:
+            season_avgs[:] = np.nan
+        else:
+            season_avgs[:] = 0
+            for j, value in enumerate(y[end - min_samples : end]):
+                season_avgs[j % season_length] += value / window_size
+        for k in range(h):
+            out[i * h + k, 0] = season_avgs[k % season_length]
+
+# %% ../nbs/src/core/models.ipynb 253
 class SeasonalWindowAverage(_TS):
     def __init__(self, season_length: int, window_size: int, alias: str = "SeasWA"):
         """SeasonalWindowAverage model.
@@ -3424,7 +3745,15 @@ class SeasonalWindowAverage(_TS):
         )
         return out
 
-# %% ../nbs/src/core/models.ipynb 261
+    def _forecast_panel(self, y, indptr, h, out, fitted_out, level=None):
+        """SeasonalWindowAverage forecasts for all the series delimited by `indptr`."""
+        # it doesn't take `fitted` since the model has no fitted values
+        _seasonal_window_average_panel(
+            y, indptr, h, self.season_length, self.window_size, out
+        )
+        return ["mean"], []
+
+# %% ../nbs/src/core/models.ipynb 265
 def _adida(
     y: np.ndarray,  # time series
     h: int,  # forecasting horizon
@@ -3445,7 +3774,7 @@ def _adida(
     mean = _repeat_val(val=forecast, h=h)
     return {"mean": mean}
 
-# %% ../nbs/src/core/models.ipynb 262
+# %% ../nbs/src/core/models.ipynb 266
 class ADIDA(_TS):
     def __init__(self, alias: str = "ADIDA"):
         """ADIDA model.
@@ -3566,7 +3895,7 @@ class ADIDA(_TS):
         out = _adida(y=y, h=h, fitted=fitted)
         return out
 
-# %% ../nbs/src/core/models.ipynb 273
+# %% ../nbs/src/core/models.ipynb 277
 @njit
 def _croston_classic(
     y: np.ndarray,  # time series
@@ -3588,7 +3917,7 @@ def _croston_classic(
     mean = _repeat_val(val=mean, h=h)
     return {"mean": mean}
 
-# %% ../nbs/src/core/models.ipynb 274
+# %% ../nbs/src/core/models.ipynb 278
 class CrostonClassic(_TS):
     def __init__(self, alias: str = "CrostonClassic"):
         """CrostonClassic model.
@@ -3708,7 +4037,7 @@ class CrostonClassic(_TS):
         out = _croston_classic(y=y, h=h, fitted=fitted)
         return out
 
-# %% ../nbs/src/core/models.ipynb 284
+# %% ../nbs/src/core/models.ipynb 288
 def _croston_optimized(
     y: np.ndarray,  # time series
     h: int,  # forecasting horizon
@@ -3729,7 +4058,7 @@ def _croston_optimized(
     mean = _repeat_val(val=mean, h=h)
     return {"mean": mean}
 
-# %% ../nbs/src/core/models.ipynb 285
+# %% ../nbs/src/core/models.ipynb 289
 class CrostonOptimized(_TS):
     def __init__(self, alias: str = "CrostonOptimized"):
         """CrostonOptimized model.
@@ -3850,7 +4179,7 @@ class CrostonOptimized(_TS):
         out = _croston_optimized(y=y, h=h, fitted=fitted)
         return out
 
-# %% ../nbs/src/core/models.ipynb 295
+# %% ../nbs/src/core/models.ipynb 299
 @njit
 def _croston_sba(
     y: np.ndarray,  # time series
@@ -3863,7 +4192,7 @@ def _croston_sba(
     mean["mean"] *= 0.95
     return mean
 
-# %% ../nbs/src/core/models.ipynb 296
+# %% ../nbs/src/core/models.ipynb 300
 class CrostonSBA(_TS):
     def __init__(self, alias: str = "CrostonSBA"):
         """CrostonSBA model.
@@ -3984,7 +4313,7 @@ class CrostonSBA(_TS):
         out = _croston_sba(y=y, h=h, fitted=fitted)
         return out
 
-# %% ../nbs/src/core/models.ipynb 306
+# %% ../nbs/src/core/models.ipynb 310
 def _imapa(
     y: np.ndarray,  # time series
     h: int,  # forecasting horizon
@@ -4008,7 +4337,7 @@ def _imapa(
     mean = _repeat_val(val=forecast, h=h)
     return {"mean": mean}
 
-# %% ../nbs/src/core/models.ipynb 307
+# %% ../nbs/src/core/models.ipynb 311
 class IMAPA(_TS):
     def __init__(self, alias: str = "IMAPA"):
         """IMAPA model.
@@ -4125,7 +4454,7 @@ class IMAPA(_TS):
         out = _imapa(y=y, h=h, fitted=fitted)
         return out
 
-# %% ../nbs/src/core/models.ipynb 317
+# %% ../nbs/src/core/models.ipynb 321
 @njit
 def _tsb(
     y: np.ndarray,  # time series
@@ -4146,7 +4475,7 @@ def _tsb(
     mean = _repeat_val(val=forecast, h=h)
     return {"mean": mean}
 
-# %% ../nbs/src/core/models.ipynb 318
+# %% ../nbs/src/core/models.ipynb 322
 class TSB(_TS):
     def __init__(self, alpha_d: float, alpha_p: float, alias: str = "TSB"):
         """TSB model.
@@ -4281,7 +4610,7 @@ class TSB(_TS):
         out = _tsb(y=y, h=h, fitted=fitted, alpha_d=self.alpha_d, alpha_p=self.alpha_p)
         return out
 
-# %% ../nbs/src/core/models.ipynb 329
+# %% ../nbs/src/core/models.ipynb 333
 def _predict_mstl_seas(mstl_ob, h, season_length):
     seasoncolumns = mstl_ob.filter(regex="seasonal*").columns
     nseasons = len(seasoncolumns)
@@ -4298,7 +4627,7 @@ def _predict_mstl_seas(mstl_ob, h, season_length):
     lastseas = seascomp.sum(axis=1)
     return lastseas
 
-# %% ../nbs/src/core/models.ipynb 330
+# %% ../nbs/src/core/models.ipynb 334
 class MSTL(_TS):
     """MSTL model.
 
@@ -4539,7 +4868,7 @@ class MSTL(_TS):
         }
         return res
 
-# %% ../nbs/src/core/models.ipynb 343
+# %% ../nbs/src/core/models.ipynb 347
 class Theta(AutoTheta):
     """Standard Theta Method.
 
@@ -4575,7 +4904,7 @@ class Theta(AutoTheta):
             prediction_intervals=prediction_intervals,
         )
 
-# %% ../nbs/src/core/models.ipynb 356
+# %% ../nbs/src/core/models.ipynb 360
 class OptimizedTheta(AutoTheta):
     """Optimized Theta Method.
 
@@ -4611,7 +4940,7 @@ class OptimizedTheta(AutoTheta):
             prediction_intervals=prediction_intervals,
         )
 
-# %% ../nbs/src/core/models.ipynb 369
+# %% ../nbs/src/core/models.ipynb 373
 class DynamicTheta(AutoTheta):
     """Dynamic Standard Theta Method.
 
@@ -4647,7 +4976,7 @@ class DynamicTheta(AutoTheta):
             prediction_intervals=prediction_intervals,
         )
 
-# %% ../nbs/src/core/models.ipynb 382
+# %% ../nbs/src/core/models.ipynb 386
 class DynamicOptimizedTheta(AutoTheta):
     """Dynamic Optimized Theta Method.
 
@@ -4683,7 +5012,7 @@ class DynamicOptimizedTheta(AutoTheta):
             prediction_intervals=prediction_intervals,
         )
 
-# %% ../nbs/src/core/models.ipynb 396
+# %% ../nbs/src/core/models.ipynb 400
 class GARCH(_TS):
     """Generalized Autoregressive Conditional Heteroskedasticity (GARCH) model.
 
@@ -4853,7 +5182,7 @@ class GARCH(_TS):
                 res = _add_fitted_pi(res=res, se=se, level=level)
         return res
 
-# %% ../nbs/src/core/models.ipynb 408
+# %% ../nbs/src/core/models.ipynb 412
 class ARCH(GARCH):
     """Autoregressive Conditional Heteroskedasticity (ARCH) model.
 
@@ -4890,7 +5219,7 @@ class ARCH(GARCH):
     def __repr__(self):
         return self.alias
 
-# %% ../nbs/src/core/models.ipynb 418
+# %% ../nbs/src/core/models.ipynb 422
 class ConstantModel(_TS):
     def __init__(self, constant: float, alias: str = "ConstantModel"):
         """Constant Model.
@@ -5027,7 +5356,7 @@ class ConstantModel(_TS):
         res = {"mean": mean}
 
         if fitted:
-            fitted_vals = np.full(self.n_y, self.constant, dtype=np.float32)
+            fitted_vals = np.full(len(y), self.constant, dtype=np.float32)
             res["fitted"] = fitted_vals
 
         if level is not None:
@@ -5039,7 +5368,20 @@ class ConstantModel(_TS):
                     res[f"fitted-hi-{lv}"] = fitted_vals
         return res
 
-# %% ../nbs/src/core/models.ipynb 429
+    def _forecast_panel(self, y, indptr, h, out, fitted_out, level=None, fitted=False):
+        """Constant forecasts for all the series delimited by `indptr`."""
+        # every output column holds the constant, only the keys are needed
+        keys = ["mean"]
+        fitted_keys = ["fitted"]
+        for lv in [] if level is None else sorted(level):
+            keys += [f"lo-{lv}", f"hi-{lv}"]
+            fitted_keys += [f"fitted-lo-{lv}", f"fitted-hi-{lv}"]
+        out[:] = np.float32(self.constant)
+        if fitted:
+            fitted_out[:] = np.float32(self.constant)
+        return keys, fitted_keys
+
+# %% ../nbs/src/core/models.ipynb 434
 class ZeroModel(ConstantModel):
     def __init__(self, alias: str = "ZeroModel"):
         """Returns Zero forecasts.
@@ -5053,7 +5395,7 @@ class ZeroModel(ConstantModel):
         """
         super().__init__(constant=0, alias=alias)
 
-# %% ../nbs/src/core/models.ipynb 440
+# %% ../nbs/src/core/models.ipynb 445
 class NaNModel(ConstantModel):
     def __init__(self, alias: str = "NaNModel"):
         """NaN Model.
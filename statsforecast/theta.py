@@ -177,7 +177,24 @@ def thetaforecast(states, n, modeltype, f, h, alpha, theta):
     )
     return new_states
 
-# %% ../nbs/src/theta.ipynb 16
+# %% ../nbs/src/theta.ipynb 12
+@njit(nogil=NOGIL, cache=CACHE)
+def thetafilter(y, states, n, modeltype, alpha, theta, e):
+    # filters `y` starting from the states of the `n` previous observations
+    for i in range(n, n + len(y)):
+        thetaupdate(
+            states=states,
+            i=i,
+            modeltype=modeltype,
+            alpha=alpha,
+            theta=theta,
+            y=y[i - n],
+            usemu=0,
+        )
+        # mu is the one step forecast
+        e[i - n] = y[i - n] - states[i, 4]
+
+# %% ../nbs/src/theta.ipynb 17
 @njit(nogil=NOGIL, cache=CACHE)
 def initparamtheta(
     initial_smoothed: float, alpha: float, theta: float, y: np.ndarray, modeltype: str
@@ -220,12 +237,12 @@ def initparamtheta(
         "optimize_theta": optimize_theta,
     }
 
-# %% ../nbs/src/theta.ipynb 18
+# %% ../nbs/src/theta.ipynb 19
 @njit(nogil=NOGIL, cache=CACHE)
 def switch_theta(x: str):
     return {"STM": 0, "OTM": 1, "DSTM": 2, "DOTM": 3}[x]
 
-# %% ../nbs/src/theta.ipynb 20
+# %% ../nbs/src/theta.ipynb 21
 @njit(nogil=NOGIL, cache=CACHE)
 def pegelsresid_theta(
     y: np.ndarray,
@@ -254,7 +271,7 @@ def pegelsresid_theta(
             mse = np.nan
     return amse, e, states, mse
 
-# %% ../nbs/src/theta.ipynb 21
+# %% ../nbs/src/theta.ipynb 22
 @njit(nogil=NOGIL, cache=CACHE)
 def theta_target_fn(
     optimal_param,
@@ -309,7 +326,7 @@ def theta_target_fn(
         mse = -np.inf
     return mse
 
-# %% ../nbs/src/theta.ipynb 22
+# %% ../nbs/src/theta.ipynb 23
 def optimize_theta_target_fn(init_par, optimize_params, y, modeltype, nmse):
     x0 = [init_par[key] for key, val in optimize_params.items() if val]
     x0 = np.array(x0, dtype=np.float32)
@@ -346,12 +363,12 @@ def optimize_theta_target_fn(init_par, optimize_params, y, modeltype, nmse):
     )
     return res
 
-# %% ../nbs/src/theta.ipynb 23
+# %% ../nbs/src/theta.ipynb 24
 @njit(nogil=NOGIL, cache=CACHE)
 def is_constant(x):
     return np.all(x[0] == x)
 
-# %% ../nbs/src/theta.ipynb 25
+# %% ../nbs/src/theta.ipynb 26
 def thetamodel(
     y: np.ndarray,
     m: int,
@@ -408,7 +425,7 @@ def thetamodel(
         mean_y=np.mean(y),
     )
 
-# %% ../nbs/src/theta.ipynb 27
+# %% ../nbs/src/theta.ipynb 28
 def compute_pi_samples(
     n, h, states, sigma, alpha, theta, mean_y, seed=0, n_samples=200
 ):
@@ -427,7 +444,7 @@ def compute_pi_samples(
         A = mean_y - B * (i + 2) / 2
     return samples
 
-# %% ../nbs/src/theta.ipynb 28
+# %% ../nbs/src/theta.ipynb 29
 def forecast_theta(obj, h, level=None):
     forecast = np.full(h, fill_value=np.nan)
     n = obj["n"]
@@ -474,7 +491,7 @@ def forecast_theta(obj, h, level=None):
                 res[key] = res[key] + seas_forecast
     return res
 
-# %% ../nbs/src/theta.ipynb 30
+# %% ../nbs/src/theta.ipynb 31
 def auto_theta(
     y,
     m,
@@ -574,7 +591,7 @@ def auto_theta(
         model["seas_forecast"] = dict(seas_forecast)
     return model
 
-# %% ../nbs/src/theta.ipynb 39
+# %% ../nbs/src/theta.ipynb 40
 def forward_theta(fitted_model, y):
     m = fitted_model["m"]
     model = fitted_model["modeltype"]
@@ -589,3 +606,47 @@ def forward_theta(fitted_model, y):
         alpha=alpha,
         theta=theta,
     )
+
+# %% ../nbs/src/theta.ipynb 42
+def update_theta(model, y):
+    # filters the new observations `y` starting from the last states of `model`
+    n = model["n"]
+    decompose = model.get("decompose", False)
+    if decompose:
+        seas = _repeat_val_seas(
+            model["seas_forecast"]["mean"], h=len(y), season_length=model["m"]
+        )
+        if model["decomposition_type"] == "multiplicative":
+            y = y / seas
+        else:
+            y = y - seas
+    states = np.zeros((n + len(y), 5), dtype=np.float32)
+    states[:n] = model["states"]
+    e = np.full_like(y, fill_value=np.nan)
+    thetafilter(
+        y=y,
+        states=states,
+        n=n,
+        modeltype=switch_theta(model["modeltype"]),
+        alpha=model["par"]["alpha"],
+        theta=model["par"]["theta"],
+        e=e,
+    )
+    updated = {
+        **model,
+        "states": states,
+        "n": n + len(y),
+        "mean_y": (n * model["mean_y"] + np.sum(y)) / (n + len(y)),
+    }
+    if decompose:
+        if model["decomposition_type"] == "multiplicative":
+            e = e * seas
+        else:
+            e = e + seas
+        seas_forecast = model["seas_forecast"]["mean"]
+        updated["seas_forecast"] = {
+            **model["seas_forecast"],
+            "mean": np.roll(seas_forecast, -len(y) % seas_forecast.size),
+        }
+    updated["residuals"] = np.append(model["residuals"], e)
+    return updated